@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Compare per-image OCR latency of the EasyOCR and ONNX Runtime backends.
+
+Each backend runs in a fresh spawned process on the CPU with the same
+thread plan, so neither inherits the other's thread pools or models. The
+first ONNX run exports the models, which is excluded by a warm-up call.
+Needs easyocr, and onnxruntime for the ONNX backend.
+
+Usage:
+    python benchmarks/bench_backends.py --count 20 --backends easyocr onnx
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import time
+from pathlib import Path
+
+src_dir = Path(__file__).resolve().parent.parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from bench_batch import make_frames  # noqa: E402
+
+from text_detector.config import AppSettings  # noqa: E402
+from text_detector.cpu_threads import apply_library_threads, plan_threads  # noqa: E402
+from text_detector.ocr_engine import OCREngine  # noqa: E402
+
+
+def _run(backend: str, args: argparse.Namespace) -> list[float]:
+    """Time ``args.count`` OCR calls with ``backend`` in this process."""
+    settings = AppSettings(
+        ocr_backend=backend,
+        preprocess_enabled=False,
+        result_cache_size=0,
+    )
+    apply_library_threads(plan_threads(settings))
+    frames = make_frames(args.count)
+    engine = OCREngine(settings, start_workers=False)
+    engine.detect_text(frames[0], [args.lang])
+
+    timings = []
+    for frame in frames:
+        start = time.perf_counter()
+        engine.detect_text(frame, [args.lang])
+        timings.append(time.perf_counter() - start)
+    engine.shutdown()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20, help="frames per backend")
+    parser.add_argument("--backends", nargs="+", default=["easyocr", "onnx"])
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    for backend in args.backends:
+        with ctx.Pool(1) as pool:
+            timings = pool.apply(_run, (backend, args))
+        ms = sorted(t * 1000 for t in timings)
+        p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+        print(
+            f"{backend:<10} mean {statistics.mean(ms):8.1f} ms"
+            f"  p50 {statistics.median(ms):8.1f} ms  p95 {p95:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
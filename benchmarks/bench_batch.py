@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Compare per-image OCR cost of detect_text against detect_text_batch.
+
+Renders synthetic text frames with OpenCV and times a real EasyOCR
+reader, so easyocr must be installed. The model is loaded and warmed up
+before any timing starts.
+
+Usage:
+    python benchmarks/bench_batch.py --count 32 --sizes 1 2 4 8 16
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+src_dir = Path(__file__).resolve().parent.parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from text_detector.config import AppSettings  # noqa: E402
+from text_detector.ocr_engine import OCREngine  # noqa: E402
+
+
+def make_frames(count: int, width: int = 640, height: int = 480) -> list[np.ndarray]:
+    """Render ``count`` frames, each with a few lines of distinct text."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(count):
+        frame = np.full((height, width, 3), 255, dtype=np.uint8)
+        for line in range(3):
+            y = 80 + line * 120
+            x = int(rng.integers(10, 120))
+            cv2.putText(
+                frame, f"Sample {i}-{line}", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 1.4, (0, 0, 0), 3
+            )
+        frames.append(frame)
+    return frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=32, help="frames per run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args()
+
+    frames = make_frames(args.count)
+    settings = AppSettings(preprocess_enabled=False)
+    engine = OCREngine(settings, start_workers=False)
+    engine.detect_text(frames[0], [args.lang])
+
+    start = time.perf_counter()
+    for frame in frames:
+        engine.detect_text(frame, [args.lang])
+    sequential = (time.perf_counter() - start) / len(frames)
+    print(f"detect_text          {sequential * 1000:8.1f} ms/image")
+
+    for size in args.sizes:
+        settings.ocr_batch_size = size
+        start = time.perf_counter()
+        engine.detect_text_batch(frames, [args.lang])
+        per_image = (time.perf_counter() - start) / len(frames)
+        print(f"batch size {size:<3d}       {per_image * 1000:8.1f} ms/image")
+
+    engine.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""Reproducible micro and end-to-end benchmarks for the OCR pipeline.
+
+Times the image_processor helpers on synthetic text frames at 480p, 1080p
+and 4K (rendered with cv2.putText from a fixed seed), the webcam display
+tick with the memory it allocates, the frame hand-off to a worker
+process, and OCREngine throughput with a deterministic stand-in reader,
+so no OCR model or easyocr install is needed. Results
+are written as JSON together with machine metadata. Given a baseline
+JSON, every case whose median got slower by more than ``--threshold`` is
+reported as a regression and the exit status is 1.
+
+Usage:
+    python benchmarks/bench_suite.py --output bench.json
+    python benchmarks/bench_suite.py --baseline bench.json --output new.json
+    python benchmarks/bench_suite.py --compare bench.json new.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+
+src_dir = Path(__file__).resolve().parent.parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from text_detector.config import AppSettings  # noqa: E402
+from text_detector.frame_pool import FramePool, ScratchBuffers  # noqa: E402
+from text_detector.image_processor import (  # noqa: E402
+    bgr_to_rgb,
+    compute_avg_color,
+    draw_boxes_with_colors,
+    preprocess_for_ocr,
+    resize_frame_for_ocr,
+    scale_detections,
+)
+from text_detector.ocr_engine import OCREngine  # noqa: E402
+from text_detector.shared_frames import FrameReader, FrameSlot  # noqa: E402
+
+RESOLUTIONS = {"480p": (854, 480), "1080p": (1920, 1080), "4k": (3840, 2160)}
+SEED = 1234
+LINES_PER_FRAME = 12
+SCHEMA_VERSION = 1
+
+Detection = tuple[list[list[float]], str, float]
+
+
+def make_text_frame(
+    width: int, height: int, seed: int = SEED
+) -> tuple[np.ndarray, list[Detection]]:
+    """Render a frame of text lines and return it with their bounding boxes.
+
+    Font size scales with the frame height, so every resolution shows the
+    same layout. The boxes stand in for OCR detections.
+    """
+    rng = np.random.default_rng(seed)
+    frame = np.full((height, width, 3), 235, dtype=np.uint8)
+    scale = height / 480
+    detections: list[Detection] = []
+    for line in range(LINES_PER_FRAME):
+        text = f"Line {line} code {int(rng.integers(1000, 9999))}"
+        x = int(rng.integers(0, width // 4))
+        y = int((line + 1) * height / (LINES_PER_FRAME + 1))
+        (w, h), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8 * scale, 2)
+        cv2.putText(frame, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8 * scale, (20, 20, 20), 2)
+        box = [[x, y - h], [x + w, y - h], [x + w, y], [x, y]]
+        detections.append(([[float(a), float(b)] for a, b in box], text, 0.9))
+    return frame, detections
+
+
+class StandInReader:
+    """Deterministic reader replacing EasyOCR for engine benchmarks.
+
+    Sleeps for a fixed service time, standing in for model inference, and
+    returns the same boxes for every call, so the engine's own overhead
+    (queueing, resizing, preprocessing, filtering) is what varies.
+    """
+
+    def __init__(self, detections: list[Detection], service_time: float) -> None:
+        self._detections = detections
+        self._service_time = service_time
+
+    def readtext(self, image: np.ndarray, **_kwargs: Any) -> list[Detection]:
+        time.sleep(self._service_time)
+        return list(self._detections)
+
+
+def time_case(func: Callable[[], object], repeat: int, warmup: int = 2) -> dict[str, float]:
+    """Run ``func`` ``repeat`` times after ``warmup`` calls and summarize in milliseconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "runs": repeat,
+    }
+
+
+def measure_allocations(func: Callable[[], object], frame_bytes: int, ticks: int = 10) -> dict:
+    """Return the memory newly allocated at peak during a call, in KiB and in frames.
+
+    Uses tracemalloc, which sees numpy's (and so OpenCV's) array buffers.
+    Buffers reused from earlier calls cost nothing, so a pipeline that
+    allocates no frame-sized array per call scores about 0 frames.
+    """
+    func()
+    tracemalloc.start()
+    peaks = []
+    try:
+        for _ in range(ticks):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    peak = statistics.median(peaks)
+    return {"alloc_kb": round(peak / 1024, 1), "alloc_frames": round(peak / frame_bytes, 2)}
+
+
+class ReplayCapture:
+    """Stand-in for cv2.VideoCapture returning the same frame on every read.
+
+    Like OpenCV, it reads into ``image`` when given one of the right shape
+    and allocates a new array otherwise.
+    """
+
+    def __init__(self, frame: np.ndarray) -> None:
+        self._frame = frame
+
+    def read(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        if image is None or image.shape != self._frame.shape:
+            return True, self._frame.copy()
+        np.copyto(image, self._frame)
+        return True, image
+
+
+def display_cases(
+    frame: np.ndarray, detections: list[Detection]
+) -> dict[str, Callable[[], object]]:
+    """Return one webcam tick (capture, annotate, convert for Tk) as the GUI ran it and runs it.
+
+    ``display_tick.alloc`` reads a fresh array, copies it before drawing
+    and allocates the RGB image. ``display_tick.pooled`` reads into the
+    frame pool and draws and converts into scratch buffers.
+    """
+    capture = ReplayCapture(frame)
+    pool, scratch = FramePool(), ScratchBuffers()
+    # The GUI keeps the last frame as current_frame until the next one arrives.
+    state: dict[str, np.ndarray | None] = {"current": None}
+
+    def allocating() -> None:
+        _, state["current"] = capture.read()
+        annotated = draw_boxes_with_colors(state["current"].copy(), detections)
+        bgr_to_rgb(annotated)
+
+    def pooled() -> None:
+        _, current = capture.read(image=pool.acquire())
+        pool.adopt(current)
+        previous, state["current"] = state["current"], current
+        if previous is not None:
+            pool.release(previous)
+        annotated = scratch.get("annotated", current.shape, current.dtype)
+        draw_boxes_with_colors(current, detections, out=annotated)
+        bgr_to_rgb(annotated, out=scratch.get("rgb", current.shape, current.dtype))
+
+    return {"display_tick.alloc": allocating, "display_tick.pooled": pooled}
+
+
+def _engine(workers: int, reader: StandInReader) -> OCREngine:
+    settings = AppSettings(
+        ocr_workers=workers,
+        preload_models=False,
+        result_cache_size=0,
+        ocr_hang_timeout_ms=0,
+    )
+    engine = OCREngine(settings)
+    # Bypass model loading; every worker shares the thread-safe stand-in.
+    engine._get_reader = lambda languages, times=None: reader  # type: ignore[method-assign]
+    return engine
+
+
+def bench_engine(
+    frame: np.ndarray, detections: list[Detection], args: argparse.Namespace
+) -> dict[str, dict[str, float]]:
+    """Time detect_text per frame and pool throughput with the stand-in reader."""
+    reader = StandInReader(detections, args.service_ms / 1000)
+    results = {}
+
+    engine = _engine(1, reader)
+    results["OCREngine.detect_text"] = time_case(lambda: engine.detect_text(frame), args.repeat)
+    engine.shutdown()
+
+    engine = _engine(args.workers, reader)
+
+    def pool_run() -> None:
+        futures = [engine.submit(frame, block=True) for _ in range(args.pool_frames)]
+        for future in futures:
+            future.result()
+
+    case = time_case(pool_run, max(3, args.repeat // 5), warmup=1)
+    case["frames_per_s"] = round(args.pool_frames / (case["median_ms"] / 1000), 2)
+    results[f"OCREngine.pool[{args.workers}w]"] = case
+    engine.shutdown()
+    return results
+
+
+def _transfer_echo(conn: Connection) -> None:
+    """Child side of the transfer benchmark: touch each frame and answer with a byte."""
+    reader = FrameReader()
+    while (message := conn.recv()) is not None:
+        kind, payload = message
+        frame = reader.read(payload) if kind == "shm" else payload
+        conn.send(int(frame[-1, -1, -1]))
+        del frame
+    reader.close()
+
+
+def bench_transfer(frame: np.ndarray, repeat: int) -> dict[str, dict[str, float]]:
+    """Time a frame round trip to a worker process, pickled through a pipe or in shared memory.
+
+    The pipe path is what process workers used before shared-memory slots.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    conn, child_conn = ctx.Pipe()
+    process = ctx.Process(target=_transfer_echo, args=(child_conn,), daemon=True)
+    process.start()
+    child_conn.close()
+    slot = FrameSlot()
+
+    def round_trip(kind: str) -> None:
+        conn.send((kind, slot.write(frame) if kind == "shm" else frame))
+        conn.recv()
+
+    try:
+        return {
+            "frame_transfer.pipe": time_case(lambda: round_trip("pipe"), repeat),
+            "frame_transfer.shm": time_case(lambda: round_trip("shm"), repeat),
+        }
+    finally:
+        conn.send(None)
+        process.join(timeout=10.0)
+        slot.release()
+
+
+def image_cases(
+    frame: np.ndarray, detections: list[Detection], ocr_width: int
+) -> dict[str, Callable[[], object]]:
+    """Return the image_processor calls to time on one frame.
+
+    Preprocessing and rescaling run on the OCR-sized frame and boxes, as
+    they do inside the engine.
+    """
+    ocr_frame, scale = resize_frame_for_ocr(frame, ocr_width)
+    ocr_boxes = scale_detections(detections, scale)
+    return {
+        "resize_frame_for_ocr": lambda: resize_frame_for_ocr(frame, ocr_width),
+        "preprocess_for_ocr": lambda: preprocess_for_ocr(ocr_frame),
+        "scale_detections": lambda: scale_detections(ocr_boxes, 1.0 / scale),
+        "draw_boxes_with_colors": lambda: draw_boxes_with_colors(frame, detections),
+        "compute_avg_color": lambda: [compute_avg_color(frame, d[0]) for d in detections],
+        "bgr_to_rgb": lambda: bgr_to_rgb(frame),
+    }
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Run every case at every requested resolution."""
+    results: dict[str, dict[str, float]] = {}
+    for name in args.resolutions:
+        width, height = RESOLUTIONS[name]
+        frame, detections = make_text_frame(width, height)
+        cases = image_cases(frame, detections, args.ocr_width)
+        timings = {case: time_case(func, args.repeat) for case, func in cases.items()}
+        for case, func in display_cases(frame, detections).items():
+            allocations = measure_allocations(func, frame.nbytes)
+            timings[case] = {**time_case(func, args.repeat), **allocations}
+        timings.update(bench_transfer(frame, args.repeat))
+        timings.update(bench_engine(frame, detections, args))
+        for case, timing in timings.items():
+            results[f"{case}[{name}]"] = timing
+            print(f"{case + '[' + name + ']':<36} {timing['median_ms']:10.3f} ms")
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def machine_metadata() -> dict[str, Any]:
+    """Describe the machine and library versions the results were taken on."""
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "opencv_threads": cv2.getNumThreads(),
+        "git_commit": _git_commit(),
+    }
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Print median changes per case and return the cases that regressed.
+
+    A case regresses when its median is more than ``threshold`` (a
+    fraction) slower than in the baseline. Cases missing from either run
+    are listed but never count as regressions.
+    """
+    regressions = []
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in baseline or name not in current:
+            print(f"{name:<36} {'only in ' + ('current' if name in current else 'baseline')}")
+            continue
+        old, new = baseline[name]["median_ms"], current[name]["median_ms"]
+        change = (new - old) / old if old > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<36} {old:10.3f} -> {new:10.3f} ms  {change:+7.1%}{flag}")
+    return regressions
+
+
+def _load(path: Path) -> dict[str, Any]:
+    data: dict[str, Any] = json.loads(path.read_text())
+    if data.get("schema") != SCHEMA_VERSION:
+        raise SystemExit(f"{path}: unsupported benchmark schema {data.get('schema')!r}")
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="flag regressions against this JSON")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two saved results without running anything",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="allowed median slowdown (0.15 = 15%%)"
+    )
+    parser.add_argument(
+        "--resolutions", nargs="+", choices=list(RESOLUTIONS), default=list(RESOLUTIONS)
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--ocr-width", type=int, default=AppSettings().ocr_max_width)
+    parser.add_argument("--workers", type=int, default=2, help="engine pool workers")
+    parser.add_argument("--pool-frames", type=int, default=8, help="frames per pool run")
+    parser.add_argument(
+        "--service-ms", type=float, default=5.0, help="stand-in reader time per call"
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (_load(path) for path in args.compare)
+        regressions = compare(baseline["results"], current["results"], args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "metadata": machine_metadata(),
+        "config": {
+            "repeat": args.repeat,
+            "ocr_width": args.ocr_width,
+            "workers": args.workers,
+            "pool_frames": args.pool_frames,
+            "service_ms": args.service_ms,
+            "seed": SEED,
+        },
+        "results": run_suite(args),
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+    if args.baseline:
+        regressions = compare(_load(args.baseline)["results"], report["results"], args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
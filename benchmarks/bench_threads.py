@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Compare OCR latency with and without the engine's CPU thread limits.
+
+Each configuration runs in a fresh spawned process, because torch's
+thread pools can only be sized once per process. ``--contention`` starts
+busy OpenCV threads alongside OCR to stand in for the GUI and capture
+work that competes for the same cores. Needs easyocr installed.
+
+Usage:
+    python benchmarks/bench_threads.py --count 20 --workers 2 --contention 2
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+src_dir = Path(__file__).resolve().parent.parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from bench_batch import make_frames  # noqa: E402
+
+from text_detector.config import AppSettings  # noqa: E402
+from text_detector.cpu_threads import (  # noqa: E402
+    apply_library_threads,
+    pin_to_cpus,
+    plan_threads,
+)
+from text_detector.ocr_engine import OCREngine  # noqa: E402
+
+
+def _burn(stop: threading.Event) -> None:
+    """Keep a core busy with OpenCV work until ``stop`` is set."""
+    image = np.random.default_rng(1).integers(0, 255, (720, 1280), dtype=np.uint8)
+    while not stop.is_set():
+        cv2.GaussianBlur(image, (31, 31), 0)
+
+
+def _run(governed: bool, affinity: bool, args: argparse.Namespace) -> list[float]:
+    """Time ``args.count`` OCR calls per worker in this process."""
+    settings = AppSettings(
+        preprocess_enabled=True,
+        result_cache_size=0,
+        ocr_workers=args.workers,
+        cpu_affinity=affinity,
+    )
+    plan = plan_threads(settings)
+    frames = make_frames(args.count)
+    engine = OCREngine(settings, start_workers=False)
+
+    def worker(slot: int) -> list[float]:
+        engine._local.slot = slot
+        if governed:
+            apply_library_threads(plan)
+            if plan.cpu_sets:
+                pin_to_cpus(plan.cpu_sets[slot])
+        engine.detect_text(frames[0], [args.lang])
+        timings = []
+        for frame in frames:
+            start = time.perf_counter()
+            engine.detect_text(frame, [args.lang])
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    stop = threading.Event()
+    burners = [threading.Thread(target=_burn, args=(stop,)) for _ in range(args.contention)]
+    for thread in burners:
+        thread.start()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(worker, range(args.workers)))
+    finally:
+        stop.set()
+        for thread in burners:
+            thread.join()
+    engine.shutdown()
+    return [t for timings in results for t in timings]
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    spread = statistics.pstdev(ms)
+    print(
+        f"{label:<20} mean {statistics.mean(ms):8.1f} ms  p50 {statistics.median(ms):8.1f} ms"
+        f"  p95 {p95:8.1f} ms  stdev {spread:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20, help="frames per worker")
+    parser.add_argument("--workers", type=int, default=1, help="concurrent OCR workers")
+    parser.add_argument("--contention", type=int, default=1, help="busy background threads")
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args()
+
+    configs = [
+        ("library defaults", False, False),
+        ("thread limits", True, False),
+        ("limits + affinity", True, True),
+    ]
+    ctx = multiprocessing.get_context("spawn")
+    for label, governed, affinity in configs:
+        with ctx.Pool(1) as pool:
+            timings = pool.apply(_run, (governed, affinity, args))
+        _report(label, timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Tests for the adaptive OCR width controller."""
+
+from text_detector.adaptive import AdaptiveWidthController
+from text_detector.config import AppSettings
+
+
+def _controller(**kwargs) -> AdaptiveWidthController:
+    return AdaptiveWidthController(
+        target_latency=0.25, min_width=320, max_width=800, smoothing=1.0, **kwargs
+    )
+
+
+def test_starts_at_max_width():
+    """Test that the controller starts from the full configured width."""
+    assert _controller().width == 800
+
+
+def test_slow_calls_shrink_width_within_bounds():
+    """Test that latency over target lowers the width, never below the minimum."""
+    controller = _controller()
+    widths = [controller.update(1.0, confidence=0.9) for _ in range(20)]
+
+    assert widths[0] < 800
+    assert widths == sorted(widths, reverse=True)
+    assert widths[-1] == 320
+
+
+def test_fast_calls_grow_width_back():
+    """Test that latency under target raises the width again."""
+    controller = _controller()
+    for _ in range(5):
+        controller.update(1.0, confidence=0.9)
+    shrunk = controller.width
+
+    for _ in range(20):
+        controller.update(0.05, confidence=0.9)
+
+    assert shrunk < controller.width == 800
+
+
+def test_latency_near_target_holds_width():
+    """Test that latency within tolerance leaves the width alone."""
+    controller = _controller()
+    controller.update(1.0, confidence=0.9)
+    width = controller.width
+
+    controller.update(0.26, confidence=0.9)
+
+    assert controller.width == width
+
+
+def test_low_confidence_backs_off_and_sets_floor():
+    """Test that falling confidence raises the width despite slow calls."""
+    controller = _controller()
+    for _ in range(5):
+        controller.update(1.0, confidence=0.9)
+    shrunk = controller.width
+
+    raised = controller.update(1.0, confidence=0.2)
+    assert raised > shrunk
+
+    # Confidence recovers but calls are still slow: the floor holds the width up.
+    assert controller.update(1.0, confidence=0.9) >= raised - 32
+
+
+def test_no_detections_do_not_change_confidence():
+    """Test that calls without text leave the confidence estimate alone."""
+    controller = _controller()
+    controller.update(0.25, confidence=0.8)
+
+    controller.update(0.25, confidence=None)
+
+    assert controller.confidence == 0.8
+
+
+def test_stats_and_from_settings():
+    """Test that settings map onto the controller and stats report it."""
+    settings = AppSettings(ocr_min_width=480, ocr_max_width=960, target_ocr_latency_ms=100)
+    controller = AdaptiveWidthController.from_settings(settings)
+    controller.update(0.1, confidence=0.7)
+
+    stats = controller.stats()
+
+    assert controller.min_width == 480
+    assert stats["width"] == 960
+    assert stats["target_ms"] == 100.0
+    assert stats["latency_ms"] == 100.0
+    assert stats["confidence"] == 0.7
@@ -0,0 +1,93 @@
+"""Tests for the pluggable OCR backends."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from text_detector.backends import (
+    BackendOptions,
+    OnnxModule,
+    load_backend,
+    load_onnx,
+)
+
+
+def test_load_backend_unknown_name():
+    """Test that an unregistered backend name is rejected."""
+    with pytest.raises(ValueError, match="Unknown OCR backend"):
+        load_backend("tensorrt", ["en"], BackendOptions())
+
+
+def test_load_backend_easyocr_passes_gpu_flag():
+    """Test that the default backend builds an EasyOCR reader."""
+    with patch("easyocr.Reader") as mock_reader:
+        load_backend("easyocr", ["en", "fr"], BackendOptions(gpu=True))
+
+    mock_reader.assert_called_once_with(["en", "fr"], gpu=True)
+
+
+def _fake_ort() -> MagicMock:
+    ort = MagicMock()
+    ort.GraphOptimizationLevel.ORT_ENABLE_ALL = "all"
+    return ort
+
+
+def test_load_onnx_exports_missing_models(tmp_path: Path):
+    """Test that models are exported once and then served by ORT sessions."""
+    ort = _fake_ort()
+    reader = MagicMock(model_lang="english")
+    torch_detector = reader.detector
+    with (
+        patch.dict(sys.modules, {"onnxruntime": ort}),
+        patch("easyocr.Reader", return_value=reader) as mock_reader,
+        patch("text_detector.backends.export_detector") as export_detector,
+        patch("text_detector.backends.export_recognizer") as export_recognizer,
+    ):
+        backend = load_onnx(["en"], BackendOptions(gpu=True, threads=3, model_dir=tmp_path))
+
+    mock_reader.assert_called_once_with(["en"], gpu=False, quantize=False)
+    export_detector.assert_called_once_with(torch_detector, tmp_path / "craft.onnx")
+    export_recognizer.assert_called_once()
+    assert export_recognizer.call_args.args[1] == tmp_path / "recognizer_english.onnx"
+    assert backend is reader
+    assert isinstance(reader.detector, OnnxModule)
+    assert isinstance(reader.recognizer, OnnxModule)
+    options = ort.InferenceSession.call_args.kwargs["sess_options"]
+    assert options.graph_optimization_level == "all"
+    assert options.intra_op_num_threads == 3
+
+
+def test_load_onnx_reuses_exported_models(tmp_path: Path):
+    """Test that existing ONNX files are not exported again."""
+    (tmp_path / "craft.onnx").write_bytes(b"")
+    (tmp_path / "recognizer_english.onnx").write_bytes(b"")
+    with (
+        patch.dict(sys.modules, {"onnxruntime": _fake_ort()}),
+        patch("easyocr.Reader", return_value=MagicMock(model_lang="english")),
+        patch("text_detector.backends.export_detector") as export_detector,
+        patch("text_detector.backends.export_recognizer") as export_recognizer,
+    ):
+        load_onnx(["en"], BackendOptions(model_dir=tmp_path))
+
+    export_detector.assert_not_called()
+    export_recognizer.assert_not_called()
+
+
+def test_onnx_module_feeds_declared_inputs_only():
+    """Test that arguments the exported graph dropped are not fed."""
+    torch = pytest.importorskip("torch")
+    session = MagicMock()
+    session.get_inputs.return_value = [MagicMock()]
+    session.get_inputs.return_value[0].name = "image"
+    session.run.return_value = [np.ones((1, 4), dtype=np.float32)]
+
+    module = OnnxModule(session)
+    output = module(torch.zeros((1, 1, 64, 32)), torch.zeros((1, 1), dtype=torch.long))
+
+    feeds = session.run.call_args.args[1]
+    assert list(feeds) == ["image"]
+    assert tuple(output.shape) == (1, 4)
+    assert module.eval() is module
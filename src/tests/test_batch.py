@@ -0,0 +1,129 @@
+"""Tests for the headless batch module."""
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from text_detector import batch
+from text_detector.__main__ import build_parser
+from text_detector.config import AppSettings
+from text_detector.cpu_threads import plan_threads
+from text_detector.ocr_engine import DetectionResult, OCREngine
+
+
+def _thread_pool(workers: int, settings: AppSettings) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=workers,
+        initializer=batch._init_ocr_process,
+        initargs=(settings, plan_threads(settings)),
+    )
+
+
+@pytest.fixture
+def image_dir(tmp_path: Path) -> Path:
+    for name in ("a.png", "b.jpg"):
+        cv2.imwrite(str(tmp_path / name), np.zeros((20, 40, 3), dtype=np.uint8))
+    (tmp_path / "notes.txt").write_text("not an image")
+    (tmp_path / "broken.png").write_text("not an image either")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    cv2.imwrite(str(nested / "c.png"), np.zeros((20, 40, 3), dtype=np.uint8))
+    return tmp_path
+
+
+def test_collect_images_directory(image_dir: Path) -> None:
+    names = [p.name for p in batch.collect_images(str(image_dir))]
+    assert names == ["a.png", "b.jpg", "broken.png"]
+
+
+def test_collect_images_recursive_and_glob(image_dir: Path) -> None:
+    recursive = batch.collect_images(str(image_dir), recursive=True)
+    assert "c.png" in [p.name for p in recursive]
+    globbed = batch.collect_images(str(image_dir / "**" / "*.png"))
+    assert sorted(p.name for p in globbed) == ["a.png", "broken.png", "c.png"]
+
+
+def test_build_record_serialises_detections() -> None:
+    # EasyOCR returns numpy scalars, which json cannot serialise directly.
+    box: Any = [[np.int32(1), np.int32(2)], [3, 2], [3, 4], [1, 4]]
+    result = DetectionResult(detections=[(box, "hi", np.float64(0.5))], languages=["en"])
+    record = batch.build_record(Path("x.png"), (10, 20, 3), result, {"ocr": 0.0125})
+    assert json.loads(json.dumps(record)) == record
+    assert record["width"] == 20
+    assert record["detections"][0]["box"][0] == [1.0, 2.0]
+    assert record["timings"] == {"ocr_ms": 12.5}
+    assert record["success"] is True
+
+
+def test_iter_batch_records_streams_every_image(image_dir: Path) -> None:
+    paths = batch.collect_images(str(image_dir))
+    found = DetectionResult(
+        detections=[([[0, 0], [1, 0], [1, 1], [0, 1]], "t", 0.9)], languages=["en"]
+    )
+
+    with patch.object(OCREngine, "detect_text", return_value=found):
+        records = list(
+            batch.iter_batch_records(
+                paths,
+                AppSettings(),
+                ["en"],
+                None,
+                workers=2,
+                decode_threads=2,
+                pool_factory=_thread_pool,
+            )
+        )
+
+    by_name = {Path(r["path"]).name: r for r in records}
+    assert set(by_name) == {"a.png", "b.jpg", "broken.png"}
+    assert by_name["broken.png"]["success"] is False
+    assert by_name["a.png"]["detections"][0]["text"] == "t"
+    assert {"decode_ms", "ocr_ms", "total_ms"} <= set(by_name["a.png"]["timings"])
+
+
+def test_run_batch_writes_jsonl_file(image_dir: Path, tmp_path: Path) -> None:
+    output = tmp_path / "out.jsonl"
+    args = build_parser().parse_args(["batch", str(image_dir / "*.png"), "-o", str(output)])
+    empty = DetectionResult(detections=[], languages=["en"])
+
+    with (
+        patch.object(batch, "_make_ocr_pool", _thread_pool),
+        patch.object(OCREngine, "detect_text", return_value=empty),
+    ):
+        assert batch.run_batch(args) == 0
+
+    lines = output.read_text().splitlines()
+    assert len(lines) == 2
+    assert all("path" in json.loads(line) for line in lines)
+
+
+def test_run_batch_no_images(tmp_path: Path) -> None:
+    args = build_parser().parse_args(["batch", str(tmp_path)])
+    assert batch.run_batch(args) == 1
+
+
+def test_batch_workers_default_is_capped() -> None:
+    args = build_parser().parse_args(["batch", "scans"])
+    assert 1 <= args.workers <= 4
+
+
+def test_batch_does_not_import_tkinter() -> None:
+    src_dir = Path(batch.__file__).resolve().parent.parent
+    code = "import sys, text_detector.__main__; print('tkinter' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+    )
+    assert out.stdout.strip() == "False"
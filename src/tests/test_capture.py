@@ -0,0 +1,248 @@
+"""Tests for camera format negotiation and the background capture thread."""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from text_detector import capture as capture_module
+from text_detector.capture import (
+    CaptureFormat,
+    CaptureThread,
+    apply_format,
+    auto_resolution,
+    fourcc_name,
+    probe_camera,
+)
+from text_detector.config import AppSettings
+
+
+class FakeCapture:
+    """Camera stand-in producing a frame every millisecond, numbered by its grab."""
+
+    def __init__(self, fail_grabs: int = 0) -> None:
+        self.fail_grabs = fail_grabs
+        self.grabs = 0
+        self.props: dict[int, float] = {}
+        self.released = threading.Event()
+
+    def set(self, prop: int, value: float) -> bool:
+        self.props[prop] = value
+        return True
+
+    def grab(self) -> bool:
+        time.sleep(0.001)
+        if self.fail_grabs:
+            self.fail_grabs -= 1
+            return False
+        self.grabs += 1
+        return True
+
+    def retrieve(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        frame = image if image is not None else np.empty((4, 4, 3), dtype=np.uint8)
+        frame[:] = self.grabs % 256
+        return True, frame
+
+    def release(self) -> None:
+        self.released.set()
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.002)
+    return False
+
+
+def take(capture: CaptureThread, timeout: float = 2.0) -> tuple[np.ndarray, float]:
+    """Wait for the next decoded frame and return it with its grab time."""
+    deadline = time.monotonic() + timeout
+    while (latest := capture.latest()) is None:
+        assert time.monotonic() < deadline, "no frame decoded"
+        time.sleep(0.002)
+    return latest
+
+
+def test_only_requested_frames_are_decoded():
+    """Test that frames are grabbed continuously but retrieved once per request."""
+    cap = FakeCapture()
+    capture = CaptureThread(cap)
+    capture.start()
+    try:
+        first_frame, first_time = take(capture)
+        first_number = int(first_frame[0, 0, 0])
+        assert wait_for(lambda: capture.grabbed >= 20)
+        assert capture.latest() is None
+        capture.request_frame()
+        frame, grabbed_at = take(capture)
+    finally:
+        capture.stop()
+
+    assert capture.retrieved == 2
+    assert capture.grabbed > capture.retrieved
+    assert frame[0, 0, 0] > first_number
+    assert grabbed_at > first_time
+
+
+def test_buffer_size_is_set_and_capture_released_on_stop():
+    """Test the driver queue setting and that stopping releases the camera."""
+    cap = FakeCapture()
+    capture = CaptureThread(cap, buffer_size=1)
+    capture.start()
+    capture.stop()
+
+    assert cap.props[cv2.CAP_PROP_BUFFERSIZE] == 1
+    assert cap.released.is_set()
+    assert not capture.running
+    assert capture.latest() is None
+
+
+def test_failed_grabs_are_retried():
+    """Test that a camera that fails for a while delivers frames afterwards."""
+    cap = FakeCapture(fail_grabs=2)
+    capture = CaptureThread(cap)
+    capture.start()
+    try:
+        assert wait_for(lambda: capture.retrieved == 1)
+    finally:
+        capture.stop()
+
+    assert capture.failures == 2
+
+
+def test_frames_are_decoded_into_reused_buffers():
+    """Test that decoding reuses pool buffers once the consumer releases a frame."""
+    capture = CaptureThread(FakeCapture())
+    capture.start()
+    seen = set()
+    try:
+        for _ in range(10):
+            frame, _grabbed_at = take(capture)
+            seen.add(id(frame))
+            capture.release(frame)
+            capture.request_frame()
+    finally:
+        capture.stop()
+
+    assert len(seen) <= 2
+
+
+def test_frames_held_by_the_consumer_are_not_overwritten():
+    """Test that a frame taken and not released keeps its pixels while capture goes on."""
+    capture = CaptureThread(FakeCapture())
+    capture.start()
+    try:
+        kept, _grabbed_at = take(capture)
+        value = int(kept[0, 0, 0])
+        for _ in range(5):
+            capture.request_frame()
+            frame, _grabbed_at = take(capture)
+            assert frame is not kept
+            capture.release(frame)
+    finally:
+        capture.stop()
+
+    assert (kept == value).all()
+
+
+class FakeCamera:
+    """Camera stand-in that snaps requested sizes to the modes its pixel formats support."""
+
+    MODES = {"MJPG": [(640, 480), (1280, 720), (1920, 1080)], "YUYV": [(640, 480)]}
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.props = {
+            cv2.CAP_PROP_FOURCC: float(cv2.VideoWriter.fourcc(*"YUYV")),
+            cv2.CAP_PROP_FRAME_WIDTH: 640.0,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480.0,
+            cv2.CAP_PROP_FPS: 30.0,
+        }
+        self.released = False
+
+    def isOpened(self) -> bool:  # noqa: N802 - OpenCV API
+        return True
+
+    def set(self, prop: int, value: float) -> bool:
+        self.calls.append(prop)
+        self.props[prop] = float(value)
+        if prop != cv2.CAP_PROP_FPS:
+            modes = self.MODES[fourcc_name(self.props[cv2.CAP_PROP_FOURCC])]
+            wanted = self.props[cv2.CAP_PROP_FRAME_WIDTH]
+            width, height = min(modes, key=lambda mode: abs(mode[0] - wanted))
+            self.props[cv2.CAP_PROP_FRAME_WIDTH] = width
+            self.props[cv2.CAP_PROP_FRAME_HEIGHT] = height
+        return True
+
+    def get(self, prop: int) -> float:
+        return self.props.get(prop, 0.0)
+
+    def read(self) -> tuple[bool, np.ndarray]:
+        return True, np.zeros((2, 2, 3), dtype=np.uint8)
+
+    def grab(self) -> bool:
+        return True
+
+    def retrieve(self) -> tuple[bool, np.ndarray]:
+        return True, np.zeros((2, 2, 3), dtype=np.uint8)
+
+    def release(self) -> None:
+        self.released = True
+
+
+@pytest.mark.parametrize(
+    ("max_width", "expected"),
+    [(320, (640, 480)), (640, (640, 480)), (1000, (1280, 720)), (5000, (3840, 2160))],
+)
+def test_auto_resolution_covers_ocr_width(max_width, expected):
+    """Test that the smallest common resolution wide enough for OCR is chosen."""
+    assert auto_resolution(max_width) == expected
+
+
+def test_format_from_settings():
+    """Test explicit sizes, automatic sizing from ocr_max_width and tiled OCR."""
+    explicit = AppSettings(
+        capture_width=800, capture_height=600, capture_fps=15, capture_fourcc="YUYV"
+    )
+    assert CaptureFormat.from_settings(explicit) == CaptureFormat(800, 600, 15, "YUYV")
+    auto = AppSettings(ocr_max_width=1280, capture_fourcc="MJPG")
+    assert CaptureFormat.from_settings(auto) == CaptureFormat(1280, 720, 0.0, "MJPG")
+    tiled = AppSettings(tiled_ocr=True)
+    assert CaptureFormat.from_settings(tiled) == CaptureFormat()
+
+
+def test_apply_format_sets_fourcc_first_and_reports_the_negotiated_mode():
+    """Test that the pixel format precedes the size and the camera's answer is returned."""
+    cam = FakeCamera()
+
+    actual = apply_format(cam, CaptureFormat(1920, 1080, 30, "MJPG"))
+
+    assert cam.calls == [
+        cv2.CAP_PROP_FOURCC,
+        cv2.CAP_PROP_FRAME_WIDTH,
+        cv2.CAP_PROP_FRAME_HEIGHT,
+        cv2.CAP_PROP_FPS,
+    ]
+    assert actual == CaptureFormat(1920, 1080, 30.0, "MJPG")
+    assert apply_format(FakeCamera(), CaptureFormat()) == CaptureFormat(640, 480, 30.0, "YUYV")
+
+
+def test_probe_lists_each_negotiated_mode_once(monkeypatch):
+    """Test that the probe reports the distinct modes the camera settled on."""
+    cam = FakeCamera()
+    monkeypatch.setattr(capture_module.cv2, "VideoCapture", lambda index: cam)
+
+    modes = probe_camera(0, frames=3)
+
+    assert [(m["fourcc"], m["width"], m["height"]) for m in modes] == [
+        ("MJPG", 640, 480),
+        ("MJPG", 1280, 720),
+        ("MJPG", 1920, 1080),
+        ("YUYV", 640, 480),
+    ]
+    assert all(m["fps"] > 0 and m["decode_ms"] >= 0 for m in modes)
+    assert cam.released
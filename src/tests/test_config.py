@@ -17,7 +17,7 @@ def test_app_settings_defaults() -> None:
     settings = AppSettings()
     assert settings.default_language == "en"
     assert settings.default_confidence == 0.25
-    assert settings.frame_skip == 15
+    assert settings.ocr_cpu_budget == 100
     assert settings.max_history == 100
     assert settings.gpu_enabled is False
     assert settings.ocr_max_width == 800
@@ -46,11 +46,113 @@ def test_app_settings_default_out_of_range() -> None:
         AppSettings(min_confidence=0.5, max_confidence=0.8, default_confidence=0.1)
 
 
-def test_app_settings_invalid_frame_skip() -> None:
-    with pytest.raises(ValueError, match="frame_skip"):
-        AppSettings(frame_skip=0)
+def test_app_settings_invalid_ocr_cpu_budget() -> None:
+    with pytest.raises(ValueError, match="ocr_cpu_budget"):
+        AppSettings(ocr_cpu_budget=0)
+
+
+def test_app_settings_invalid_ocr_min_interval() -> None:
+    with pytest.raises(ValueError, match="ocr_min_interval_ms"):
+        AppSettings(ocr_min_interval_ms=-1)
 
 
 def test_app_settings_invalid_max_history() -> None:
     with pytest.raises(ValueError, match="max_history"):
         AppSettings(max_history=0)
+
+
+def test_app_settings_invalid_ocr_workers() -> None:
+    with pytest.raises(ValueError, match="ocr_workers"):
+        AppSettings(ocr_workers=0)
+
+
+def test_app_settings_invalid_ocr_pool_mode() -> None:
+    with pytest.raises(ValueError, match="ocr_pool_mode"):
+        AppSettings(ocr_pool_mode="fibers")
+
+
+def test_app_settings_invalid_result_cache_size() -> None:
+    with pytest.raises(ValueError, match="result_cache_size"):
+        AppSettings(result_cache_size=-1)
+
+
+def test_app_settings_invalid_motion_thresholds() -> None:
+    with pytest.raises(ValueError, match="motion_settle_threshold"):
+        AppSettings(motion_change_threshold=2.0, motion_settle_threshold=5.0)
+
+
+def test_app_settings_invalid_motion_staleness() -> None:
+    with pytest.raises(ValueError, match="motion_max_staleness"):
+        AppSettings(motion_max_staleness=0)
+
+
+def test_app_settings_invalid_preload_languages() -> None:
+    with pytest.raises(ValueError, match="preload_languages"):
+        AppSettings(preload_languages=["xx"])
+
+
+def test_app_settings_invalid_reader_cache_budget() -> None:
+    with pytest.raises(ValueError, match="reader_cache_max_mb"):
+        AppSettings(reader_cache_max_mb=0)
+
+
+def test_app_settings_invalid_ocr_queue_mode() -> None:
+    with pytest.raises(ValueError, match="ocr_queue_mode"):
+        AppSettings(ocr_queue_mode="newest")
+
+
+def test_app_settings_invalid_result_channel_size() -> None:
+    with pytest.raises(ValueError, match="result_channel_size"):
+        AppSettings(result_channel_size=-1)
+
+
+def test_app_settings_invalid_ocr_deadline() -> None:
+    with pytest.raises(ValueError, match="ocr_deadline_ms"):
+        AppSettings(ocr_deadline_ms=-1)
+
+
+def test_app_settings_invalid_ocr_hang_timeout() -> None:
+    with pytest.raises(ValueError, match="ocr_hang_timeout_ms"):
+        AppSettings(ocr_hang_timeout_ms=-1)
+
+
+def test_app_settings_invalid_metrics_interval() -> None:
+    with pytest.raises(ValueError, match="metrics_interval"):
+        AppSettings(metrics_interval=0)
+
+
+def test_app_settings_capture_resolution_needs_both_sides() -> None:
+    with pytest.raises(ValueError, match="capture_width"):
+        AppSettings(capture_width=1280)
+    with pytest.raises(ValueError, match="capture_width"):
+        AppSettings(capture_width=-1, capture_height=-1)
+
+
+def test_app_settings_invalid_capture_fps() -> None:
+    with pytest.raises(ValueError, match="capture_fps"):
+        AppSettings(capture_fps=-1)
+
+
+def test_app_settings_invalid_capture_fourcc() -> None:
+    with pytest.raises(ValueError, match="capture_fourcc"):
+        AppSettings(capture_fourcc="H264")
+
+
+def test_app_settings_invalid_thread_counts() -> None:
+    with pytest.raises(ValueError, match="thread counts"):
+        AppSettings(opencv_threads=-1)
+
+
+def test_app_settings_invalid_ocr_backend() -> None:
+    with pytest.raises(ValueError, match="ocr_backend"):
+        AppSettings(ocr_backend="tensorrt")
+
+
+def test_app_settings_invalid_tile_overlap() -> None:
+    with pytest.raises(ValueError, match="ocr_tile_overlap"):
+        AppSettings(ocr_max_width=400, ocr_tile_overlap=300)
+
+
+def test_app_settings_invalid_ocr_min_width() -> None:
+    with pytest.raises(ValueError, match="ocr_min_width"):
+        AppSettings(ocr_min_width=1000, ocr_max_width=800)
@@ -0,0 +1,109 @@
+"""Tests for CPU thread governance."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from text_detector.config import AppSettings
+from text_detector.cpu_threads import (
+    ThreadPlan,
+    apply_library_threads,
+    pin_to_cpus,
+    plan_threads,
+    split_cpus,
+)
+
+
+def test_plan_threads_defaults_share_cores_between_workers():
+    """Test that unset counts divide the non-reserved cores between workers."""
+    plan = plan_threads(AppSettings(ocr_workers=2), cpus=list(range(9)))
+
+    assert plan.intra_op == 4
+    assert plan.inter_op == 1
+    assert plan.opencv == 4
+    assert plan.cpu_sets is None
+
+
+def test_plan_threads_respects_explicit_counts():
+    """Test that configured counts override the defaults."""
+    settings = AppSettings(torch_intra_op_threads=3, torch_inter_op_threads=2, opencv_threads=1)
+
+    plan = plan_threads(settings, cpus=list(range(16)))
+
+    assert (plan.intra_op, plan.inter_op, plan.opencv) == (3, 2, 1)
+
+
+def test_plan_threads_single_core():
+    """Test that a single core still gets one thread of each kind."""
+    plan = plan_threads(AppSettings(cpu_affinity=True), cpus=[0])
+
+    assert plan.intra_op == 1
+    assert plan.cpu_sets == [[0]]
+
+
+def test_split_cpus_reserves_first_core():
+    """Test that CPU sets skip the reserved core and do not overlap."""
+    assert split_cpus(list(range(9)), 2) == [[1, 2, 3, 4], [5, 6, 7, 8]]
+
+
+def test_split_cpus_shares_when_too_few_cores():
+    """Test that workers share CPUs when there are more workers than cores."""
+    assert split_cpus([0, 1], 3) == [[0], [1], [0]]
+
+
+def test_apply_library_threads_sets_opencv_and_torch():
+    """Test that torch and OpenCV thread counts are applied."""
+    torch = MagicMock()
+    plan = ThreadPlan(intra_op=3, inter_op=1, opencv=2)
+
+    with (
+        patch.dict(sys.modules, {"torch": torch}),
+        patch("text_detector.cpu_threads.cv2.setNumThreads") as set_cv2,
+    ):
+        apply_library_threads(plan)
+
+    set_cv2.assert_called_once_with(2)
+    torch.set_num_threads.assert_called_once_with(3)
+    torch.set_num_interop_threads.assert_called_once_with(1)
+
+
+def test_apply_library_threads_tolerates_started_interop_pool():
+    """Test that a late inter-op call does not raise."""
+    torch = MagicMock()
+    torch.set_num_interop_threads.side_effect = RuntimeError("already started")
+
+    with (
+        patch.dict(sys.modules, {"torch": torch}),
+        patch("text_detector.cpu_threads.cv2.setNumThreads"),
+    ):
+        apply_library_threads(ThreadPlan(intra_op=1, inter_op=1, opencv=1))
+
+    torch.set_num_threads.assert_called_once_with(1)
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "sched_setaffinity"), reason="Linux only")
+def test_pin_to_cpus_current_thread():
+    """Test that pinning the calling thread to its current CPUs succeeds."""
+    import os
+    import threading
+
+    results = []
+
+    def pin():
+        cpus = sorted(os.sched_getaffinity(0))
+        results.append(pin_to_cpus(cpus[:1]))
+        results.append(sorted(os.sched_getaffinity(0)) == cpus[:1])
+
+    thread = threading.Thread(target=pin)
+    thread.start()
+    thread.join()
+
+    assert results == [True, True]
+
+
+def test_pin_to_cpus_unsupported_platform():
+    """Test that pinning is skipped where affinity is unavailable."""
+    with patch("text_detector.cpu_threads.os") as fake_os:
+        del fake_os.sched_setaffinity
+        assert pin_to_cpus([0]) is False
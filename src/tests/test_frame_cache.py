@@ -0,0 +1,88 @@
+"""Tests for the near-duplicate frame result cache."""
+
+import numpy as np
+
+from text_detector.frame_cache import FrameResultCache, fingerprint_distance, frame_fingerprint
+
+
+def _frame(value: int = 100) -> np.ndarray:
+    frame = np.full((480, 640, 3), value, dtype=np.uint8)
+    frame[100:140, 40:280] = 255 - value
+    return frame
+
+
+def test_frame_fingerprint_shape_and_dtype() -> None:
+    fp = frame_fingerprint(_frame())
+    assert fp.shape == (96, 128)
+    assert fp.dtype == np.uint8
+
+
+def test_frame_fingerprint_handles_grayscale() -> None:
+    gray = np.zeros((480, 640), dtype=np.uint8)
+    assert frame_fingerprint(gray).shape == (96, 128)
+
+
+def test_fingerprint_distance_tolerates_sensor_noise() -> None:
+    rng = np.random.default_rng(0)
+    frame = _frame()
+    noise = rng.integers(-10, 11, frame.shape)
+    noisy = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    assert fingerprint_distance(frame_fingerprint(frame), frame_fingerprint(noisy)) <= 3
+
+
+def test_fingerprint_distance_detects_changed_text() -> None:
+    frame = _frame()
+    changed = frame.copy()
+    changed[100:140, 40:120] = 100
+    assert fingerprint_distance(frame_fingerprint(frame), frame_fingerprint(changed)) > 50
+
+
+def test_fingerprint_distance_detects_single_changed_character() -> None:
+    import cv2
+
+    def price(text: str) -> np.ndarray:
+        frame = np.full((480, 640, 3), 255, dtype=np.uint8)
+        cv2.putText(frame, text, (40, 240), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+        return frame
+
+    distance = fingerprint_distance(
+        frame_fingerprint(price("PRICE 12.99")), frame_fingerprint(price("PRICE 19.99"))
+    )
+    assert distance > 6.0
+
+
+def test_cache_hit_within_distance() -> None:
+    cache: FrameResultCache[str] = FrameResultCache(max_entries=4, max_distance=5)
+    fp = frame_fingerprint(_frame())
+    cache.store(fp, "en", "result")
+    assert cache.lookup(fp, "en") == "result"
+    assert cache.lookup(fp, "fr") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_miss_beyond_distance() -> None:
+    cache: FrameResultCache[str] = FrameResultCache(max_entries=4, max_distance=5)
+    cache.store(frame_fingerprint(_frame(100)), "en", "result")
+    assert cache.lookup(frame_fingerprint(_frame(20)), "en") is None
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache: FrameResultCache[int] = FrameResultCache(max_entries=2, max_distance=0)
+    fps = [frame_fingerprint(_frame(v)) for v in (10, 80, 160)]
+    cache.store(fps[0], "en", 0)
+    cache.store(fps[1], "en", 1)
+    assert cache.lookup(fps[0], "en") == 0
+    cache.store(fps[2], "en", 2)
+    assert len(cache) == 2
+    assert cache.lookup(fps[1], "en") is None
+    assert cache.lookup(fps[0], "en") == 0
+
+
+def test_cache_clear_resets_counters() -> None:
+    cache: FrameResultCache[int] = FrameResultCache()
+    fp = frame_fingerprint(_frame())
+    cache.store(fp, "en", 1)
+    cache.lookup(fp, "en")
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
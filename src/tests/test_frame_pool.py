@@ -0,0 +1,111 @@
+"""Tests for reusable frame buffers."""
+
+import numpy as np
+
+from text_detector.frame_pool import FramePool, ScratchBuffers
+
+
+def _frame(shape=(48, 64, 3)):
+    return np.zeros(shape, dtype=np.uint8)
+
+
+def test_empty_pool_has_nothing_to_hand_out():
+    """Test that the first capture has to allocate."""
+    assert FramePool().acquire() is None
+
+
+def test_frames_are_reused_only_after_release():
+    """Test that an adopted frame stays in use until it is handed back."""
+    pool = FramePool()
+    frame = _frame()
+    pool.adopt(frame)
+    alias = frame  # still referenced, as a displayed frame would be
+
+    assert pool.acquire() is None
+    pool.release(frame)
+    buffer = pool.acquire()
+
+    assert buffer is alias
+    assert pool.acquire() is None
+    pool.adopt(buffer)
+    assert pool.allocations == 1
+
+
+def test_unreleased_frame_is_never_handed_out_even_without_references():
+    """Test that reuse does not depend on reference counts."""
+    pool = FramePool()
+    pool.adopt(_frame())
+
+    assert pool.acquire() is None
+
+
+def test_release_ignores_foreign_frames_and_repeats():
+    """Test that releasing an unknown frame or the same frame twice changes nothing."""
+    pool = FramePool()
+    frame = _frame()
+    pool.adopt(frame)
+    pool.release(_frame())
+    pool.release(frame)
+    pool.release(frame)
+
+    assert pool.acquire() is frame
+    assert pool.acquire() is None
+
+
+def test_steady_capture_allocates_nothing():
+    """Test a capture loop that releases each frame when the next replaces it."""
+    pool = FramePool(max_buffers=4)
+    current = None
+    for _ in range(50):
+        buffer = pool.acquire()
+        frame = buffer if buffer is not None else _frame()
+        pool.adopt(frame)
+        if current is not None:
+            pool.release(current)
+        current = frame
+
+    assert pool.allocations == 2
+
+
+def test_pool_is_bounded_and_restarts_on_a_new_shape():
+    """Test that the pool stops growing at max_buffers and resets when the size changes."""
+    pool = FramePool(max_buffers=2)
+    held = [_frame() for _ in range(3)]
+    for frame in held:
+        pool.adopt(frame)
+    pool.release(held[2])
+    assert pool.acquire() is None
+    pool.release(held[0])
+    assert pool.acquire() is held[0]
+
+    larger = _frame((96, 128, 3))
+    pool.adopt(larger)
+    pool.release(held[1])
+    pool.release(larger)
+    buffer = pool.acquire()
+
+    assert buffer is larger
+    assert pool.acquire() is None
+    assert pool.allocations == 4
+
+
+def test_clear_drops_all_buffers():
+    """Test that a cleared pool starts empty."""
+    pool = FramePool()
+    frame = _frame()
+    pool.adopt(frame)
+    pool.release(frame)
+    pool.clear()
+
+    assert pool.acquire() is None
+
+
+def test_scratch_buffers_are_reused_per_name_and_shape():
+    """Test that scratch arrays are allocated once per name and shape."""
+    scratch = ScratchBuffers()
+
+    first = scratch.get("annotated", (4, 4, 3))
+    assert scratch.get("annotated", (4, 4, 3)) is first
+    assert scratch.get("rgb", (4, 4, 3)) is not first
+    assert scratch.get("annotated", (8, 8, 3)).shape == (8, 8, 3)
+    assert scratch.allocations == 3
@@ -7,6 +7,8 @@ from text_detector.image_processor import (
     compute_avg_color,
     draw_boxes_with_colors,
     filter_text,
+    offset_detections,
+    pad_to_common_size,
     preprocess_for_ocr,
     resize_frame_for_ocr,
     scale_detections,
@@ -73,6 +75,23 @@ def test_draw_boxes_does_not_mutate_input() -> None:
     np.testing.assert_array_equal(frame, original)
 
 
+def test_draw_boxes_into_out_buffer() -> None:
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    out = np.full_like(frame, 255)
+    detections = [_make_detection("test", 0.9)]
+    result = draw_boxes_with_colors(frame, detections, out=out)
+    assert result is out
+    np.testing.assert_array_equal(result, draw_boxes_with_colors(frame, detections))
+    assert not frame.any()
+
+
+def test_bgr_to_rgb_into_out_buffer() -> None:
+    frame = np.array([[[0, 0, 255]]], dtype=np.uint8)
+    out = np.empty_like(frame)
+    assert bgr_to_rgb(frame, out=out) is out
+    assert out[0, 0, 0] == 255
+
+
 def test_bgr_to_rgb_conversion() -> None:
     frame = np.array([[[0, 0, 255]]], dtype=np.uint8)  # BGR: Red
     result = bgr_to_rgb(frame)
@@ -132,3 +151,25 @@ def test_preprocess_for_ocr_default_strength() -> None:
     frame = np.zeros((50, 50, 3), dtype=np.uint8)
     result = preprocess_for_ocr(frame)
     assert result.shape == (50, 50, 3)
+
+
+def test_offset_detections_translates_boxes() -> None:
+    dets = [_make_detection("test", 0.9)]
+    result = offset_detections(dets, dx=5.0, dy=-2.0)
+    assert result[0][0][0] == [15.0, 8.0]
+    assert result[0][1] == "test"
+
+
+def test_offset_detections_zero_offset() -> None:
+    dets = [_make_detection("test", 0.9)]
+    assert offset_detections(dets, 0, 0) is dets
+
+
+def test_pad_to_common_size_keeps_content_top_left() -> None:
+    small = np.full((10, 20, 3), 7, dtype=np.uint8)
+    gray = np.full((30, 5), 9, dtype=np.uint8)
+    result = pad_to_common_size([small, gray])
+    assert [f.shape for f in result] == [(30, 20, 3), (30, 20, 3)]
+    assert result[0][9, 19, 0] == 7
+    assert result[0][10, 0, 0] == 0
+    assert result[1][29, 4, 0] == 9
@@ -0,0 +1,87 @@
+"""Tests for incremental detection and recognition."""
+
+import numpy as np
+
+from text_detector.incremental import IncrementalRecognizer
+
+
+class FakeReader:
+    """Reader with two fixed horizontal boxes that reads text from pixel values."""
+
+    boxes = [[10, 60, 50, 70], [10, 60, 10, 30]]
+
+    def __init__(self) -> None:
+        self.detect_calls = 0
+        self.recognized: list[int] = []
+
+    def detect(self, image):
+        self.detect_calls += 1
+        return [list(self.boxes)], [[]]
+
+    def recognize(self, image, horizontal_list=None, free_list=None):
+        results = []
+        for x_min, x_max, y_min, y_max in horizontal_list:
+            value = int(image[y_min, x_min, 0])
+            bbox = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+            results.append((bbox, f"v{value}", 0.9))
+            self.recognized.append(y_min)
+        # EasyOCR returns regions sorted top to bottom, not in request order.
+        return sorted(results, key=lambda r: r[0][0][1])
+
+
+def _frame(top: int = 100, bottom: int = 200) -> np.ndarray:
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    frame[10:30, 10:60] = top
+    frame[50:70, 10:60] = bottom
+    return frame
+
+
+def test_first_call_runs_detector_and_recognizes_all_boxes() -> None:
+    reader = FakeReader()
+    recognizer = IncrementalRecognizer()
+    results = recognizer.readtext(reader, _frame())
+    assert reader.detect_calls == 1
+    assert [r[1] for r in results] == ["v200", "v100"]
+
+
+def test_unchanged_boxes_reuse_previous_text() -> None:
+    reader = FakeReader()
+    recognizer = IncrementalRecognizer()
+    recognizer.readtext(reader, _frame())
+    reader.recognized.clear()
+    results = recognizer.readtext(reader, _frame())
+    assert reader.detect_calls == 1
+    assert reader.recognized == []
+    assert [r[1] for r in results] == ["v200", "v100"]
+    assert recognizer.stats()["reused_boxes"] == 2
+
+
+def test_only_changed_box_is_recognized() -> None:
+    reader = FakeReader()
+    recognizer = IncrementalRecognizer(redetect_ratio=0.6)
+    recognizer.readtext(reader, _frame())
+    reader.recognized.clear()
+    results = recognizer.readtext(reader, _frame(top=30))
+    assert reader.detect_calls == 1
+    assert reader.recognized == [10]
+    assert [r[1] for r in results] == ["v200", "v30"]
+
+
+def test_detector_reruns_on_interval_and_shape_change() -> None:
+    reader = FakeReader()
+    recognizer = IncrementalRecognizer(detect_interval=2)
+    for _ in range(3):
+        recognizer.readtext(reader, _frame())
+    assert reader.detect_calls == 2
+    recognizer.readtext(reader, np.zeros((120, 100, 3), dtype=np.uint8))
+    assert reader.detect_calls == 3
+
+
+def test_detector_reruns_when_most_boxes_change_or_key_changes() -> None:
+    reader = FakeReader()
+    recognizer = IncrementalRecognizer()
+    recognizer.readtext(reader, _frame(), key="en")
+    recognizer.readtext(reader, _frame(top=10, bottom=10), key="en")
+    assert reader.detect_calls == 2
+    recognizer.readtext(reader, _frame(top=10, bottom=10), key="fr")
+    assert reader.detect_calls == 3
@@ -0,0 +1,72 @@
+"""Tests for per-stage pipeline metrics."""
+
+from text_detector.metrics import StageMetrics, counter_lines, summarize, write_textfile
+
+
+def test_summarize_reports_percentiles_in_milliseconds():
+    """Test that percentiles and maximum are converted to milliseconds."""
+    stats = summarize([i / 1000 for i in range(1, 101)])
+
+    assert stats["samples"] == 100
+    assert stats["p50_ms"] == 50.5
+    assert stats["p99_ms"] == 99.0
+    assert stats["max_ms"] == 100.0
+    assert summarize([]) == {"samples": 0}
+
+
+def test_stage_metrics_keeps_a_rolling_window_and_running_totals():
+    """Test that old samples leave the window but still count towards the totals."""
+    metrics = StageMetrics(window=2)
+    for seconds in (1.0, 0.002, 0.004):
+        metrics.record("inference", seconds)
+
+    stats = metrics.stats()["inference"]
+
+    assert stats["samples"] == 2
+    assert stats["max_ms"] == 4.0
+    assert stats["count"] == 3
+    assert stats["total_s"] == 1.006
+
+
+def test_stage_timer_records_and_accumulates_per_call_times():
+    """Test that a timed block is recorded and added to the per-call dictionary."""
+    metrics = StageMetrics()
+    times: dict[str, float] = {}
+
+    with metrics.time("resize", times):
+        pass
+    with metrics.time("resize", times):
+        pass
+
+    assert metrics.stats()["resize"]["count"] == 2
+    assert set(times) == {"resize"}
+    assert times["resize"] >= 0.0
+
+
+def test_prometheus_lines_render_a_summary():
+    """Test the Prometheus summary rendering with a custom label."""
+    metrics = StageMetrics()
+    metrics.record("streaming", 0.5)
+
+    lines = metrics.prometheus_lines("ocr_latency_seconds", "Latency.", label="priority")
+
+    assert lines[0] == "# HELP ocr_latency_seconds Latency."
+    assert lines[1] == "# TYPE ocr_latency_seconds summary"
+    assert 'ocr_latency_seconds{priority="streaming",quantile="0.95"} 0.500000' in lines
+    assert 'ocr_latency_seconds_count{priority="streaming"} 1' in lines
+    assert 'ocr_latency_seconds_sum{priority="streaming"} 0.500000' in lines
+
+
+def test_counter_lines_and_textfile(tmp_path):
+    """Test counter rendering and the atomic textfile write."""
+    lines = counter_lines("ocr_requests_total", "Requests.", "outcome", {"dropped": 3})
+    path = tmp_path / "ocr.prom"
+
+    write_textfile(path, "\n".join(lines) + "\n")
+
+    assert path.read_text().splitlines() == [
+        "# HELP ocr_requests_total Requests.",
+        "# TYPE ocr_requests_total counter",
+        'ocr_requests_total{outcome="dropped"} 3',
+    ]
+    assert list(tmp_path.iterdir()) == [path]
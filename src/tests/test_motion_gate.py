@@ -0,0 +1,103 @@
+"""Tests for the motion gate."""
+
+import numpy as np
+
+from text_detector.config import AppSettings
+from text_detector.motion_gate import MotionGate
+
+
+def _scene(offset: int = 0) -> np.ndarray:
+    frame = np.full((240, 320, 3), 40, dtype=np.uint8)
+    frame[80:160, 60 + offset : 200 + offset] = 220
+    return frame
+
+
+def _run(gate: MotionGate, now: float) -> bool:
+    """Ask the gate and, like the GUI after a successful submit, mark the run."""
+    if gate.should_run(now=now):
+        gate.mark_run(now=now)
+        return True
+    return False
+
+
+def test_first_opportunity_runs_ocr() -> None:
+    gate = MotionGate()
+    gate.update(_scene())
+    assert _run(gate, now=0.0) is True
+    assert gate.triggered == 1
+
+
+def test_unsubmitted_run_keeps_scene_change() -> None:
+    gate = MotionGate(settle_frames=1)
+    gate.update(_scene())
+    _run(gate, now=0.0)
+    gate.update(_scene(offset=60))
+    gate.update(_scene(offset=60))
+
+    # The engine refused the frame, so mark_run is never called.
+    assert gate.should_run(now=1.0) is True
+    assert gate.triggered == 1
+    gate.update(_scene(offset=60))
+    assert _run(gate, now=1.1) is True
+    assert gate.should_run(now=1.2) is False
+
+
+def test_static_scene_is_skipped_until_stale() -> None:
+    gate = MotionGate(max_staleness=10.0)
+    gate.update(_scene())
+    assert _run(gate, now=0.0) is True
+    for step in range(1, 5):
+        gate.update(_scene())
+        assert _run(gate, now=float(step)) is False
+    assert gate.saved == 4
+    gate.update(_scene())
+    assert _run(gate, now=10.0) is True
+
+
+def test_change_runs_only_after_scene_settles() -> None:
+    gate = MotionGate(settle_frames=2)
+    gate.update(_scene())
+    _run(gate, now=0.0)
+
+    score = gate.update(_scene(offset=60))
+    assert score >= gate.change_threshold
+    assert _run(gate, now=1.0) is False
+
+    gate.update(_scene(offset=60))
+    assert _run(gate, now=1.1) is False
+    gate.update(_scene(offset=60))
+    assert _run(gate, now=1.2) is True
+    gate.update(_scene(offset=60))
+    assert _run(gate, now=1.3) is False
+
+
+def test_continuous_motion_resets_settling() -> None:
+    gate = MotionGate(settle_frames=1)
+    gate.update(_scene())
+    _run(gate, now=0.0)
+    for step, offset in enumerate((30, 60, 90), start=1):
+        gate.update(_scene(offset=offset))
+        assert _run(gate, now=float(step)) is False
+
+
+def test_reset_forces_next_run() -> None:
+    gate = MotionGate()
+    gate.update(_scene())
+    _run(gate, now=0.0)
+    gate.reset()
+    gate.update(_scene())
+    assert _run(gate, now=0.5) is True
+
+
+def test_from_settings_uses_configured_thresholds() -> None:
+    settings = AppSettings(
+        motion_change_threshold=9.0,
+        motion_settle_threshold=1.0,
+        motion_settle_frames=5,
+        motion_max_staleness=3.0,
+    )
+    gate = MotionGate.from_settings(settings)
+    assert gate.change_threshold == 9.0
+    assert gate.settle_threshold == 1.0
+    assert gate.settle_frames == 5
+    assert gate.max_staleness == 3.0
@@ -11,7 +11,7 @@ from text_detector.ocr_engine import DetectionResult, OCREngine
 
 @pytest.fixture
 def settings() -> AppSettings:
-    return AppSettings(default_language="en", default_confidence=0.3)
+    return AppSettings(default_language="en", default_confidence=0.3, preload_models=False)
 
 
 @pytest.fixture
@@ -87,6 +87,35 @@ def test_ocr_engine_model_caching(engine: OCREngine) -> None:
     assert mock_reader.readtext.call_count == 2
 
 
+def test_ocr_engine_loads_configured_backend(settings: AppSettings, tmp_path) -> None:
+    import numpy as np
+
+    settings.ocr_backend = "onnx"
+    settings.onnx_model_dir = str(tmp_path)
+    engine = OCREngine(settings, start_workers=False)
+
+    with patch("text_detector.ocr_engine.load_backend", return_value=MagicMock()) as mock_load:
+        engine.detect_text(np.zeros((100, 200, 3), dtype=np.uint8), languages=["en"])
+
+    name, languages, options = mock_load.call_args.args
+    assert name == "onnx"
+    assert languages == ["en"]
+    assert options.model_dir == tmp_path
+    assert options.threads == engine._thread_plan.intra_op
+
+
+def test_ocr_engine_caches_readers_per_backend(engine: OCREngine) -> None:
+    import numpy as np
+
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    with patch("text_detector.ocr_engine.load_backend", side_effect=lambda *a: MagicMock()):
+        engine.detect_text(frame, languages=["en"])
+        engine._settings.ocr_backend = "onnx"
+        engine.detect_text(frame, languages=["en"])
+
+    assert engine.cache_size == 2
+
+
 def test_ocr_engine_cache_clearing(engine: OCREngine) -> None:
     import numpy as np
 
@@ -127,3 +156,1097 @@ def test_ocr_engine_detect_text_async_drops_when_busy(settings: AppSettings) ->
 def test_ocr_engine_get_result_timeout(engine: OCREngine) -> None:
     result = engine.get_result(timeout=0.1)
     assert result is None
+
+
+def test_ocr_engine_pool_starts_one_thread_per_worker() -> None:
+    engine = OCREngine(AppSettings(ocr_workers=3, preload_models=False))
+    names = sorted(thread.name for thread in engine._worker_threads)
+    assert names == ["ocr-worker-0", "ocr-worker-1", "ocr-worker-2"]
+    assert engine.num_workers == 3
+    engine.shutdown()
+
+
+def test_ocr_engine_pool_delivers_in_submission_order() -> None:
+    import threading
+    import time
+
+    import numpy as np
+
+    engine = OCREngine(AppSettings(ocr_workers=3, preload_models=False))
+    delivered: list[str] = []
+    done = threading.Event()
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        # Earlier submissions take longer, so workers finish out of order.
+        time.sleep(0.05 * (3 - int(frame[0, 0])))
+        return DetectionResult(detections=[], languages=[str(int(frame[0, 0]))])
+
+    def on_result(result: DetectionResult) -> None:
+        delivered.append(result.languages[0])
+        if len(delivered) == 3:
+            done.set()
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        for value in range(3):
+            frame = np.full((4, 4), value, dtype=np.uint8)
+            assert engine.detect_text_async(frame, callback=on_result) is True
+        assert done.wait(timeout=5.0)
+
+    assert delivered == ["0", "1", "2"]
+    engine.shutdown()
+
+
+def test_ocr_engine_pool_workers_use_separate_readers() -> None:
+    import numpy as np
+
+    engine = OCREngine(AppSettings(ocr_workers=2), start_workers=False)
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    with patch("easyocr.Reader", side_effect=lambda *a, **k: MagicMock()):
+        engine._local.slot = 0
+        first = engine._get_reader(["en"])
+        engine._local.slot = 1
+        second = engine._get_reader(["en"])
+        engine.detect_text(frame, languages=["en"])
+
+    assert first is not second
+    assert engine.cache_size == 2
+
+
+def test_worker_process_main_serves_requests() -> None:
+    import multiprocessing
+    import threading
+
+    import numpy as np
+
+    from text_detector.ocr_engine import _worker_process_main
+    from text_detector.shared_frames import FrameSlot
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    settings = AppSettings(ocr_pool_mode="process", ocr_workers=2)
+    expected = DetectionResult(detections=[], languages=["en"])
+    frame = np.arange(48, dtype=np.uint8).reshape(4, 4, 3)
+    seen = []
+
+    def detect(self, image, languages, threshold):
+        seen.append(image.copy())
+        return expected
+
+    slot = FrameSlot()
+    with patch.object(OCREngine, "detect_text", autospec=True, side_effect=detect):
+        server = threading.Thread(target=_worker_process_main, args=(child_conn, settings))
+        server.start()
+        assert parent_conn.recv() == ("ready", None)
+        parent_conn.send((slot.write(frame), ["en"], 0.5, settings))
+        result = parent_conn.recv()
+        parent_conn.send(None)
+        server.join(timeout=5.0)
+    slot.release()
+
+    assert result == expected
+    assert len(seen) == 1
+    np.testing.assert_array_equal(seen[0], frame)
+
+
+def test_ocr_engine_detect_text_batch_scales_each_frame(engine: OCREngine) -> None:
+    import numpy as np
+
+    engine._settings.preprocess_enabled = False
+    small = np.zeros((100, 200, 3), dtype=np.uint8)
+    large = np.zeros((400, 1600, 3), dtype=np.uint8)
+    box = [[10.0, 10.0], [20.0, 10.0], [20.0, 20.0], [10.0, 20.0]]
+    mock_reader = MagicMock()
+    mock_reader.readtext_batched.return_value = [
+        [(box, "small", 0.9), (box, "dropped", 0.1)],
+        [(box, "large", 0.8)],
+    ]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        results = engine.detect_text_batch([small, large], languages=["en"], threshold=0.5)
+
+    batch = mock_reader.readtext_batched.call_args[0][0]
+    assert len({frame.shape for frame in batch}) == 1
+    assert [r.detections[0][1] for r in results] == ["small", "large"]
+    assert len(results[0].detections) == 1
+    assert results[0].detections[0][0][0] == [10.0, 10.0]
+    assert results[1].detections[0][0][0] == [20.0, 20.0]
+
+
+def test_ocr_engine_detect_text_batch_rois_offset_boxes(engine: OCREngine) -> None:
+    import numpy as np
+
+    engine._settings.preprocess_enabled = False
+    frame = np.zeros((200, 300, 3), dtype=np.uint8)
+    box = [[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]]
+    mock_reader = MagicMock()
+    mock_reader.readtext_batched.return_value = [[(box, "a", 0.9)], [(box, "b", 0.9)]]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        results = engine.detect_text_batch(frame, rois=[(0, 0, 50, 50), (100, 40, 200, 90)])
+
+    assert results[0].detections[0][0][0] == [0.0, 0.0]
+    assert results[1].detections[0][0][0] == [100.0, 40.0]
+
+
+def test_ocr_engine_detect_text_batch_chunks_by_batch_size(engine: OCREngine) -> None:
+    import numpy as np
+
+    engine._settings.preprocess_enabled = False
+    engine._settings.ocr_batch_size = 2
+    frames = [np.zeros((10, 10, 3), dtype=np.uint8) for _ in range(5)]
+    mock_reader = MagicMock()
+    mock_reader.readtext_batched.side_effect = lambda batch, **_: [[] for _ in batch]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        results = engine.detect_text_batch(frames)
+
+    assert len(results) == 5
+    assert mock_reader.readtext_batched.call_count == 3
+
+
+def test_ocr_engine_detect_text_batch_failure(engine: OCREngine) -> None:
+    import numpy as np
+
+    frames = [np.zeros((10, 10, 3), dtype=np.uint8)] * 2
+
+    with patch.object(engine, "_get_reader", side_effect=RuntimeError("model error")):
+        results = engine.detect_text_batch(frames)
+
+    assert [r.success for r in results] == [False, False]
+    assert results[0].error == "model error"
+
+
+def test_ocr_engine_tiled_ocr_reads_large_frame_at_full_resolution(engine: OCREngine) -> None:
+    import numpy as np
+
+    engine._settings.preprocess_enabled = False
+    engine._settings.tiled_ocr = True
+    engine._settings.ocr_max_width = 100
+    engine._settings.ocr_tile_overlap = 20
+    engine._settings.ocr_batch_size = 2
+    frame = np.zeros((100, 180, 3), dtype=np.uint8)
+    mock_reader = MagicMock()
+
+    def fake_batched(batch, **_):
+        # Both tiles see the word spanning the seam at x = 80..100; the
+        # left tile also sees a word of its own.
+        assert all(tile.shape[:2] == (100, 100) for tile in batch)
+        left = [([[10, 10], [40, 10], [40, 20], [10, 20]], "left", 0.9)]
+        seam_in_left = [([[80, 50], [100, 50], [100, 60], [80, 60]], "sea", 0.95)]
+        seam_in_right = [([[0, 50], [25, 50], [25, 60], [0, 60]], "seam", 0.9)]
+        return [left + seam_in_left, seam_in_right]
+
+    mock_reader.readtext_batched.side_effect = fake_batched
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        result = engine.detect_text(frame)
+
+    assert mock_reader.readtext_batched.call_count == 1
+    assert [text for _bbox, text, _conf in result.detections] == ["left", "seam"]
+    assert result.detections[1][0][0] == [80.0, 50.0]
+    assert engine.stats()["tiling"] == {"frames": 1, "tiles": 2}
+
+
+def test_ocr_engine_adaptive_width_resizes_and_reports(settings: AppSettings) -> None:
+    import numpy as np
+
+    settings.adaptive_ocr_width = True
+    settings.preprocess_enabled = False
+    engine = OCREngine(settings, start_workers=False)
+    assert engine._width_controller is not None
+    engine._width_controller._width = 640.0
+    box = [[0, 0], [10, 0], [10, 5], [0, 5]]
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = [(box, "hi", 0.9)]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        result = engine.detect_text(np.zeros((300, 800, 3), dtype=np.uint8))
+
+    assert mock_reader.readtext.call_args.args[0].shape[1] == 640
+    assert result.detections[0][0][1] == [12.5, 0.0]
+    stats = engine.stats()["adaptive_width"]
+    assert stats["updates"] == 1
+    assert stats["confidence"] == 0.9
+
+
+def test_ocr_engine_adaptive_width_ignores_model_load_time(settings: AppSettings) -> None:
+    import time
+
+    import numpy as np
+
+    from text_detector.ocr_engine import _OCRRequest
+
+    settings.adaptive_ocr_width = True
+    engine = OCREngine(settings, start_workers=False)
+    assert engine._width_controller is not None
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = []
+
+    def slow_load(languages, times=None):
+        time.sleep(0.3)
+        return mock_reader
+
+    def slow_process_run(frame, languages, threshold, settings):
+        time.sleep(0.3)
+        return DetectionResult(detections=[], languages=["en"], stage_times={"load": 0.3})
+
+    process = MagicMock()
+    process.run.side_effect = slow_process_run
+    request = _OCRRequest(0, np.zeros((4, 4), np.uint8), None, None, None, 0.0)
+    with (
+        patch.object(engine, "_get_reader", side_effect=slow_load),
+        patch.object(engine._width_controller, "update") as update,
+    ):
+        engine.detect_text(np.zeros((100, 200, 3), dtype=np.uint8))
+        engine._run_in_process(process, request)
+
+    assert [call.args[0] < 0.1 for call in update.call_args_list] == [True, True]
+
+
+def test_ocr_engine_fixed_width_without_adaptive(engine: OCREngine) -> None:
+    assert engine.ocr_width == engine._settings.ocr_max_width
+    assert "adaptive_width" not in engine.stats()
+
+
+def test_ocr_engine_tiled_ocr_skips_small_frames(engine: OCREngine) -> None:
+    import numpy as np
+
+    engine._settings.tiled_ocr = True
+    engine._settings.preprocess_enabled = False
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = []
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        engine.detect_text(np.zeros((100, 200, 3), dtype=np.uint8))
+
+    mock_reader.readtext.assert_called_once()
+    mock_reader.readtext_batched.assert_not_called()
+
+
+def test_ocr_engine_detect_text_batch_rejects_rois_with_list(engine: OCREngine) -> None:
+    import numpy as np
+
+    with pytest.raises(ValueError, match="rois"):
+        engine.detect_text_batch([np.zeros((10, 10, 3), dtype=np.uint8)], rois=[(0, 0, 5, 5)])
+
+
+def test_ocr_engine_result_cache_skips_near_duplicate_frames(engine: OCREngine) -> None:
+    import numpy as np
+
+    frame = np.full((120, 160, 3), 128, dtype=np.uint8)
+    noisy = frame.copy()
+    noisy[0, 0] = 131
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = [([[0, 0], [1, 0], [1, 1], [0, 1]], "same", 0.9)]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        first = engine.detect_text(frame, languages=["en"], reuse_similar=True)
+        second = engine.detect_text(noisy, languages=["en"], reuse_similar=True)
+        engine.detect_text(frame, languages=["fr"], reuse_similar=True)
+
+    assert second is first
+    assert mock_reader.readtext.call_count == 2
+    assert engine.stats()["result_cache"]["hits"] == 1
+    assert engine.stats()["result_cache"]["misses"] == 2
+
+
+def test_ocr_engine_result_cache_is_keyed_on_adaptive_width(settings: AppSettings) -> None:
+    import numpy as np
+
+    settings.adaptive_ocr_width = True
+    engine = OCREngine(settings, start_workers=False)
+    assert engine._width_controller is not None
+    frame = np.full((120, 160, 3), 128, dtype=np.uint8)
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = []
+
+    with (
+        patch.object(engine, "_get_reader", return_value=mock_reader),
+        patch.object(engine._width_controller, "update"),
+    ):
+        engine._width_controller._width = 640.0
+        engine.detect_text(frame, reuse_similar=True)
+        engine._width_controller._width = 480.0
+        engine.detect_text(frame, reuse_similar=True)
+        engine.detect_text(frame, reuse_similar=True)
+
+    assert mock_reader.readtext.call_count == 2
+    assert engine.stats()["result_cache"]["hits"] == 1
+
+
+def test_ocr_engine_result_cache_can_be_disabled() -> None:
+    import numpy as np
+
+    engine = OCREngine(AppSettings(result_cache_size=0), start_workers=False)
+    frame = np.zeros((50, 50, 3), dtype=np.uint8)
+    mock_reader = MagicMock()
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        engine.detect_text(frame, reuse_similar=True)
+        engine.detect_text(frame, reuse_similar=True)
+
+    assert mock_reader.readtext.call_count == 2
+    assert "result_cache" not in engine.stats()
+
+
+def test_ocr_engine_result_cache_is_opt_in_per_call(engine: OCREngine) -> None:
+    import numpy as np
+
+    frame = np.zeros((50, 50, 3), dtype=np.uint8)
+    mock_reader = MagicMock()
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        engine.detect_text(frame)
+        engine.detect_text(frame)
+
+    assert mock_reader.readtext.call_count == 2
+
+
+def test_ocr_engine_result_cache_misses_changed_digit(engine: OCREngine) -> None:
+    import cv2
+    import numpy as np
+
+    def price(text: str) -> np.ndarray:
+        frame = np.full((480, 640, 3), 255, dtype=np.uint8)
+        cv2.putText(frame, text, (40, 240), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+        return frame
+
+    mock_reader = MagicMock()
+    mock_reader.readtext.side_effect = [
+        [([[0, 0], [1, 0], [1, 1], [0, 1]], "PRICE 12.99", 0.9)],
+        [([[0, 0], [1, 0], [1, 1], [0, 1]], "PRICE 19.99", 0.9)],
+    ]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        engine.detect_text(price("PRICE 12.99"), reuse_similar=True)
+        second = engine.detect_text(price("PRICE 19.99"), reuse_similar=True)
+
+    assert second.detections[0][1] == "PRICE 19.99"
+    assert mock_reader.readtext.call_count == 2
+
+
+def test_ocr_engine_result_cache_ignores_failures(engine: OCREngine) -> None:
+    import numpy as np
+
+    frame = np.zeros((50, 50, 3), dtype=np.uint8)
+
+    with patch.object(engine, "_get_reader", side_effect=RuntimeError("model error")):
+        engine.detect_text(frame, reuse_similar=True)
+    mock_reader = MagicMock()
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        result = engine.detect_text(frame, reuse_similar=True)
+
+    assert result.success is True
+    assert mock_reader.readtext.call_count == 1
+
+
+def test_ocr_engine_incremental_mode_skips_readtext() -> None:
+    import numpy as np
+
+    settings = AppSettings(incremental_ocr=True, result_cache_size=0, preprocess_enabled=False)
+    engine = OCREngine(settings, start_workers=False)
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    mock_reader = MagicMock()
+    mock_reader.detect.return_value = ([[[0, 50, 0, 20]]], [[]])
+    mock_reader.recognize.return_value = [([[0, 0], [50, 0], [50, 20], [0, 20]], "hi", 0.9)]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        first = engine.detect_text(frame, threshold=0.5)
+        second = engine.detect_text(frame, threshold=0.5)
+
+    mock_reader.readtext.assert_not_called()
+    assert mock_reader.detect.call_count == 1
+    assert mock_reader.recognize.call_count == 1
+    assert first.detections == second.detections
+    assert engine.stats()["incremental"]["reused_boxes"] == 1
+
+
+def _wait_for_preload(engine: OCREngine, timeout: float = 5.0) -> None:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while engine.is_loading and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_ocr_engine_preload_warms_every_slot() -> None:
+    settings = AppSettings(ocr_workers=2, preload_languages=["fr"])
+    engine = OCREngine(settings, start_workers=False)
+    mock_reader = MagicMock()
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader) as mock_get:
+        engine.preload()
+        _wait_for_preload(engine)
+
+    assert engine.preload_progress == (4, 4)
+    assert engine.is_ready(["en"])
+    assert engine.is_ready(["fr"])
+    assert not engine.is_ready(["de"])
+    assert [call.args[0] for call in mock_get.call_args_list] == [["en"], ["en"], ["fr"], ["fr"]]
+    assert mock_reader.readtext.call_count == 4
+
+
+def test_ocr_engine_preload_failure_stops_loading() -> None:
+    engine = OCREngine(AppSettings(), start_workers=False)
+
+    with patch.object(engine, "_get_reader", side_effect=RuntimeError("no model")):
+        engine.preload()
+        _wait_for_preload(engine)
+
+    assert not engine.is_loading
+    assert not engine.is_ready(["en"])
+
+
+def test_ocr_engine_drops_async_frames_while_loading() -> None:
+    import threading
+
+    import numpy as np
+
+    release = threading.Event()
+    mock_reader = MagicMock()
+
+    def slow_reader(languages):
+        release.wait(timeout=5.0)
+        return mock_reader
+
+    frame = np.zeros((4, 4), dtype=np.uint8)
+    with patch.object(OCREngine, "_get_reader", side_effect=slow_reader):
+        engine = OCREngine(AppSettings())
+        assert engine.is_loading
+        assert engine.detect_text_async(frame, languages=["en"]) is False
+        assert engine.stats()["preload"]["dropped_while_loading"] == 1
+
+        release.set()
+        _wait_for_preload(engine)
+        assert engine.is_ready(["en"])
+        assert engine.detect_text_async(frame, languages=["en"]) is True
+        engine.shutdown()
+
+
+def test_ocr_engine_clear_cache_forgets_warm_readers() -> None:
+    engine = OCREngine(AppSettings(), start_workers=False)
+
+    with patch.object(engine, "_get_reader", return_value=MagicMock()):
+        engine.preload()
+        _wait_for_preload(engine)
+    engine.clear_cache()
+
+    assert not engine.is_ready(["en"])
+
+
+def test_worker_process_main_warms_language_sets() -> None:
+    import multiprocessing
+    import threading
+
+    from text_detector.ocr_engine import _worker_process_main
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    settings = AppSettings(ocr_pool_mode="process")
+
+    with patch.object(OCREngine, "warm_up", side_effect=[True, False]):
+        server = threading.Thread(
+            target=_worker_process_main, args=(child_conn, settings, [["en"], ["fr"]])
+        )
+        server.start()
+        messages = [parent_conn.recv() for _ in range(3)]
+        parent_conn.send(None)
+        server.join(timeout=5.0)
+
+    assert messages == [("warm", ["en"]), ("failed", ["fr"]), ("ready", None)]
+
+
+def test_ocr_engine_language_switch_reuses_cached_readers() -> None:
+    engine = OCREngine(AppSettings(), start_workers=False)
+
+    with patch("easyocr.Reader", side_effect=lambda *a, **k: MagicMock()) as mock_reader:
+        english = engine._get_reader(["en"])
+        engine._get_reader(["fr"])
+        assert engine._get_reader(["en"]) is english
+
+    assert mock_reader.call_count == 2
+    readers = engine.stats()["readers"]
+    assert readers["hits"] == 1
+    assert readers["misses"] == 2
+
+
+def test_ocr_engine_gpu_toggle_keeps_cpu_reader() -> None:
+    settings = AppSettings()
+    engine = OCREngine(settings, start_workers=False)
+
+    with patch("easyocr.Reader", side_effect=lambda *a, **k: MagicMock()):
+        cpu_reader = engine._get_reader(["en"])
+        settings.gpu_enabled = True
+        gpu_reader = engine._get_reader(["en"])
+        settings.gpu_enabled = False
+        assert engine._get_reader(["en"]) is cpu_reader
+
+    assert gpu_reader is not cpu_reader
+    assert engine.cache_size == 2
+
+
+def test_ocr_engine_latest_mode_replaces_pending_frame() -> None:
+    import threading
+
+    import numpy as np
+
+    engine = OCREngine(AppSettings(preload_models=False, ocr_queue_mode="latest"))
+    started = threading.Event()
+    release = threading.Event()
+    delivered: list[int] = []
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        started.set()
+        release.wait(timeout=5.0)
+        return DetectionResult(detections=[], languages=[str(int(frame[0, 0]))])
+
+    def on_result(result: DetectionResult) -> None:
+        delivered.append(int(result.languages[0]))
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        assert engine.detect_text_async(np.full((4, 4), 0, np.uint8), callback=on_result)
+        assert started.wait(timeout=5.0)
+        for value in (1, 2):
+            assert engine.detect_text_async(np.full((4, 4), value, np.uint8), callback=on_result)
+        last = engine.submit(np.full((4, 4), 3, np.uint8))
+        release.set()
+        assert last.result(timeout=5.0).languages == ["3"]
+
+    assert delivered == [0]
+    assert engine.replaced_frames == 2
+    assert engine.stats()["queue"]["replaced"] == 2
+    engine.shutdown()
+
+
+def test_ocr_engine_async_result_carries_capture_timestamp(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings)
+    expected = DetectionResult(detections=[], languages=["en"])
+
+    with patch.object(engine, "detect_text", return_value=expected):
+        result = engine.submit(np.zeros((4, 4), np.uint8), captured_at=100.0).result(timeout=5.0)
+
+    assert result.captured_at == 100.0
+    assert result.completed_at is not None
+    assert result.latency == result.completed_at - 100.0
+    assert expected.captured_at is None
+    engine.shutdown()
+
+
+def test_ocr_engine_drop_mode_counts_dropped_frames(settings: AppSettings) -> None:
+    settings.ocr_queue_mode = "drop"
+    engine = OCREngine(settings, start_workers=False)
+    frame = MagicMock()
+
+    assert engine.detect_text_async(frame) is True
+    assert engine.detect_text_async(frame) is False
+
+    assert engine.dropped_frames == 1
+    assert engine.stats()["queue"]["dropped"] == 1
+
+
+def test_ocr_engine_submit_replaced_future_is_cancelled() -> None:
+    import threading
+
+    import numpy as np
+
+    engine = OCREngine(AppSettings(preload_models=False, ocr_queue_mode="latest"))
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        started.set()
+        release.wait(timeout=5.0)
+        return DetectionResult(detections=[], languages=["en"])
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        running = engine.submit(np.zeros((4, 4), np.uint8))
+        assert started.wait(timeout=5.0)
+        waiting = engine.submit(np.zeros((4, 4), np.uint8))
+        newest = engine.submit(np.zeros((4, 4), np.uint8))
+        release.set()
+        assert running.result(timeout=5.0).success
+        assert newest.result(timeout=5.0).success
+
+    assert waiting.cancelled()
+    engine.shutdown()
+
+
+def test_ocr_engine_submit_blocking_waits_for_slot(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings)
+    expected = DetectionResult(detections=[], languages=["en"])
+
+    with patch.object(engine, "detect_text", return_value=expected):
+        futures = [
+            engine.submit(np.zeros((4, 4), np.uint8), block=True, timeout=5.0) for _ in range(5)
+        ]
+        results = [future.result(timeout=5.0) for future in futures]
+
+    assert all(result.success for result in results)
+    assert engine.dropped_frames == 0
+    engine.shutdown()
+
+
+def test_ocr_engine_submit_blocking_times_out(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    engine.submit(np.zeros((4, 4), np.uint8))
+
+    future = engine.submit(np.zeros((4, 4), np.uint8), block=True, timeout=0.05)
+
+    assert future.cancelled()
+    assert engine.dropped_frames == 1
+    engine.shutdown()
+
+
+def test_ocr_engine_blocked_submit_wakes_when_worker_takes_request(settings: AppSettings) -> None:
+    import threading
+
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    engine.submit(np.zeros((4, 4), np.uint8))
+    futures = []
+    submitter = threading.Thread(
+        target=lambda: futures.append(engine.submit(np.zeros((4, 4), np.uint8), block=True))
+    )
+    submitter.start()
+    submitter.join(timeout=0.1)
+    assert submitter.is_alive()
+
+    expected = DetectionResult(detections=[], languages=["en"])
+    with patch.object(engine, "detect_text", return_value=expected):
+        engine._start_workers()
+        submitter.join(timeout=5.0)
+        assert not submitter.is_alive()
+        assert futures[0].result(timeout=5.0).success
+    engine.shutdown()
+
+
+def test_ocr_engine_shutdown_wakes_blocked_submit(settings: AppSettings) -> None:
+    import threading
+
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    engine.submit(np.zeros((4, 4), np.uint8))
+    futures = []
+    submitter = threading.Thread(
+        target=lambda: futures.append(engine.submit(np.zeros((4, 4), np.uint8), block=True))
+    )
+    submitter.start()
+    submitter.join(timeout=0.1)
+
+    engine.shutdown()
+    submitter.join(timeout=5.0)
+
+    assert not submitter.is_alive()
+    assert futures[0].cancelled()
+
+
+def test_ocr_engine_submit_cancelled_by_caller_is_skipped(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    future = engine.submit(np.zeros((4, 4), np.uint8))
+    assert future.cancel()
+
+    with patch.object(engine, "detect_text") as mock_detect:
+        engine._start_workers()
+        engine._work_queue.join()
+
+    mock_detect.assert_not_called()
+    engine.shutdown()
+
+
+def test_ocr_engine_shutdown_cancels_waiting_futures(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    future = engine.submit(np.zeros((4, 4), np.uint8))
+
+    engine.shutdown()
+
+    assert future.cancelled()
+
+
+def test_ocr_engine_detect_text_asyncio_gathers_many_frames() -> None:
+    import asyncio
+
+    import numpy as np
+
+    engine = OCREngine(AppSettings(ocr_workers=2, preload_models=False))
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        return DetectionResult(detections=[], languages=[str(int(frame[0, 0]))])
+
+    async def run_all() -> list[DetectionResult]:
+        frames = [np.full((4, 4), value, np.uint8) for value in range(6)]
+        return await asyncio.gather(*(engine.detect_text_asyncio(frame) for frame in frames))
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        results = asyncio.run(run_all())
+
+    assert sorted(result.languages[0] for result in results) == [str(v) for v in range(6)]
+    engine.shutdown()
+
+
+def test_ocr_engine_detect_text_asyncio_waits_without_executor_threads() -> None:
+    import asyncio
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    engine = OCREngine(AppSettings(preload_models=False))
+    release = threading.Event()
+    seen: list[int] = []
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        release.wait(timeout=5.0)
+        seen.append(int(frame[0, 0]))
+        return DetectionResult(detections=[], languages=["en"])
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        tasks = [
+            asyncio.ensure_future(engine.detect_text_asyncio(np.full((4, 4), value, np.uint8)))
+            for value in range(4)
+        ]
+        await asyncio.sleep(0.2)
+        # The worker holds frame 0 and the queue is full, so this one has to wait.
+        late = np.full((4, 4), 4, np.uint8)
+        tasks.append(asyncio.ensure_future(engine.detect_text_asyncio(late)))
+        await asyncio.sleep(0.05)
+        # Waiting calls hold no executor thread, so unrelated work still runs.
+        assert await asyncio.wait_for(loop.run_in_executor(None, lambda: 42), 1.0) == 42
+        tasks[-1].cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(*tasks[:-1])
+        with pytest.raises(asyncio.CancelledError):
+            await tasks[-1]
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        asyncio.run(run())
+
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert engine.submitted_frames == 4
+    assert not engine._async_waiters
+    engine.shutdown()
+
+
+def test_ocr_engine_result_channel_is_opt_in(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings)
+    expected = DetectionResult(detections=[], languages=["en"])
+
+    with patch.object(engine, "detect_text", return_value=expected):
+        engine.submit(np.zeros((4, 4), np.uint8)).result(timeout=5.0)
+
+    assert engine.get_result(timeout=0.1) is None
+    engine.shutdown()
+
+
+def test_ocr_engine_result_channel_keeps_newest_results() -> None:
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(AppSettings(result_channel_size=2), start_workers=False)
+    for value in range(4):
+        request = _OCRRequest(value, MagicMock(), None, None, None, 0.0)
+        engine._deliver(request, DetectionResult(detections=[], languages=[str(value)]))
+
+    results = [engine.get_result(timeout=0.1) for _ in range(3)]
+    assert [result.languages[0] if result else None for result in results] == ["2", "3", None]
+
+
+def test_ocr_engine_discards_request_past_its_deadline(settings: AppSettings) -> None:
+    import time
+
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    future = engine.submit(
+        np.zeros((4, 4), np.uint8), captured_at=time.monotonic() - 2.0, deadline=1.0
+    )
+
+    with patch.object(engine, "detect_text") as mock_detect:
+        engine._start_workers()
+        engine._work_queue.join()
+
+    mock_detect.assert_not_called()
+    assert future.cancelled()
+    assert engine.stats()["timeouts"]["expired"] == 1
+    engine.shutdown()
+
+
+def test_ocr_engine_watchdog_replaces_hung_thread_worker(settings: AppSettings) -> None:
+    import threading
+    import time
+
+    import numpy as np
+
+    engine = OCREngine(settings)
+    started = threading.Event()
+    release = threading.Event()
+    expected = DetectionResult(detections=[], languages=["en"])
+    calls = []
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        calls.append(threading.current_thread())
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=5.0)
+        return expected
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        hung = engine.submit(np.zeros((4, 4), np.uint8))
+        assert started.wait(timeout=5.0)
+        assert engine._check_hung_workers(now=time.monotonic()) == 0
+
+        assert engine._check_hung_workers(now=time.monotonic() + 1000) == 1
+        result = hung.result(timeout=5.0)
+        assert not engine.is_busy
+        assert engine.submit(np.zeros((4, 4), np.uint8)).result(timeout=5.0).success
+        release.set()
+
+    assert not result.success
+    assert "timed out" in (result.error or "")
+    assert calls[0] is not calls[1]
+    assert engine.stats()["timeouts"]["hung"] == 1
+    engine.shutdown()
+
+
+def test_ocr_engine_watchdog_can_be_disabled() -> None:
+    import time
+
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(AppSettings(ocr_hang_timeout_ms=0), start_workers=False)
+    engine._running_requests[0] = _OCRRequest(0, MagicMock(), None, None, None, 0.0, started_at=0.0)
+
+    assert engine._check_hung_workers(now=time.monotonic() + 1000) == 0
+
+
+def test_ocr_engine_cancel_running_request_kills_process_worker() -> None:
+    from concurrent.futures import Future
+
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(AppSettings(ocr_pool_mode="process"), start_workers=False)
+    future: Future[DetectionResult] = Future()
+    request = _OCRRequest(0, MagicMock(), None, None, None, 0.0, future)
+    engine._work_queue.put_nowait(request)
+    engine._work_queue.get_nowait()
+    engine._running_requests[0] = request
+    engine._active = 1
+    process = MagicMock()
+    engine._processes[0] = process
+    engine._worker_threads.append(MagicMock())
+
+    with patch.object(engine, "_start_worker") as mock_start:
+        assert engine.cancel(future)
+
+    process.kill.assert_called_once()
+    mock_start.assert_called_once_with(0, [])
+    assert future.cancelled()
+    assert engine.stats()["timeouts"]["cancelled_running"] == 1
+
+
+def test_ocr_engine_cancel_running_thread_request_discards_result(settings: AppSettings) -> None:
+    import threading
+    from concurrent.futures import wait
+
+    import numpy as np
+
+    engine = OCREngine(settings)
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_detect(frame, languages=None, threshold=None, reuse_similar=False):
+        started.set()
+        release.wait(timeout=5.0)
+        return DetectionResult(detections=[], languages=["en"])
+
+    with patch.object(engine, "detect_text", side_effect=fake_detect):
+        future = engine.submit(np.zeros((4, 4), np.uint8))
+        assert started.wait(timeout=5.0)
+        assert engine.cancel(future)
+        release.set()
+        done, _pending = wait([future], timeout=5.0)
+        after = engine.submit(np.zeros((4, 4), np.uint8))
+        after.result(timeout=5.0)
+
+    assert done == {future}
+    assert future.cancelled()
+    assert not engine.cancel(after)
+    assert engine.stats()["timeouts"]["cancelled_running"] == 0
+    engine.shutdown()
+
+
+def test_ocr_engine_reports_tail_latency(settings: AppSettings) -> None:
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(settings, start_workers=False)
+    assert engine.stats()["latency"]["streaming"] == {"samples": 0}
+
+    with patch("text_detector.ocr_engine.time.monotonic", return_value=10.0):
+        for value in range(100):
+            request = _OCRRequest(value, MagicMock(), None, None, None, 10.0 - value / 1000)
+            engine._deliver(request, DetectionResult(detections=[], languages=["en"]))
+
+    latency = engine.stats()["latency"]["streaming"]
+    assert engine.stats()["latency"]["interactive"] == {"samples": 0}
+    assert latency["samples"] == 100
+    assert latency["p50_ms"] == pytest.approx(49.5)
+    assert latency["p99_ms"] == pytest.approx(98.0, abs=0.1)
+    assert latency["max_ms"] == pytest.approx(99.0)
+
+
+def test_ocr_engine_interactive_request_evicts_waiting_streaming_frame(
+    settings: AppSettings,
+) -> None:
+    import numpy as np
+
+    settings.ocr_queue_mode = "drop"
+    engine = OCREngine(settings, start_workers=False)
+    streaming = engine.submit(np.zeros((4, 4), np.uint8))
+    assert not engine.has_room()
+    assert engine.has_room("interactive")
+
+    interactive = engine.submit(np.zeros((4, 4), np.uint8), priority="interactive")
+
+    assert streaming.cancelled()
+    assert not interactive.done()
+    assert engine.stats()["queue"]["evicted"] == 1
+    assert not engine.has_room("interactive")
+    engine.shutdown()
+
+
+def test_ocr_engine_streaming_frame_never_replaces_interactive_request(
+    settings: AppSettings,
+) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    interactive = engine.submit(np.zeros((4, 4), np.uint8), priority="interactive")
+
+    streaming = engine.submit(np.zeros((4, 4), np.uint8))
+
+    assert streaming.cancelled()
+    assert not interactive.done()
+    assert engine.replaced_frames == 0
+    engine.shutdown()
+
+
+def test_ocr_engine_serves_interactive_requests_first() -> None:
+    import numpy as np
+
+    engine = OCREngine(AppSettings(preload_models=False, ocr_workers=2), start_workers=False)
+    engine.submit(np.zeros((4, 4), np.uint8), languages=["fr"])
+    engine.submit(np.zeros((4, 4), np.uint8), languages=["de"], priority="interactive")
+
+    order = [engine._work_queue.get_nowait().priority for _ in range(2)]
+
+    assert order == ["interactive", "streaming"]
+
+
+def test_ocr_engine_delivers_each_priority_class_in_its_own_order(
+    settings: AppSettings,
+) -> None:
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(settings, start_workers=False)
+    delivered: list[DetectionResult] = []
+    streaming = _OCRRequest(0, MagicMock(), None, None, delivered.append, 0.0)
+    interactive = _OCRRequest(
+        0, MagicMock(), None, None, delivered.append, 0.0, priority="interactive"
+    )
+    later_streaming = _OCRRequest(1, MagicMock(), None, None, delivered.append, 0.0)
+
+    engine._complete(later_streaming, DetectionResult(detections=[], languages=["s1"]))
+    engine._complete(interactive, DetectionResult(detections=[], languages=["i0"]))
+    assert [result.languages[0] for result in delivered] == ["i0"]
+
+    engine._complete(streaming, DetectionResult(detections=[], languages=["s0"]))
+    assert [result.languages[0] for result in delivered] == ["i0", "s0", "s1"]
+
+
+def test_ocr_engine_rejects_unknown_priority(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    with pytest.raises(ValueError, match="priority"):
+        engine.submit(np.zeros((4, 4), np.uint8), priority="urgent")
+
+
+def test_ocr_engine_times_each_pipeline_stage(engine: OCREngine) -> None:
+    import numpy as np
+
+    mock_reader = MagicMock()
+    mock_reader.readtext.return_value = [([[0, 0], [1, 0], [1, 1], [0, 1]], "hi", 0.9)]
+
+    with patch.object(engine, "_get_reader", return_value=mock_reader):
+        result = engine.detect_text(np.zeros((100, 200, 3), dtype=np.uint8))
+
+    stages = {"resize", "preprocess", "inference", "filter", "scale"}
+    assert set(result.stage_times) == stages
+    stats = engine.stats()["stages"]
+    assert stages <= set(stats)
+    assert stats["inference"]["count"] == 1
+    assert "p99_ms" in stats["inference"]
+
+
+def test_ocr_engine_times_model_load(settings: AppSettings) -> None:
+    import numpy as np
+
+    engine = OCREngine(settings, start_workers=False)
+    with patch("text_detector.ocr_engine.load_backend", return_value=MagicMock()):
+        result = engine.detect_text(np.zeros((10, 10, 3), dtype=np.uint8))
+
+    assert "load" in result.stage_times
+    assert engine.stats()["stages"]["load"]["count"] == 1
+
+
+def test_ocr_engine_records_stage_times_from_process_worker() -> None:
+    import numpy as np
+
+    from text_detector.ocr_engine import _OCRRequest
+
+    engine = OCREngine(
+        AppSettings(ocr_pool_mode="process", result_cache_size=0), start_workers=False
+    )
+    process = MagicMock()
+    process.run.return_value = DetectionResult(
+        detections=[], languages=["en"], stage_times={"inference": 0.25}
+    )
+    request = _OCRRequest(0, np.zeros((4, 4), np.uint8), None, None, None, 0.0)
+
+    engine._run_in_process(process, request)
+
+    assert engine.stats()["stages"]["inference"]["max_ms"] == 250.0
+
+
+def test_ocr_engine_prometheus_text_and_metrics_file(settings: AppSettings, tmp_path) -> None:
+    import numpy as np
+
+    settings.ocr_queue_mode = "latest"
+    engine = OCREngine(settings, start_workers=False)
+    engine.submit(np.zeros((4, 4), np.uint8))
+    engine.submit(np.zeros((4, 4), np.uint8))
+    engine._metrics.record("inference", 0.1)
+
+    path = tmp_path / "ocr.prom"
+    engine.write_metrics(path)
+    text = path.read_text()
+
+    assert 'text_detector_ocr_requests_total{outcome="submitted"} 2' in text
+    assert 'text_detector_ocr_requests_total{outcome="replaced"} 1' in text
+    assert 'text_detector_ocr_stage_seconds_count{stage="inference"} 1' in text
+    assert 'text_detector_ocr_result_cache_total{result="hit"} 0' in text
+    assert engine.stats()["queue"]["submitted"] == 2
+    engine.shutdown()
@@ -0,0 +1,171 @@
+"""Tests for the sampling profiler."""
+
+import json
+import threading
+
+import pytest
+
+from text_detector.__main__ import main
+from text_detector.profiler import (
+    PROFILE_ENV,
+    PROFILE_RATE_ENV,
+    SamplingProfiler,
+    _thread_matches,
+    profiler_from_options,
+)
+
+# Other tests may leave OCR engine threads behind, so the sampled worker
+# gets a name of its own.
+WORKER = "sampled-worker"
+
+
+def detect_text_stand_in(ready: threading.Event, stop: threading.Event) -> None:
+    ready.set()
+    stop.wait()
+
+
+@pytest.fixture
+def worker():
+    """Run a numbered worker thread parked in a known function."""
+    ready, stop = threading.Event(), threading.Event()
+    thread = threading.Thread(
+        target=detect_text_stand_in, args=(ready, stop), name=f"{WORKER}-1", daemon=True
+    )
+    thread.start()
+    ready.wait()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_samples_are_attributed_to_the_selected_threads(worker):
+    """Test that stacks are kept per thread name and unselected threads are skipped."""
+    other = threading.Event()
+    bystander = threading.Thread(target=other.wait, name="ocr-watchdog", daemon=True)
+    bystander.start()
+    profiler = SamplingProfiler(threads=("MainThread", WORKER))
+
+    profiler.sample()
+    profiler.sample()
+    other.set()
+
+    assert profiler.stats()["threads"] == {"MainThread": 2, f"{WORKER}-1": 2}
+    lines = profiler.collapsed().splitlines()
+    worker_line = next(line for line in lines if line.startswith(f"{WORKER}-1;"))
+    assert "detect_text_stand_in (test_profiler.py:" in worker_line
+    assert worker_line.endswith(" 2")
+    # Outermost call first, as flame graph tools expect.
+    assert worker_line.index("_bootstrap") < worker_line.index("detect_text_stand_in")
+
+
+def test_speedscope_output_has_one_profile_per_thread(worker):
+    """Test the speedscope document layout and sample weights."""
+    profiler = SamplingProfiler(rate=50, threads=(WORKER,))
+    profiler.sample()
+
+    document = profiler.speedscope()
+
+    assert [p["name"] for p in document["profiles"]] == [f"{WORKER}-1"]
+    profile = document["profiles"][0]
+    assert profile["weights"] == [0.02]
+    names = [document["shared"]["frames"][i]["name"] for i in profile["samples"][0]]
+    assert names[-1] == "wait"
+    assert "detect_text_stand_in" in names
+
+
+def test_dump_picks_the_format_from_the_suffix(worker, tmp_path):
+    """Test that .json writes speedscope and other suffixes collapsed stacks."""
+    profiler = SamplingProfiler(threads=(WORKER,), output=tmp_path / "profile.txt")
+    profiler.sample()
+
+    profiler.dump()
+    profiler.dump(tmp_path / "profile.json")
+
+    assert (tmp_path / "profile.txt").read_text().startswith(f"{WORKER}-1;")
+    assert json.loads((tmp_path / "profile.json").read_text())["profiles"]
+
+
+def test_default_threads_match_the_gui_and_numbered_ocr_workers():
+    """Test the default thread selection."""
+    profiler = SamplingProfiler()
+
+    for name in ("MainThread", "capture", "ocr-worker", "ocr-worker-3"):
+        assert _thread_matches(name, profiler.threads)
+    for name in ("ocr-watchdog", "ocr-workers", "profiler"):
+        assert not _thread_matches(name, profiler.threads)
+    assert _thread_matches("anything", None)
+
+
+def test_dump_without_a_path_raises():
+    """Test that dumping needs either an argument or a default output."""
+    with pytest.raises(ValueError):
+        SamplingProfiler().dump()
+
+
+def test_background_sampling_and_requested_dump(worker, tmp_path):
+    """Test that the sampler thread collects samples and writes on request."""
+    output = tmp_path / "profile.txt"
+    profiler = SamplingProfiler(rate=500, threads=(WORKER,), output=output)
+
+    profiler.start()
+    profiler.request_dump()
+    for _ in range(200):
+        if output.exists():
+            break
+        threading.Event().wait(0.01)
+    profiler.stop()
+
+    assert not profiler.running
+    assert output.exists()
+    assert profiler.stats()["samples"] >= 1
+    # The sampler never samples itself.
+    assert "profiler" not in profiler.stats()["threads"]
+
+
+def test_invalid_rate_raises():
+    """Test that a non-positive rate is rejected."""
+    with pytest.raises(ValueError):
+        SamplingProfiler(rate=0)
+
+
+def test_profiler_from_options_reads_the_environment(monkeypatch, tmp_path):
+    """Test that options win over the environment and profiling is off by default."""
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    assert profiler_from_options() is None
+
+    monkeypatch.setenv(PROFILE_ENV, str(tmp_path / "env.json"))
+    monkeypatch.setenv(PROFILE_RATE_ENV, "20")
+    profiler = profiler_from_options()
+    assert profiler.output == tmp_path / "env.json"
+    assert profiler.rate == 20
+
+    profiler = profiler_from_options(str(tmp_path / "cli.txt"), 5)
+    assert profiler.output == tmp_path / "cli.txt"
+    assert profiler.rate == 5
+
+    monkeypatch.setenv(PROFILE_RATE_ENV, "fast")
+    assert profiler_from_options().rate == 100
+    monkeypatch.setenv(PROFILE_RATE_ENV, "0")
+    assert profiler_from_options().rate == 100
+    assert profiler_from_options(rate=-5).rate == 100
+
+
+@pytest.mark.parametrize("rate", ["0", "-10", "nan", "inf", "fast"])
+def test_cli_rejects_invalid_profile_rates(rate, capsys):
+    """Test that --profile-rate must be a positive number."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--profile", "out.txt", "--profile-rate", rate, "batch", "scans"])
+
+    assert exc_info.value.code == 2
+    assert "--profile-rate" in capsys.readouterr().err
+
+
+def test_main_writes_the_profile_on_exit(monkeypatch, tmp_path):
+    """Test that --profile samples the run and writes the file even on sys.exit."""
+    monkeypatch.setattr("text_detector.__main__.run_batch", lambda args: 0)
+    output = tmp_path / "batch.txt"
+
+    with pytest.raises(SystemExit):
+        main(["--profile", str(output), "--profile-rate", "1000", "batch", str(tmp_path)])
+
+    assert output.exists()
@@ -0,0 +1,127 @@
+"""Tests for the memory-budgeted reader cache."""
+
+from unittest.mock import MagicMock
+
+from text_detector.reader_cache import (
+    FALLBACK_READER_BYTES,
+    ReaderCache,
+    estimate_reader_bytes,
+)
+
+MB = 1024 * 1024
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(max_mb: int = 250, idle_ttl: float = 0.0, clock: FakeClock | None = None) -> ReaderCache:
+    return ReaderCache(
+        max_bytes=max_mb * MB,
+        idle_ttl=idle_ttl,
+        size_of=lambda reader: 100 * MB,
+        clock=clock or FakeClock(),
+    )
+
+
+def test_reader_cache_hit_skips_loader():
+    """Test that a second lookup returns the cached reader."""
+    cache = _cache()
+    loader = MagicMock(return_value="reader")
+
+    assert cache.get("en", loader) == "reader"
+    assert cache.get("en", loader) == "reader"
+
+    assert loader.call_count == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_reader_cache_evicts_least_recently_used_over_budget():
+    """Test that the least recently used reader goes when the budget is exceeded."""
+    cache = _cache(max_mb=250)
+    cache.get("en", lambda: "en-reader")
+    cache.get("fr", lambda: "fr-reader")
+    cache.get("en", lambda: "unused")
+
+    cache.get("de", lambda: "de-reader")
+
+    assert "en" in cache
+    assert "de" in cache
+    assert "fr" not in cache
+    assert cache.evictions == 1
+    assert cache.resident_bytes == 200 * MB
+
+
+def test_reader_cache_keeps_new_reader_larger_than_budget():
+    """Test that a reader bigger than the whole budget is still kept."""
+    cache = _cache(max_mb=50)
+
+    cache.get("en", lambda: "reader")
+
+    assert len(cache) == 1
+
+
+def test_reader_cache_evicts_idle_readers():
+    """Test that readers unused for longer than the TTL are dropped."""
+    clock = FakeClock()
+    cache = _cache(idle_ttl=60.0, clock=clock)
+    cache.get("en", lambda: "en-reader")
+    clock.now = 30.0
+    cache.get("fr", lambda: "fr-reader")
+
+    clock.now = 70.0
+    assert cache.evict_idle() == 1
+
+    assert "en" not in cache
+    assert "fr" in cache
+
+
+def test_reader_cache_idle_ttl_zero_never_expires():
+    """Test that a TTL of zero disables idle eviction."""
+    clock = FakeClock()
+    cache = _cache(idle_ttl=0.0, clock=clock)
+    cache.get("en", lambda: "en-reader")
+
+    clock.now = 1e6
+
+    assert cache.evict_idle() == 0
+    assert "en" in cache
+
+
+def test_reader_cache_stats():
+    """Test that stats report counters, load time and resident size."""
+    cache = _cache()
+    cache.get("en", lambda: "reader")
+    cache.get("en", lambda: "reader")
+
+    stats = cache.stats()
+
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["resident_mb"] == 100.0
+    assert stats["size"] == 1
+    assert stats["load_seconds"] >= 0.0
+
+
+def test_estimate_reader_bytes_sums_model_tensors():
+    """Test that the estimate adds up detector and recognizer tensors."""
+    tensor = MagicMock()
+    tensor.numel.return_value = 1000
+    tensor.element_size.return_value = 4
+    reader = MagicMock()
+    reader.detector.parameters.return_value = [tensor, tensor]
+    reader.detector.buffers.return_value = []
+    reader.recognizer.parameters.return_value = [tensor]
+    reader.recognizer.buffers.return_value = [tensor]
+
+    assert estimate_reader_bytes(reader) == 16000
+
+
+def test_estimate_reader_bytes_falls_back_without_models():
+    """Test that readers without torch modules use the fallback size."""
+    assert estimate_reader_bytes(object()) == FALLBACK_READER_BYTES
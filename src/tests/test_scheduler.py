@@ -0,0 +1,75 @@
+"""Tests for the time-based OCR scheduler."""
+
+from text_detector.config import AppSettings
+from text_detector.scheduler import OCRScheduler
+
+
+def test_idle_engine_is_due_immediately():
+    """Test that a frame is submitted whenever a worker is free."""
+    scheduler = OCRScheduler()
+    assert scheduler.due(now=0.0, in_flight=0) is True
+
+
+def test_busy_engine_waits_until_worker_is_about_to_finish():
+    """Test that the next frame is queued one service time after the last, minus the lead."""
+    scheduler = OCRScheduler(lead=0.05)
+    scheduler.completed(0.5, now=0.0)
+    scheduler.submitted(now=1.0)
+
+    assert scheduler.due(now=1.2, in_flight=1) is False
+    assert scheduler.due(now=1.46, in_flight=1) is True
+
+
+def test_never_queues_more_than_one_frame_behind_the_workers():
+    """Test that a frame already waiting blocks further submissions."""
+    scheduler = OCRScheduler()
+    scheduler.completed(0.1, now=0.0)
+    scheduler.submitted(now=1.0)
+
+    assert scheduler.due(now=5.0, in_flight=2) is False
+    assert scheduler.due(now=5.0, in_flight=2, capacity=2) is True
+
+
+def test_cpu_budget_leaves_worker_idle_between_runs():
+    """Test that a 25% budget idles three service times after each run."""
+    scheduler = OCRScheduler(cpu_budget=0.25)
+    scheduler.submitted(now=0.0)
+    scheduler.completed(0.2, now=0.2)
+
+    assert scheduler.due(now=0.7, in_flight=0) is False
+    assert scheduler.due(now=0.81, in_flight=0) is True
+    # With a partial budget nothing is queued behind a running frame.
+    assert scheduler.due(now=5.0, in_flight=1) is False
+
+
+def test_min_interval_caps_submission_rate():
+    """Test that submissions are spaced by at least the minimum interval."""
+    scheduler = OCRScheduler(min_interval=0.5)
+    scheduler.submitted(now=0.0)
+
+    assert scheduler.due(now=0.3, in_flight=0) is False
+    assert scheduler.due(now=0.5, in_flight=0) is True
+
+
+def test_skipped_opportunity_waits_one_service_time():
+    """Test that an unused opportunity is not retried on every tick."""
+    scheduler = OCRScheduler()
+    scheduler.completed(0.4, now=0.0)
+
+    scheduler.skipped(now=1.0)
+
+    assert scheduler.due(now=1.2, in_flight=0) is False
+    assert scheduler.due(now=1.4, in_flight=0) is True
+
+
+def test_from_settings_and_reset():
+    """Test that settings map onto the scheduler and reset clears its timers."""
+    scheduler = OCRScheduler.from_settings(AppSettings(ocr_cpu_budget=50, ocr_min_interval_ms=100))
+    assert scheduler.cpu_budget == 0.5
+    assert scheduler.min_interval == 0.1
+
+    scheduler.submitted(now=0.0)
+    scheduler.completed(1.0, now=1.0)
+    scheduler.reset()
+
+    assert scheduler.due(now=1.0, in_flight=0) is True
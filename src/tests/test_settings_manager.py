@@ -17,18 +17,58 @@ class TestSettingsManager:
                 default_language="fr",
                 default_confidence=0.5,
                 gpu_enabled=True,
-                frame_skip=10,
+                ocr_cpu_budget=50,
+                ocr_deadline_ms=500,
+                ocr_min_interval_ms=200,
                 ocr_max_width=1024,
                 paragraph_merge=True,
+                ocr_workers=4,
+                ocr_pool_mode="process",
             )
             manager.save(settings)
             loaded = manager.load()
             assert loaded.default_language == "fr"
             assert loaded.default_confidence == 0.5
             assert loaded.gpu_enabled is True
-            assert loaded.frame_skip == 10
+            assert loaded.ocr_cpu_budget == 50
+            assert loaded.ocr_deadline_ms == 500
+            assert loaded.ocr_min_interval_ms == 200
             assert loaded.ocr_max_width == 1024
             assert loaded.paragraph_merge is True
+            assert loaded.ocr_workers == 4
+            assert loaded.ocr_pool_mode == "process"
+
+    def test_save_and_load_reader_cache_settings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "settings.json"
+            manager = SettingsManager(path)
+            manager.save(AppSettings(reader_cache_max_mb=512, reader_idle_ttl=60.0))
+            loaded = manager.load()
+            assert loaded.reader_cache_max_mb == 512
+            assert loaded.reader_idle_ttl == 60.0
+
+    def test_save_and_load_backend_settings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "settings.json"
+            manager = SettingsManager(path)
+            manager.save(AppSettings(ocr_backend="onnx", onnx_model_dir="/models"))
+            loaded = manager.load()
+            assert loaded.ocr_backend == "onnx"
+            assert loaded.onnx_model_dir == "/models"
+
+    def test_save_and_load_capture_settings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "settings.json"
+            manager = SettingsManager(path)
+            manager.save(
+                AppSettings(
+                    capture_width=1280, capture_height=720, capture_fps=30, capture_fourcc="MJPG"
+                )
+            )
+            loaded = manager.load()
+            assert (loaded.capture_width, loaded.capture_height) == (1280, 720)
+            assert loaded.capture_fps == 30
+            assert loaded.capture_fourcc == "MJPG"
 
     def test_load_missing_file_returns_defaults(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -63,6 +103,18 @@ class TestSettingsManager:
             settings = manager.load()
             assert settings.default_language == "de"
 
+    def test_load_falls_back_to_given_defaults(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "settings.json"
+            defaults = AppSettings(ocr_queue_mode="latest")
+            manager = SettingsManager(path, defaults=defaults)
+            assert manager.load().ocr_queue_mode == "latest"
+            manager.save(AppSettings(ocr_queue_mode="drop"))
+            assert manager.load().ocr_queue_mode == "drop"
+            assert defaults.ocr_queue_mode == "latest"
+            path.write_text("not json")
+            assert manager.load().ocr_queue_mode == "latest"
+
     def test_reset_deletes_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "settings.json"
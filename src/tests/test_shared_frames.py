@@ -0,0 +1,94 @@
+"""Tests for shared-memory frame slots."""
+
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+
+import numpy as np
+import pytest
+
+from text_detector.shared_frames import FrameHeader, FrameReader, FrameSlot
+
+
+@pytest.fixture
+def slot():
+    """Yield a frame slot and remove its segment afterwards."""
+    frame_slot = FrameSlot()
+    yield frame_slot
+    frame_slot.release()
+
+
+def test_frame_round_trips_without_pickling(slot):
+    """Test that a non-contiguous crop arrives intact with shape and dtype."""
+    frame = np.arange(40 * 60 * 3, dtype=np.uint8).reshape(40, 60, 3)
+    crop = frame[5:25, 10:50]
+    reader = FrameReader()
+
+    header = slot.write(crop)
+    received = reader.read(header)
+
+    assert header[1:] == ((20, 40, 3), "|u1")
+    np.testing.assert_array_equal(received, crop)
+    del received
+    reader.close()
+
+
+def test_segment_is_reused_and_grows_for_larger_frames(slot):
+    """Test that the segment is kept for frames that fit and replaced otherwise."""
+    reader = FrameReader()
+    small_name = slot.write(np.zeros((480, 640, 3), dtype=np.uint8))[0]
+    assert slot.write(np.ones((240, 320, 3), dtype=np.uint8))[0] == small_name
+    assert slot.size == 1 << 20
+
+    header = slot.write(np.full((1080, 1920, 3), 7, dtype=np.uint8))
+    frame = reader.read(header)
+
+    assert header[0] != small_name
+    assert slot.size >= 1080 * 1920 * 3
+    assert frame[-1, -1, -1] == 7
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=small_name)
+    del frame
+    reader.close()
+
+
+def test_release_removes_the_segment(slot):
+    """Test that a released slot can no longer be attached and can be written again."""
+    name = slot.write(np.zeros((2, 2), dtype=np.float32))[0]
+
+    slot.release()
+    slot.release()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+    assert slot.size == 0
+    assert slot.write(np.zeros((2, 2), dtype=np.float32))[0] != name
+
+
+def _sum_frames(conn: Connection) -> None:
+    reader = FrameReader()
+    while (header := conn.recv()) is not None:
+        frame = reader.read(header)
+        conn.send(int(frame.sum(dtype=np.int64)))
+        del frame
+    reader.close()
+
+
+def test_frames_cross_into_a_spawned_process(slot):
+    """Test that a child process reads frames in place, including after the slot grows."""
+    ctx = multiprocessing.get_context("spawn")
+    conn, child_conn = ctx.Pipe()
+    process = ctx.Process(target=_sum_frames, args=(child_conn,), daemon=True)
+    process.start()
+    sums = []
+    try:
+        for shape in ((120, 160, 3), (120, 160, 3), (720, 1280, 3)):
+            header: FrameHeader = slot.write(np.ones(shape, dtype=np.uint8))
+            conn.send(header)
+            sums.append(conn.recv())
+        conn.send(None)
+    finally:
+        process.join(timeout=10.0)
+
+    assert sums == [120 * 160 * 3, 120 * 160 * 3, 720 * 1280 * 3]
+    assert process.exitcode == 0
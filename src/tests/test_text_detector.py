@@ -1,7 +1,7 @@
 """Tests for TextRecognitionApp UI improvements."""
 
 import tkinter as tk
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -68,25 +68,26 @@ class TestToggleCapture:
             mock_stop.assert_called_once()
 
 
-class TestFrameSkipSlider:
-    def test_frame_skip_changed_updates_label(self, app):
-        app.frame_skip_var.set(5)
-        app._frame_skip_changed("5")
-        assert app.frame_skip_label.cget("text") == "Every 5 frames"
+class TestCpuBudgetSlider:
+    def test_cpu_budget_changed_updates_label(self, app):
+        app.cpu_budget_var.set(50)
+        app._cpu_budget_changed("50")
+        assert app.cpu_budget_label.cget("text") == "50%"
 
-    def test_frame_skip_changed_updates_setting(self, app):
-        app.frame_skip_var.set(10)
-        app._frame_skip_changed("10")
+    def test_cpu_budget_changed_updates_setting_and_scheduler(self, app):
+        app.cpu_budget_var.set(30)
+        app._cpu_budget_changed("30")
         from text_detector.config import SETTINGS
-        assert SETTINGS.frame_skip == 10
+        assert SETTINGS.ocr_cpu_budget == 30
+        assert app.ocr_scheduler.cpu_budget == 0.3
 
-    def test_frame_skip_var_initialized_from_settings(self, app):
+    def test_cpu_budget_var_initialized_from_settings(self, app):
         from text_detector.config import SETTINGS
-        assert app.frame_skip_var.get() == SETTINGS.frame_skip
+        assert app.cpu_budget_var.get() == SETTINGS.ocr_cpu_budget
 
-    def test_frame_skip_scale_has_correct_range(self, app):
-        assert app.frame_skip_scale.cget("from") == 1
-        assert app.frame_skip_scale.cget("to") == 60
+    def test_cpu_budget_scale_has_correct_range(self, app):
+        assert app.cpu_budget_scale.cget("from") == 10
+        assert app.cpu_budget_scale.cget("to") == 100
 
 
 class TestPasteImageFromClipboard:
@@ -205,3 +206,225 @@ class TestROISelection:
         app.current_frame = None
         result = app._get_cropped_frame()
         assert result is None
+
+
+class TestMotionGate:
+    def test_should_run_ocr_skips_while_engine_busy(self, app):
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        SETTINGS.ocr_queue_mode = "drop"
+        with patch.object(type(app.engine), "is_busy", new=True):
+            assert app._should_run_ocr() is False
+
+    def test_should_run_ocr_replaces_pending_frame_in_latest_mode(self, app):
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        SETTINGS.ocr_queue_mode = "latest"
+        with patch.object(type(app.engine), "is_busy", new=True):
+            assert app._should_run_ocr() is True
+
+    def test_refused_frame_does_not_consume_scene_change(self, app):
+        import numpy as np
+
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        app.capture_active = True
+        app.capture = MagicMock()
+        app.capture.latest.return_value = (np.zeros((48, 64, 3), dtype=np.uint8), 1.0)
+        with (
+            patch.object(app.engine, "detect_text_async", return_value=False),
+            patch.object(app.root, "after"),
+        ):
+            app.update_frame()
+        assert app.motion_gate.triggered == 0
+        assert app.motion_gate.should_run() is True
+        app.capture = None
+
+    def test_update_frame_takes_the_latest_captured_frame(self, app):
+        import numpy as np
+
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        app.capture_active = True
+        app.capture = MagicMock()
+        app.capture.latest.return_value = (frame, 12.5)
+        with patch.object(app, "_schedule_ocr"), patch.object(app.root, "after"):
+            app.update_frame()
+        assert app.current_frame is frame
+        assert app._frame_time == 12.5
+        app.capture.request_frame.assert_called_once()
+        app.capture = None
+
+    def test_update_frame_releases_the_replaced_frame(self, app):
+        import numpy as np
+
+        previous = np.zeros((48, 64, 3), dtype=np.uint8)
+        app.current_frame = previous
+        app.capture_active = True
+        app.capture = MagicMock()
+        app.capture.latest.return_value = (np.ones((48, 64, 3), dtype=np.uint8), 1.0)
+        with patch.object(app, "_schedule_ocr"), patch.object(app.root, "after"):
+            app.update_frame()
+        app.capture.release.assert_called_once_with(previous)
+        app.capture = None
+
+    def test_streaming_ocr_gets_its_own_copy_of_the_frame(self, app):
+        import numpy as np
+
+        frame = np.full((48, 64, 3), 7, dtype=np.uint8)
+        app.current_frame = frame
+        app.capture_active = True
+        with (
+            patch.object(app, "_engine_saturated", return_value=False),
+            patch.object(app.engine, "detect_text_async", return_value=True) as submit,
+        ):
+            assert app._process_current_frame()
+        submitted = submit.call_args.args[0]
+        assert not np.shares_memory(submitted, frame)
+        np.testing.assert_array_equal(submitted, frame)
+        app.capture_active = False
+
+    def test_update_frame_skips_decoding_until_ocr_is_due(self, app):
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = False
+        SETTINGS.box_tracking = False
+        app.capture_active = True
+        app.capture = MagicMock()
+        app.capture.latest.return_value = None
+        with (
+            patch.object(app.ocr_scheduler, "due", return_value=False),
+            patch.object(app.root, "after"),
+        ):
+            app.update_frame()
+        app.capture.request_frame.assert_not_called()
+        SETTINGS.motion_gate_enabled = True
+        SETTINGS.box_tracking = True
+        app.capture = None
+
+    def test_update_frame_decodes_for_the_motion_gate_at_a_lower_rate(self, app):
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        SETTINGS.box_tracking = True
+        app.capture_active = True
+        app.capture = MagicMock()
+        app.capture.latest.return_value = None
+        with (
+            patch.object(app.ocr_scheduler, "due", return_value=False),
+            patch.object(app.root, "after"),
+        ):
+            for _ in range(9):
+                app.update_frame()
+        assert app.capture.request_frame.call_count == 3
+        app.capture = None
+
+    def test_stats_label_reports_saved_runs(self, app):
+        from text_detector.config import SETTINGS
+
+        SETTINGS.motion_gate_enabled = True
+        app.motion_gate.saved = 7
+        app._update_stats_label()
+        assert "7" in app.fps_label.cget("text")
+
+    def test_stats_label_reports_adaptive_width(self, app):
+        adaptive = {"width": 640, "latency_ms": 212.0}
+        stats = {"adaptive_width": adaptive, "timeouts": {"expired": 0, "hung": 0}}
+        with patch.object(app.engine, "stats", return_value=stats):
+            app._update_stats_label()
+        assert "212 ms @ 640 px" in app.fps_label.cget("text")
+
+    def test_stats_label_reports_timeouts(self, app):
+        stats = {"timeouts": {"expired": 2, "hung": 1}}
+        with patch.object(app.engine, "stats", return_value=stats):
+            app._update_stats_label()
+        assert "Timeouts: 3" in app.fps_label.cget("text")
+
+
+class TestStillImageWhileLoading:
+    def test_still_image_waits_for_model_then_runs(self, app):
+        import numpy as np
+
+        app.capture_active = False
+        app.current_frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        engine_type = type(app.engine)
+        with (
+            patch.object(engine_type, "is_loading", new=True),
+            patch.object(app.engine, "is_ready", return_value=False),
+            patch.object(app.engine, "detect_text_async", return_value=True) as mock_submit,
+        ):
+            assert app._process_current_frame() is False
+            mock_submit.assert_not_called()
+            assert app._still_retry is not None
+
+        with patch.object(app.engine, "detect_text_async", return_value=True) as mock_submit:
+            app._retry_still_frame()
+        mock_submit.assert_called_once()
+        assert app._still_retry is None
+
+    def test_still_image_is_submitted_as_interactive(self, app):
+        import numpy as np
+
+        app.capture_active = False
+        app.current_frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        with (
+            patch.object(app.engine, "has_room", return_value=True),
+            patch.object(app.engine, "detect_text_async", return_value=True) as mock_submit,
+        ):
+            assert app._process_current_frame() is True
+        assert mock_submit.call_args.kwargs["priority"] == "interactive"
+        assert mock_submit.call_args.kwargs["deadline"] is None
+
+    def test_webcam_result_after_capture_stopped_is_ignored(self, app):
+        import numpy as np
+
+        from text_detector.ocr_engine import DetectionResult
+
+        app.capture_active = True
+        app.current_frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        with patch.object(app.engine, "detect_text_async", return_value=True) as mock_submit:
+            app._process_current_frame()
+        callback = mock_submit.call_args.kwargs["callback"]
+        assert mock_submit.call_args.kwargs["priority"] == "streaming"
+
+        app.capture_active = False
+        app.ocr_result = None
+        callback(DetectionResult(detections=[], languages=["en"]))
+        assert app.ocr_result is None
+
+    def test_poll_reports_waiting_still_image(self, app):
+        app._still_retry = "after#1"
+        engine_type = type(app.engine)
+        with (
+            patch.object(engine_type, "is_loading", new=True),
+            patch.object(engine_type, "preload_progress", new=(0, 1)),
+        ):
+            app._poll_model_loading()
+        assert "Waiting for OCR model" in app.status_label.cget("text")
+        app.root.after_cancel(app._loading_poll)
+
+
+class TestSettingsLoading:
+    def test_reader_cache_settings_survive_restart(self):
+        from text_detector.config import SETTINGS, AppSettings
+
+        stored = AppSettings(reader_cache_max_mb=512, reader_idle_ttl=60.0)
+        with (
+            patch("text_detector.text_detector.SettingsManager.load", return_value=stored),
+            patch("text_detector.text_detector.SettingsManager.save") as mock_save,
+        ):
+            root = tk.Tk()
+            root.withdraw()
+            app = TextRecognitionApp(root)
+            app._save_settings()
+            root.destroy()
+
+        assert SETTINGS.reader_cache_max_mb == 512
+        assert SETTINGS.reader_idle_ttl == 60.0
+        saved = mock_save.call_args.args[0]
+        assert saved.reader_cache_max_mb == 512
@@ -0,0 +1,54 @@
+"""Tests for tiled OCR helpers."""
+
+from text_detector.tiling import suppress_duplicates, tile_grid
+
+
+def _box(x1: float, y1: float, x2: float, y2: float) -> list[list[float]]:
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def test_tile_grid_small_image_is_one_tile():
+    """Test that an image within the tile size is not split."""
+    assert tile_grid(300, 500, 800, 96) == [(0, 0, 500, 300)]
+
+
+def test_tile_grid_covers_image_with_full_size_tiles():
+    """Test that tiles overlap, stay full size and reach every edge."""
+    tiles = tile_grid(1080, 1920, 800, 96)
+
+    assert all(x2 - x1 == 800 and y2 - y1 == 800 for x1, y1, x2, y2 in tiles)
+    assert max(x2 for _x1, _y1, x2, _y2 in tiles) == 1920
+    assert max(y2 for _x1, _y1, _x2, y2 in tiles) == 1080
+    xs = sorted({x1 for x1, _y1, _x2, _y2 in tiles})
+    assert all(b - a <= 800 - 96 for a, b in zip(xs, xs[1:], strict=False))
+
+
+def test_suppress_duplicates_keeps_whole_word_over_seam_fragment():
+    """Test that a fragment cut by a tile edge gives way to the full word."""
+    detections = [
+        (_box(100, 10, 140, 30), "Hel", 0.95),
+        (_box(100, 10, 180, 30), "Hello", 0.9),
+    ]
+
+    assert suppress_duplicates(detections) == [detections[1]]
+
+
+def test_suppress_duplicates_keeps_separate_words_in_order():
+    """Test that non-overlapping boxes all survive in their original order."""
+    detections = [
+        (_box(200, 10, 260, 30), "world", 0.7),
+        (_box(100, 10, 180, 30), "Hello", 0.9),
+        (_box(100, 40, 180, 60), "again", 0.8),
+    ]
+
+    assert suppress_duplicates(detections) == detections
+
+
+def test_suppress_duplicates_prefers_confidence_for_equal_boxes():
+    """Test that the more confident read wins between identical boxes."""
+    detections = [
+        (_box(0, 0, 50, 20), "He1lo", 0.4),
+        (_box(0, 0, 50, 20), "Hello", 0.9),
+    ]
+
+    assert suppress_duplicates(detections) == [detections[1]]
@@ -0,0 +1,85 @@
+"""Tests for the BoxTracker."""
+
+import cv2
+import numpy as np
+
+from text_detector.tracker import BoxTracker
+
+
+def _textured_frame(dx: int = 0, dy: int = 0) -> np.ndarray:
+    """Create a frame with a patch of text shifted by (dx, dy)."""
+    frame = np.full((480, 640, 3), 40, dtype=np.uint8)
+    cv2.rectangle(frame, (100 + dx, 100 + dy), (400 + dx, 180 + dy), (230, 230, 230), -1)
+    cv2.putText(
+        frame, "TRACK ME", (120 + dx, 160 + dy), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3
+    )
+    return frame
+
+
+BOX = [[100.0, 100.0], [400.0, 100.0], [400.0, 180.0], [100.0, 180.0]]
+
+
+def test_tracker_inactive_until_reset():
+    """Test that a new tracker has nothing to track."""
+    tracker = BoxTracker()
+    frame = _textured_frame()
+
+    assert not tracker.active
+    assert tracker.update(frame) == []
+
+
+def test_tracker_follows_shifted_box():
+    """Test that a box moves with the content underneath it."""
+    tracker = BoxTracker()
+    tracker.reset(_textured_frame(), [(BOX, "TRACK ME", 0.9)])
+
+    tracked = tracker.update(_textured_frame(dx=12, dy=-6))
+
+    assert tracker.active
+    assert len(tracked) == 1
+    bbox, text, confidence = tracked[0]
+    assert text == "TRACK ME"
+    assert confidence == 0.9
+    assert abs(bbox[0][0] - 112) <= 3
+    assert abs(bbox[0][1] - 94) <= 3
+
+
+def test_tracker_static_frame_keeps_box():
+    """Test that an unchanged frame leaves the box in place."""
+    tracker = BoxTracker()
+    frame = _textured_frame()
+    tracker.reset(frame, [(BOX, "TRACK ME", 0.9)])
+
+    bbox = tracker.update(frame.copy())[0][0]
+
+    assert np.allclose(bbox, BOX, atol=0.5)
+
+
+def test_tracker_ignores_resolution_change():
+    """Test that a frame of a different size returns the last boxes unchanged."""
+    tracker = BoxTracker()
+    tracker.reset(_textured_frame(), [(BOX, "TRACK ME", 0.9)])
+
+    tracked = tracker.update(np.zeros((240, 640, 3), dtype=np.uint8))
+
+    assert tracked[0][0] == BOX
+
+
+def test_tracker_clear():
+    """Test that clear stops tracking."""
+    tracker = BoxTracker()
+    tracker.reset(_textured_frame(), [(BOX, "TRACK ME", 0.9)])
+
+    tracker.clear()
+
+    assert not tracker.active
+    assert tracker.update(_textured_frame()) == []
+
+
+def test_tracker_reset_with_no_detections():
+    """Test that resetting with an empty result tracks nothing."""
+    tracker = BoxTracker()
+    tracker.reset(_textured_frame(), [])
+
+    assert not tracker.active
+    assert tracker.update(_textured_frame()) == []
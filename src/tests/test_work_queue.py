@@ -0,0 +1,81 @@
+"""Tests for the priority work queue."""
+
+import queue
+import threading
+
+import pytest
+
+from text_detector.work_queue import PriorityWorkQueue
+
+
+def _queue(maxsize: int = 4) -> PriorityWorkQueue[tuple[str, int]]:
+    return PriorityWorkQueue(maxsize, ("high", "low"), lambda item: item[0])
+
+
+def test_get_serves_higher_class_first_and_fifo_within_a_class():
+    """Test that later high-priority items overtake waiting low-priority ones."""
+    work = _queue()
+    for item in [("low", 0), ("high", 0), ("low", 1), ("high", 1)]:
+        work.put_nowait(item)
+
+    served = [work.get_nowait() for _ in range(4)]
+
+    assert served == [("high", 0), ("high", 1), ("low", 0), ("low", 1)]
+
+
+def test_maxsize_bounds_all_classes_together():
+    """Test that the bound counts items of every class."""
+    work = _queue(maxsize=2)
+    work.put_nowait(("low", 0))
+    work.put_nowait(("high", 0))
+
+    assert work.full()
+    with pytest.raises(queue.Full):
+        work.put_nowait(("high", 1))
+
+
+def test_pop_oldest_evicts_only_the_requested_class():
+    """Test that eviction takes the oldest item of one class and leaves the rest."""
+    work = _queue()
+    work.put_nowait(("low", 0))
+    work.put_nowait(("low", 1))
+    work.put_nowait(("high", 0))
+
+    assert work.pop_oldest("low") == ("low", 0)
+    assert work.qsize("low") == 1
+    assert work.qsize() == 2
+    assert _queue().pop_oldest("high") is None
+
+
+def test_get_times_out_when_empty():
+    """Test that get raises queue.Empty after the timeout."""
+    with pytest.raises(queue.Empty):
+        _queue().get(timeout=0.01)
+
+
+def test_get_wakes_when_an_item_arrives():
+    """Test that a blocked get returns the item put by another thread."""
+    work = _queue()
+    timer = threading.Timer(0.05, work.put_nowait, args=(("low", 0),))
+    timer.start()
+
+    assert work.get(timeout=5.0) == ("low", 0)
+    timer.join()
+
+
+def test_join_waits_for_task_done():
+    """Test that join returns once every queued item is marked done."""
+    work = _queue()
+    work.put_nowait(("low", 0))
+    work.get_nowait()
+    joiner = threading.Thread(target=work.join)
+    joiner.start()
+    joiner.join(timeout=0.05)
+    assert joiner.is_alive()
+
+    work.task_done()
+    joiner.join(timeout=5.0)
+
+    assert not joiner.is_alive()
+    with pytest.raises(ValueError):
+        work.task_done()
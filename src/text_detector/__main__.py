@@ -1,18 +1,84 @@
 """Entry point for the text detection application."""
 
-import tkinter as tk
+import argparse
+import sys
 
-from text_detector.text_detector import TextRecognitionApp
+from text_detector.batch import add_batch_arguments, run_batch
+from text_detector.capture import add_probe_arguments, run_probe
+from text_detector.profiler import (
+    PROFILE_ENV,
+    PROFILE_RATE_ENV,
+    positive_rate,
+    profiler_from_options,
+)
 from text_detector.utils.logging_setup import setup_logging
 
 
-def main() -> None:
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    Without a subcommand the Tk GUI is started.
+    """
+    parser = argparse.ArgumentParser(
+        prog="text-detector", description="Real-time text recognition."
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help=f"sample the GUI and OCR worker stacks and write them to PATH on exit "
+        f"(.json for speedscope, otherwise collapsed stacks; also ${PROFILE_ENV})",
+    )
+    parser.add_argument(
+        "--profile-rate",
+        type=positive_rate,
+        metavar="HZ",
+        help=f"profiler samples per second (default 100; also ${PROFILE_RATE_ENV})",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    batch = subparsers.add_parser("batch", help="OCR a directory or glob of images headlessly")
+    add_batch_arguments(batch)
+    probe = subparsers.add_parser(
+        "probe-camera", help="list the camera's modes and measure decode cost per mode"
+    )
+    add_probe_arguments(probe)
+    return parser
+
+
+def run_gui() -> None:
     """Run the text recognition application."""
+    import tkinter as tk
+
+    from text_detector.text_detector import TextRecognitionApp
+
     setup_logging()
     root = tk.Tk()
     _app = TextRecognitionApp(root)
     root.mainloop()
 
 
+def main(argv: list[str] | None = None) -> None:
+    """Dispatch to a subcommand, or start the GUI when none is given."""
+    args = build_parser().parse_args(argv)
+    profiler = profiler_from_options(args.profile, args.profile_rate)
+    if profiler is None:
+        _dispatch(args)
+        return
+    profiler.install_signal_handler()
+    profiler.start()
+    try:
+        _dispatch(args)
+    finally:
+        profiler.stop()
+        profiler.dump()
+
+
+def _dispatch(args: argparse.Namespace) -> None:
+    if args.command == "batch":
+        sys.exit(run_batch(args))
+    if args.command == "probe-camera":
+        sys.exit(run_probe(args))
+    run_gui()
+
+
 if __name__ == "__main__":
     main()
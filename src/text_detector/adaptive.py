@@ -0,0 +1,112 @@
+"""Latency-targeted controller for the OCR input width."""
+
+import math
+import threading
+
+from text_detector.config import AppSettings
+
+# Widths are kept on this grid so small latency jitter does not change them.
+WIDTH_STEP = 32
+
+
+class AdaptiveWidthController:
+    """Adjust the OCR input width to hold a target per-call latency.
+
+    Detector and recognizer cost grows roughly with the pixel count, so
+    the width is scaled by ``sqrt(target / latency)`` of the smoothed
+    latency, limited to ``max_change`` per update and kept within
+    ``[min_width, max_width]``. When the smoothed confidence of the
+    recognized text falls below ``confidence_floor`` the width is raised
+    instead, and the controller will not shrink below that width again
+    until the floor has slowly decayed.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 0.25,
+        min_width: int = 320,
+        max_width: int = 800,
+        confidence_floor: float = 0.5,
+        tolerance: float = 0.1,
+        max_change: float = 0.2,
+        smoothing: float = 0.3,
+    ) -> None:
+        self.target_latency = target_latency
+        self.min_width = min_width
+        self.max_width = max_width
+        self.confidence_floor = confidence_floor
+        self.tolerance = tolerance
+        self.max_change = max_change
+        self.smoothing = smoothing
+        self._width = float(max_width)
+        self._floor = float(min_width)
+        self._lock = threading.Lock()
+        self.latency: float | None = None
+        self.confidence: float | None = None
+        self.updates = 0
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "AdaptiveWidthController":
+        """Create a controller using the bounds and target in ``settings``."""
+        return cls(
+            target_latency=settings.target_ocr_latency_ms / 1000,
+            min_width=settings.ocr_min_width,
+            max_width=settings.ocr_max_width,
+            confidence_floor=settings.adaptive_confidence_floor,
+        )
+
+    @property
+    def width(self) -> int:
+        """Return the OCR input width to use for the next call."""
+        with self._lock:
+            return self._snap(self._width)
+
+    def _snap(self, width: float) -> int:
+        snapped = round(width / WIDTH_STEP) * WIDTH_STEP
+        return int(min(self.max_width, max(self.min_width, snapped)))
+
+    def _smooth(self, previous: float | None, value: float) -> float:
+        if previous is None:
+            return value
+        return previous + self.smoothing * (value - previous)
+
+    def update(self, latency: float, confidence: float | None = None) -> int:
+        """Record one OCR call and return the width for the next one.
+
+        Args:
+            latency: Seconds the call took.
+            confidence: Mean confidence of its detections, or None if it
+                found no text (which says nothing about resolution).
+
+        Returns:
+            The new OCR input width.
+        """
+        with self._lock:
+            self.updates += 1
+            self.latency = self._smooth(self.latency, latency)
+            if confidence is not None:
+                self.confidence = self._smooth(self.confidence, confidence)
+            # Let an old confidence floor fade so smaller widths are retried.
+            self._floor = max(float(self.min_width), self._floor * 0.99)
+
+            if self.confidence is not None and self.confidence < self.confidence_floor:
+                self._width = min(float(self.max_width), self._width * (1 + self.max_change))
+                self._floor = max(self._floor, self._width)
+            else:
+                ratio = self.target_latency / max(self.latency, 1e-6)
+                if abs(ratio - 1) > self.tolerance:
+                    factor = min(1 + self.max_change, max(1 - self.max_change, math.sqrt(ratio)))
+                    self._width = self._width * factor
+                self._width = min(float(self.max_width), max(self._floor, self._width))
+            return self._snap(self._width)
+
+    def stats(self) -> dict[str, float | int | None]:
+        """Return the current width, smoothed latency and confidence."""
+        with self._lock:
+            return {
+                "width": self._snap(self._width),
+                "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+                "target_ms": round(self.target_latency * 1000, 1),
+                "confidence": round(self.confidence, 3) if self.confidence is not None else None,
+                "updates": self.updates,
+            }
@@ -0,0 +1,225 @@
+"""Pluggable OCR inference backends: EasyOCR (default) and ONNX Runtime on CPU."""
+
+import os
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+from text_detector.utils.logging_setup import get_logger
+from text_detector.utils.path_helpers import ensure_dir
+
+logger = get_logger("backends")
+
+Detection = tuple[list[list[float]], str, float]
+
+DEFAULT_ONNX_DIR = Path.home() / ".cache" / "text-detector" / "onnx"
+
+# Export shapes; height and width (and the recognizer batch) stay dynamic.
+_DETECTOR_EXPORT_SHAPE = (1, 3, 640, 640)
+_RECOGNIZER_EXPORT_SHAPE = (1, 1, 64, 256)
+_ONNX_OPSET = 17
+
+
+class OCRBackend(Protocol):
+    """Inference engine driven by :class:`~text_detector.ocr_engine.OCREngine`.
+
+    ``detect`` and ``recognize`` are the two stages incremental OCR calls
+    separately; ``readtext`` runs both. EasyOCR's ``Reader`` already has
+    this shape, so its keyword arguments are accepted as-is.
+    """
+
+    def detect(self, img: np.ndarray, **kwargs: Any) -> tuple[list[Any], list[Any]]:
+        """Return per-image (horizontal boxes, free-form boxes)."""
+        ...
+
+    def recognize(
+        self,
+        img: np.ndarray,
+        horizontal_list: list[Any] | None = None,
+        free_list: list[Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Detection]:
+        """Read the text inside the given boxes."""
+        ...
+
+    def readtext(self, image: np.ndarray, **kwargs: Any) -> list[Detection]:
+        """Detect and recognize text in one call."""
+        ...
+
+
+@dataclass(frozen=True)
+class BackendOptions:
+    """Settings a backend loader needs beyond the language list.
+
+    Attributes:
+        gpu: Run on the GPU where the backend supports it.
+        threads: Intra-op threads for backends with their own thread pool
+            (0 leaves the library default).
+        model_dir: Where exported ONNX models are stored.
+    """
+
+    gpu: bool = False
+    threads: int = 0
+    model_dir: Path = field(default=DEFAULT_ONNX_DIR)
+
+
+def load_easyocr(languages: list[str], options: BackendOptions) -> OCRBackend:
+    """Load an EasyOCR reader running its PyTorch models."""
+    import easyocr
+
+    reader: OCRBackend = easyocr.Reader(languages, gpu=options.gpu)
+    return reader
+
+
+class OnnxModule:
+    """Stand-in for a torch module that runs an ONNX Runtime session.
+
+    EasyOCR calls its detector and recognizer like torch modules and reads
+    torch tensors back, so the session's inputs are fed from the call
+    arguments in order and its outputs are returned as tensors. Arguments
+    the exported graph dropped (the recognizer's unused text input) are
+    ignored.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+        self._input_names = [node.name for node in session.get_inputs()]
+
+    def __call__(self, *args: Any) -> Any:
+        import torch
+
+        feeds = {
+            name: arg.detach().cpu().numpy()
+            for name, arg in zip(self._input_names, args, strict=False)
+        }
+        outputs = [torch.from_numpy(out) for out in self._session.run(None, feeds)]
+        return tuple(outputs) if len(outputs) > 1 else outputs[0]
+
+    def eval(self) -> "OnnxModule":
+        return self
+
+    def to(self, *_args: Any, **_kwargs: Any) -> "OnnxModule":
+        return self
+
+    def parameters(self) -> Iterator[Any]:
+        return iter(())
+
+    def buffers(self) -> Iterator[Any]:
+        return iter(())
+
+
+def _export(module: Any, args: tuple[Any, ...], path: Path, **kwargs: Any) -> None:
+    """Export ``module`` to ``path`` through a temporary file.
+
+    Workers loading the same model concurrently each write their own
+    temporary file and the rename makes the last one win atomically.
+    """
+    import torch
+
+    module = getattr(module, "module", module)  # unwrap DataParallel
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    logger.info("Exporting %s to ONNX", path.name)
+    with torch.no_grad():
+        torch.onnx.export(module.eval(), args, str(tmp), opset_version=_ONNX_OPSET, **kwargs)
+    tmp.replace(path)
+
+
+def export_detector(detector: Any, path: Path) -> None:
+    """Export EasyOCR's CRAFT text detector to ONNX."""
+    import torch
+
+    _export(
+        detector,
+        (torch.zeros(_DETECTOR_EXPORT_SHAPE),),
+        path,
+        input_names=["image"],
+        output_names=["regions", "features"],
+        dynamic_axes={"image": {2: "height", 3: "width"}},
+    )
+
+
+def export_recognizer(recognizer: Any, path: Path) -> None:
+    """Export an EasyOCR recognition model to ONNX."""
+    import torch
+
+    image = torch.zeros(_RECOGNIZER_EXPORT_SHAPE)
+    text = torch.zeros((1, 1), dtype=torch.long)
+    _export(
+        recognizer,
+        (image, text),
+        path,
+        input_names=["image", "text"],
+        output_names=["logits"],
+        dynamic_axes={"image": {0: "batch", 3: "width"}, "text": {0: "batch"}},
+    )
+
+
+def _ort_session(path: Path, threads: int) -> Any:
+    """Open a CPU inference session with every graph optimization enabled."""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if threads > 0:
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+    return ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def load_onnx(languages: list[str], options: BackendOptions) -> OCRBackend:
+    """Load an EasyOCR reader whose networks run in ONNX Runtime on the CPU.
+
+    EasyOCR still does the image pre- and post-processing (box grouping,
+    cropping, CTC decoding); only the CRAFT detector and the recognizer
+    forward passes move to ONNX Runtime. Models are exported from the
+    EasyOCR weights into ``options.model_dir`` the first time they are
+    needed and reused afterwards.
+    """
+    import easyocr
+
+    if options.gpu:
+        logger.warning("The ONNX backend runs on the CPU only; ignoring the GPU setting")
+    # Dynamically quantized torch modules cannot be exported, so load float weights.
+    reader = easyocr.Reader(languages, gpu=False, quantize=False)
+    model_dir = ensure_dir(options.model_dir)
+    detector_path = model_dir / "craft.onnx"
+    recognizer_path = model_dir / f"recognizer_{reader.model_lang}.onnx"
+    if not detector_path.exists():
+        export_detector(reader.detector, detector_path)
+    if not recognizer_path.exists():
+        export_recognizer(reader.recognizer, recognizer_path)
+    reader.detector = OnnxModule(_ort_session(detector_path, options.threads))
+    reader.recognizer = OnnxModule(_ort_session(recognizer_path, options.threads))
+    backend: OCRBackend = reader
+    return backend
+
+
+BACKENDS: dict[str, Callable[[list[str], BackendOptions], OCRBackend]] = {
+    "easyocr": load_easyocr,
+    "onnx": load_onnx,
+}
+
+
+def load_backend(name: str, languages: list[str], options: BackendOptions) -> OCRBackend:
+    """Load the OCR backend registered under ``name``.
+
+    Args:
+        name: Key in :data:`BACKENDS` (``"easyocr"`` or ``"onnx"``).
+        languages: Language codes the models must cover.
+        options: Device, thread and model directory options.
+
+    Returns:
+        A ready-to-use backend.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``.
+    """
+    try:
+        loader = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown OCR backend: {name!r}") from None
+    return loader(languages, options)
@@ -0,0 +1,307 @@
+"""Headless batch OCR over directories or glob patterns of image files.
+
+Images are decoded in a thread pool and recognized across a process pool.
+One JSON line per image is written as soon as that image is done. This
+module must never import tkinter so it can run on display-less servers.
+"""
+
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import replace
+from pathlib import Path
+from typing import IO, Any
+
+import cv2
+import numpy as np
+
+from text_detector.config import AppSettings
+from text_detector.cpu_threads import ThreadPlan, apply_library_threads, plan_threads
+from text_detector.ocr_engine import DetectionResult, OCREngine
+from text_detector.utils.logging_setup import get_logger
+
+logger = get_logger("batch")
+
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"})
+
+# Every OCR process loads its own copy of the models, so the default stays
+# small; raise --workers only where RAM and cores allow.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+_process_engine: OCREngine | None = None
+
+
+def collect_images(target: str, recursive: bool = False) -> list[Path]:
+    """Expand a directory, file or glob pattern into a sorted list of images.
+
+    Args:
+        target: Directory, single image path or glob pattern (``**`` allowed).
+        recursive: Descend into subdirectories when ``target`` is a directory.
+
+    Returns:
+        Sorted list of image file paths.
+    """
+    path = Path(target)
+    candidates: Iterator[Path]
+    if path.is_dir():
+        candidates = path.rglob("*") if recursive else path.iterdir()
+    elif path.is_file():
+        candidates = iter([path])
+    else:
+        candidates = (Path(p) for p in glob.glob(target, recursive=True))
+    return sorted(p for p in candidates if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES)
+
+
+def _decode_image(path: Path) -> tuple[Path, np.ndarray | None, float, float]:
+    """Read an image from disk, returning its decode start time and duration."""
+    start = time.perf_counter()
+    frame = cv2.imread(str(path))
+    return path, frame, start, time.perf_counter() - start
+
+
+def _init_ocr_process(settings: AppSettings, thread_plan: ThreadPlan) -> None:
+    """Size the thread pools and create the per-process OCR engine used by :func:`_ocr_frame`."""
+    global _process_engine
+    apply_library_threads(thread_plan)
+    # Distinct files must never share a result, so no near-duplicate cache.
+    _process_engine = OCREngine(replace(settings, result_cache_size=0), start_workers=False)
+
+
+def _ocr_frame(
+    frame: np.ndarray,
+    languages: list[str],
+    threshold: float | None,
+) -> tuple[DetectionResult, float]:
+    """Run OCR in a pool process and return the result with its duration."""
+    if _process_engine is None:
+        raise RuntimeError("OCR process was not initialised")
+    start = time.perf_counter()
+    result = _process_engine.detect_text(frame, languages, threshold)
+    return result, time.perf_counter() - start
+
+
+def _make_ocr_pool(workers: int, settings: AppSettings) -> Executor:
+    """Create the process pool that runs OCR, one engine per process.
+
+    The cores are shared out between the processes, so ``workers`` torch
+    pools do not each try to use every core.
+    """
+    plan = plan_threads(replace(settings, ocr_workers=workers))
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_ocr_process,
+        initargs=(settings, plan),
+    )
+
+
+def build_record(
+    path: Path,
+    shape: tuple[int, ...] | None,
+    result: DetectionResult | None,
+    timings: dict[str, float],
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build the JSON-serialisable record written for one image.
+
+    Args:
+        path: Image path.
+        shape: Decoded frame shape, or None if decoding failed.
+        result: OCR result, or None if the image never reached OCR.
+        timings: Stage durations in seconds, keyed by stage name.
+        error: Error message overriding the result's own error.
+
+    Returns:
+        Dictionary with path, size, detections and millisecond timings.
+    """
+    detections = []
+    if result is not None:
+        detections = [
+            {
+                "box": [[float(x), float(y)] for x, y in bbox],
+                "text": text,
+                "confidence": round(float(confidence), 4),
+            }
+            for bbox, text, confidence in result.detections
+        ]
+    success = error is None and result is not None and result.success
+    return {
+        "path": str(path),
+        "width": shape[1] if shape else None,
+        "height": shape[0] if shape else None,
+        "success": success,
+        "error": error if error is not None else (result.error if result else None),
+        "detections": detections,
+        "timings": {f"{name}_ms": round(value * 1000, 2) for name, value in timings.items()},
+    }
+
+
+def iter_batch_records(
+    paths: list[Path],
+    settings: AppSettings,
+    languages: list[str],
+    threshold: float | None,
+    workers: int,
+    decode_threads: int,
+    pool_factory: Callable[[int, AppSettings], Executor] = _make_ocr_pool,
+) -> Iterator[dict[str, Any]]:
+    """Decode and OCR images concurrently, yielding records as they finish.
+
+    At most ``2 * workers`` images are decoded or in OCR at any time, so
+    memory stays bounded however many paths are given.
+    """
+    window = max(2, workers * 2)
+    pending_paths = iter(paths)
+    decoding: set[Future[Any]] = set()
+    recognizing: dict[Future[Any], tuple[Path, tuple[int, ...], float, float]] = {}
+
+    with (
+        ThreadPoolExecutor(max_workers=decode_threads) as decoders,
+        pool_factory(workers, settings) as ocr_pool,
+    ):
+
+        def refill() -> None:
+            while len(decoding) + len(recognizing) < window:
+                path = next(pending_paths, None)
+                if path is None:
+                    return
+                decoding.add(decoders.submit(_decode_image, path))
+
+        refill()
+        while decoding or recognizing:
+            done, _ = wait(decoding | recognizing.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in decoding:
+                    decoding.discard(future)
+                    path, frame, started, decode_s = future.result()
+                    if frame is None:
+                        yield build_record(
+                            path, None, None, {"decode": decode_s}, error="unable to decode image"
+                        )
+                        continue
+                    ocr_future = ocr_pool.submit(_ocr_frame, frame, languages, threshold)
+                    recognizing[ocr_future] = (path, frame.shape, started, decode_s)
+                else:
+                    path, shape, started, decode_s = recognizing.pop(future)
+                    try:
+                        result, ocr_s = future.result()
+                        error = None
+                    except Exception as e:
+                        result, ocr_s, error = None, 0.0, str(e)
+                    timings = {
+                        "decode": decode_s,
+                        "ocr": ocr_s,
+                        "total": time.perf_counter() - started,
+                    }
+                    yield build_record(path, shape, result, timings, error=error)
+            refill()
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the ``batch`` subcommand's arguments on ``parser``."""
+    parser.add_argument("target", help="directory, image file or glob pattern")
+    parser.add_argument("-o", "--output", type=Path, help="write JSON lines here (default stdout)")
+    parser.add_argument(
+        "-l", "--lang", action="append", dest="languages", help="OCR language (repeatable)"
+    )
+    parser.add_argument("-t", "--threshold", type=float, help="minimum confidence to keep")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=(
+            "OCR processes (default %(default)s); each loads its own reader, "
+            "roughly 150-500 MB of RAM per language set"
+        ),
+    )
+    parser.add_argument("--decode-threads", type=int, default=4, help="image decode threads")
+    parser.add_argument("--max-width", type=int, help="OCR input width (default from settings)")
+    parser.add_argument("--no-preprocess", action="store_true", help="skip denoising")
+    parser.add_argument(
+        "--tiled",
+        action="store_true",
+        help="read large images at full resolution in overlapping --max-width tiles",
+    )
+    parser.add_argument("--gpu", action="store_true", help="run OCR on the GPU")
+    parser.add_argument(
+        "--backend",
+        choices=("easyocr", "onnx"),
+        default="easyocr",
+        help="inference backend (onnx runs on the CPU with ONNX Runtime)",
+    )
+    parser.add_argument("-r", "--recursive", action="store_true", help="recurse into directories")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+
+
+def _write_records(records: Iterator[dict[str, Any]], out: IO[str]) -> int:
+    """Write each record as one JSON line, flushing so consumers can stream."""
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        count += 1
+    return count
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Run the ``batch`` subcommand.
+
+    Args:
+        args: Parsed arguments from :func:`add_batch_arguments`.
+
+    Returns:
+        Process exit code.
+    """
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    paths = collect_images(args.target, recursive=args.recursive)
+    if not paths:
+        print(f"No images found for {args.target}", file=sys.stderr)
+        return 1
+
+    settings = AppSettings(
+        gpu_enabled=args.gpu,
+        preprocess_enabled=not args.no_preprocess,
+        ocr_backend=args.backend,
+        tiled_ocr=args.tiled,
+    )
+    if args.max_width:
+        settings.ocr_max_width = args.max_width
+    languages = args.languages or [settings.default_language]
+    workers = max(1, min(args.workers, len(paths)))
+    logger.info("Processing %d images with %d OCR processes", len(paths), workers)
+
+    start = time.perf_counter()
+    records = iter_batch_records(
+        paths, settings, languages, args.threshold, workers, max(1, args.decode_threads)
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            count = _write_records(records, f)
+    else:
+        count = _write_records(records, sys.stdout)
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {count} images in {elapsed:.2f}s ({rate:.2f} images/sec)", file=sys.stderr)
+    return 0
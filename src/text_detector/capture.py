@@ -0,0 +1,342 @@
+"""Webcam format negotiation and background capture that decodes only the frames used."""
+
+import argparse
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+from text_detector.config import AppSettings
+from text_detector.frame_pool import FramePool
+from text_detector.utils.logging_setup import get_logger
+
+logger = get_logger("capture")
+
+# Pause after a failed grab before trying the camera again.
+_RETRY_DELAY = 0.05
+# Resolutions most UVC cameras offer, smallest first. Automatic capture
+# sizing and the probe pick from these.
+COMMON_RESOLUTIONS = (
+    (640, 480),
+    (800, 600),
+    (1280, 720),
+    (1920, 1080),
+    (2560, 1440),
+    (3840, 2160),
+)
+PROBE_FOURCCS = ("MJPG", "YUYV")
+# Frames read and thrown away after a mode switch before timing starts.
+_PROBE_WARMUP = 5
+
+
+@dataclass(frozen=True)
+class CaptureFormat:
+    """Camera mode to request. A zero or empty field keeps the camera default.
+
+    Attributes:
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        fourcc: Pixel format, for example ``"MJPG"`` or ``"YUYV"``.
+    """
+
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    fourcc: str = ""
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "CaptureFormat":
+        """Return the mode to request for ``settings``.
+
+        ``capture_width`` and ``capture_height`` are used when set. Otherwise
+        the resolution follows ``ocr_max_width`` (see
+        :func:`auto_resolution`), so the camera does not deliver pixels
+        that resizing for OCR would throw away. With ``tiled_ocr`` the
+        camera default is kept, since tiles read frames at full size.
+        """
+        width, height = settings.capture_width, settings.capture_height
+        if not width and not settings.tiled_ocr:
+            width, height = auto_resolution(settings.ocr_max_width)
+        return cls(width, height, settings.capture_fps, settings.capture_fourcc)
+
+    def __str__(self) -> str:
+        size = f"{self.width}x{self.height}" if self.width else "default size"
+        fps = f"{self.fps:g} fps" if self.fps else "default fps"
+        return f"{size}, {fps}, {self.fourcc or 'default format'}"
+
+
+def auto_resolution(max_width: int) -> tuple[int, int]:
+    """Return the smallest common resolution at least ``max_width`` wide.
+
+    Falls back to the largest one for wider OCR input.
+    """
+    for width, height in COMMON_RESOLUTIONS:
+        if width >= max_width:
+            return width, height
+    return COMMON_RESOLUTIONS[-1]
+
+
+def fourcc_name(code: float) -> str:
+    """Decode a ``CAP_PROP_FOURCC`` value into its four-letter name."""
+    value = int(code)
+    return "".join(chr((value >> 8 * i) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+def negotiated_format(cap: cv2.VideoCapture) -> CaptureFormat:
+    """Return the mode the camera is actually delivering."""
+    return CaptureFormat(
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        fps=float(cap.get(cv2.CAP_PROP_FPS)),
+        fourcc=fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+    )
+
+
+def apply_format(cap: cv2.VideoCapture, fmt: CaptureFormat) -> CaptureFormat:
+    """Request ``fmt`` from an opened camera and return the mode it settled on.
+
+    Drivers pick the nearest mode they support, so the result may differ
+    from the request.
+    """
+    # The pixel format goes first: on V4L2 it decides which sizes exist.
+    if fmt.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*fmt.fourcc))
+    if fmt.width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, fmt.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, fmt.height)
+    if fmt.fps:
+        cap.set(cv2.CAP_PROP_FPS, fmt.fps)
+    return negotiated_format(cap)
+
+
+def open_camera(index: int = 0, fmt: CaptureFormat | None = None) -> cv2.VideoCapture:
+    """Open camera ``index`` and request ``fmt``.
+
+    Returns:
+        The capture, which is not opened if the camera is unavailable.
+    """
+    cap = cv2.VideoCapture(index)
+    if fmt is not None and cap.isOpened():
+        actual = apply_format(cap, fmt)
+        logger.info("Camera %d: requested %s, got %s", index, fmt, actual)
+    return cap
+
+
+def measure_decode(cap: cv2.VideoCapture, frames: int = 30) -> dict[str, float]:
+    """Read ``frames`` frames and return the frame rate and median grab and decode times."""
+    for _ in range(_PROBE_WARMUP):
+        cap.read()
+    grab_times, decode_times = [], []
+    start = time.perf_counter()
+    for _ in range(frames):
+        grab_start = time.perf_counter()
+        if not cap.grab():
+            break
+        decode_start = time.perf_counter()
+        ok, _frame = cap.retrieve()
+        if not ok:
+            break
+        grab_times.append(decode_start - grab_start)
+        decode_times.append(time.perf_counter() - decode_start)
+    elapsed = time.perf_counter() - start
+    if not decode_times:
+        return {"fps": 0.0, "grab_ms": 0.0, "decode_ms": 0.0}
+    return {
+        "fps": round(len(decode_times) / elapsed, 1),
+        "grab_ms": round(statistics.median(grab_times) * 1000, 2),
+        "decode_ms": round(statistics.median(decode_times) * 1000, 2),
+    }
+
+
+def probe_camera(
+    index: int = 0,
+    resolutions: tuple[tuple[int, int], ...] = COMMON_RESOLUTIONS,
+    fourccs: tuple[str, ...] = PROBE_FOURCCS,
+    frames: int = 30,
+) -> list[dict[str, Any]]:
+    """Find the modes a camera accepts and measure the decode cost of each.
+
+    OpenCV cannot list a camera's modes, so each pixel format and
+    resolution is requested in turn and the mode the driver settled on
+    is read back. Each distinct mode is measured once.
+
+    Raises:
+        RuntimeError: If the camera cannot be opened.
+    """
+    cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        raise RuntimeError(f"Unable to open camera {index}")
+    results: list[dict[str, Any]] = []
+    seen: set[tuple[int, int, str]] = set()
+    try:
+        for fourcc in fourccs:
+            for width, height in resolutions:
+                actual = apply_format(cap, CaptureFormat(width, height, fourcc=fourcc))
+                mode = (actual.width, actual.height, actual.fourcc)
+                if mode in seen:
+                    continue
+                seen.add(mode)
+                results.append(
+                    {
+                        "fourcc": actual.fourcc,
+                        "width": actual.width,
+                        "height": actual.height,
+                        **measure_decode(cap, frames),
+                    }
+                )
+    finally:
+        cap.release()
+    return results
+
+
+def add_probe_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``probe-camera`` options to ``parser``."""
+    parser.add_argument("--device", type=int, default=0, help="camera index (default 0)")
+    parser.add_argument("--frames", type=int, default=30, help="frames timed per mode (default 30)")
+
+
+def run_probe(args: argparse.Namespace) -> int:
+    """Print the camera modes found by :func:`probe_camera`. Returns the exit status."""
+    try:
+        modes = probe_camera(args.device, frames=args.frames)
+    except RuntimeError as exc:
+        print(exc)
+        return 1
+    print(f"{'Format':<8}{'Mode':>11}{'FPS':>8}{'Grab ms':>10}{'Decode ms':>11}")
+    for mode in modes:
+        size = f"{mode['width']}x{mode['height']}"
+        print(
+            f"{mode['fourcc']:<8}{size:>11}{mode['fps']:>8.1f}"
+            f"{mode['grab_ms']:>10.2f}{mode['decode_ms']:>11.2f}"
+        )
+    print(
+        "\nChoose one with capture_width, capture_height, capture_fps and "
+        "capture_fourcc in the settings file."
+    )
+    return 0
+
+
+class CaptureThread:
+    """Read a camera on its own thread, keeping only the latest frame.
+
+    The thread calls ``grab()`` for every camera frame, which keeps the
+    driver queue drained but does not decode. A frame is decoded with
+    ``retrieve()`` only after :meth:`request_frame`, so frames nobody asked
+    for cost no decode time. The decoded frame replaces any earlier one
+    that was not taken, and :meth:`latest` hands it over without waiting.
+    Frames are decoded into a :class:`FramePool`: a frame taken with
+    :meth:`latest` belongs to the caller until it is handed back with
+    :meth:`release`, and its buffer is not decoded into before then. The
+    thread owns the capture and releases it when it stops.
+    """
+
+    def __init__(
+        self,
+        cap: cv2.VideoCapture,
+        buffer_size: int = 1,
+        pool: FramePool | None = None,
+    ) -> None:
+        """Wrap an opened capture.
+
+        Args:
+            cap: Opened video capture.
+            buffer_size: Frames the driver may queue (``CAP_PROP_BUFFERSIZE``),
+                so a grabbed frame is never older than this many frames.
+                Backends that do not support it ignore it.
+            pool: Buffers to decode into. Defaults to a new pool.
+        """
+        self._cap = cap
+        self._pool = pool if pool is not None else FramePool()
+        self._wanted = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._latest: tuple[np.ndarray, float] | None = None
+        self._thread: threading.Thread | None = None
+        self.grabbed = 0
+        self.retrieved = 0
+        self.failures = 0
+        if buffer_size > 0:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+    @property
+    def running(self) -> bool:
+        """True while the capture thread runs."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start grabbing in the background. The first frame is decoded unasked."""
+        self._wanted.set()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="capture")
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop grabbing and release the capture.
+
+        Waits up to ``timeout`` seconds. A thread stuck inside ``grab()``
+        releases the capture itself once the call returns.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Capture thread did not stop within %.1f s", timeout)
+            self._thread = None
+        with self._lock:
+            self._latest = None
+
+    def request_frame(self) -> None:
+        """Ask for the next grabbed frame to be decoded."""
+        self._wanted.set()
+
+    def latest(self) -> tuple[np.ndarray, float] | None:
+        """Take the newest decoded frame and its ``time.monotonic()`` grab time.
+
+        The caller owns the frame until it passes it to :meth:`release`.
+
+        Returns None if no frame was decoded since the last call.
+        """
+        with self._lock:
+            latest, self._latest = self._latest, None
+        return latest
+
+    def release(self, frame: np.ndarray) -> None:
+        """Hand back a frame from :meth:`latest` once nothing uses it any more."""
+        self._pool.release(frame)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if not self._cap.grab():
+                    self.failures += 1
+                    self._stop.wait(_RETRY_DELAY)
+                    continue
+                grabbed_at = time.monotonic()
+                self.grabbed += 1
+                if not self._wanted.is_set():
+                    continue
+                self._wanted.clear()
+                buffer = self._pool.acquire()
+                ok, frame = self._cap.retrieve(image=buffer)
+                if buffer is not None and (not ok or frame is not buffer):
+                    self._pool.release(buffer)
+                if not ok:
+                    self.failures += 1
+                    continue
+                self._pool.adopt(frame)
+                with self._lock:
+                    stale, self._latest = self._latest, (frame, grabbed_at)
+                if stale is not None:
+                    # Never taken, so nobody else holds it.
+                    self._pool.release(stale[0])
+                self.retrieved += 1
+        finally:
+            self._cap.release()
+            self._pool.clear()
+            logger.info(
+                "Capture stopped: %d frames grabbed, %d decoded", self.grabbed, self.retrieved
+            )
@@ -50,12 +50,53 @@ class AppSettings:
     max_confidence: float = 0.8
     default_confidence: float = 0.25
     confidence_resolution: float = 0.05
-    frame_skip: int = 15
+    ocr_cpu_budget: int = 100
+    ocr_min_interval_ms: int = 0
     max_history: int = 100
     gpu_enabled: bool = False
     preprocess_enabled: bool = True
     ocr_max_width: int = 800
+    adaptive_ocr_width: bool = False
+    ocr_min_width: int = 320
+    target_ocr_latency_ms: int = 250
+    adaptive_confidence_floor: float = 0.5
     paragraph_merge: bool = False
+    ocr_workers: int = 1
+    ocr_pool_mode: str = "thread"
+    ocr_backend: str = "easyocr"
+    onnx_model_dir: str = ""
+    ocr_queue_mode: str = "drop"
+    torch_intra_op_threads: int = 0
+    torch_inter_op_threads: int = 0
+    opencv_threads: int = 0
+    cpu_affinity: bool = False
+    ocr_batch_size: int = 8
+    tiled_ocr: bool = False
+    ocr_tile_overlap: int = 96
+    result_cache_size: int = 32
+    result_cache_max_distance: float = 6.0
+    result_channel_size: int = 0
+    ocr_deadline_ms: int = 1000
+    ocr_hang_timeout_ms: int = 120000
+    metrics_file: str = ""
+    metrics_interval: float = 15.0
+    capture_width: int = 0
+    capture_height: int = 0
+    capture_fps: float = 0.0
+    capture_fourcc: str = ""
+    motion_gate_enabled: bool = True
+    motion_change_threshold: float = 6.0
+    motion_settle_threshold: float = 2.0
+    motion_settle_frames: int = 3
+    motion_max_staleness: float = 10.0
+    incremental_ocr: bool = False
+    incremental_detect_interval: int = 10
+    incremental_change_threshold: float = 12.0
+    box_tracking: bool = True
+    preload_models: bool = True
+    preload_languages: list[str] = field(default_factory=list)
+    reader_cache_max_mb: int = 1024
+    reader_idle_ttl: float = 900.0
 
     def __post_init__(self) -> None:
         if not (0.0 <= self.min_confidence <= 1.0):
@@ -64,10 +105,66 @@ class AppSettings:
             raise ValueError("max_confidence must be between 0.0 and 1.0")
         if not (self.min_confidence <= self.default_confidence <= self.max_confidence):
             raise ValueError("default_confidence must be between min and max confidence")
-        if self.frame_skip < 1:
-            raise ValueError("frame_skip must be >= 1")
+        if not (10 <= self.ocr_cpu_budget <= 100):
+            raise ValueError("ocr_cpu_budget must be between 10 and 100 percent")
+        if self.ocr_min_interval_ms < 0:
+            raise ValueError("ocr_min_interval_ms must be >= 0")
         if self.max_history < 1:
             raise ValueError("max_history must be >= 1")
+        if not (32 <= self.ocr_min_width <= self.ocr_max_width):
+            raise ValueError("ocr_min_width must be between 32 and ocr_max_width")
+        if self.target_ocr_latency_ms < 1:
+            raise ValueError("target_ocr_latency_ms must be >= 1")
+        if not (0.0 <= self.adaptive_confidence_floor <= 1.0):
+            raise ValueError("adaptive_confidence_floor must be between 0.0 and 1.0")
+        if self.ocr_workers < 1:
+            raise ValueError("ocr_workers must be >= 1")
+        if self.ocr_pool_mode not in ("thread", "process"):
+            raise ValueError("ocr_pool_mode must be 'thread' or 'process'")
+        if self.ocr_backend not in ("easyocr", "onnx"):
+            raise ValueError("ocr_backend must be 'easyocr' or 'onnx'")
+        if self.ocr_queue_mode not in ("drop", "latest"):
+            raise ValueError("ocr_queue_mode must be 'drop' or 'latest'")
+        if min(self.torch_intra_op_threads, self.torch_inter_op_threads, self.opencv_threads) < 0:
+            raise ValueError("thread counts must be >= 0 (0 picks a default from the core count)")
+        if self.ocr_batch_size < 1:
+            raise ValueError("ocr_batch_size must be >= 1")
+        if not (0 <= self.ocr_tile_overlap <= self.ocr_max_width // 2):
+            raise ValueError("ocr_tile_overlap must be between 0 and half of ocr_max_width")
+        if self.result_cache_size < 0:
+            raise ValueError("result_cache_size must be >= 0")
+        if self.result_cache_max_distance < 0:
+            raise ValueError("result_cache_max_distance must be >= 0")
+        if self.result_channel_size < 0:
+            raise ValueError("result_channel_size must be >= 0")
+        if self.ocr_deadline_ms < 0:
+            raise ValueError("ocr_deadline_ms must be >= 0")
+        if self.ocr_hang_timeout_ms < 0:
+            raise ValueError("ocr_hang_timeout_ms must be >= 0")
+        if self.metrics_interval <= 0:
+            raise ValueError("metrics_interval must be > 0")
+        if min(self.capture_width, self.capture_height) < 0 or (
+            (self.capture_width == 0) != (self.capture_height == 0)
+        ):
+            raise ValueError("capture_width and capture_height must both be > 0 or both 0 (auto)")
+        if self.capture_fps < 0:
+            raise ValueError("capture_fps must be >= 0 (0 keeps the camera default)")
+        if self.capture_fourcc not in ("", "MJPG", "YUYV"):
+            raise ValueError("capture_fourcc must be 'MJPG', 'YUYV' or empty")
+        if not (0.0 <= self.motion_settle_threshold <= self.motion_change_threshold):
+            raise ValueError("motion_settle_threshold must be between 0 and the change threshold")
+        if self.motion_settle_frames < 0:
+            raise ValueError("motion_settle_frames must be >= 0")
+        if self.motion_max_staleness <= 0:
+            raise ValueError("motion_max_staleness must be > 0")
+        if self.incremental_detect_interval < 1:
+            raise ValueError("incremental_detect_interval must be >= 1")
+        if not all(self.validate_language(lang) for lang in self.preload_languages):
+            raise ValueError("preload_languages must be available languages")
+        if self.reader_cache_max_mb < 1:
+            raise ValueError("reader_cache_max_mb must be >= 1")
+        if self.reader_idle_ttl < 0:
+            raise ValueError("reader_idle_ttl must be >= 0")
 
     def validate_language(self, lang: str) -> bool:
         """Check if a language code is available."""
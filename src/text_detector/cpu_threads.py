@@ -0,0 +1,131 @@
+"""CPU thread governance for torch, OpenCV and OCR worker affinity."""
+
+import os
+from dataclasses import dataclass
+
+import cv2
+
+from text_detector.config import AppSettings
+from text_detector.utils.logging_setup import get_logger
+
+logger = get_logger("cpu_threads")
+
+# Cores left to the Tk main thread and frame capture.
+RESERVED_CORES = 1
+
+
+@dataclass(frozen=True)
+class ThreadPlan:
+    """Concrete thread counts and CPU sets for one engine.
+
+    Attributes:
+        intra_op: torch intra-op threads per OCR worker.
+        inter_op: torch inter-op threads.
+        opencv: Threads in OpenCV's pool.
+        cpu_sets: CPUs for each worker slot, or None to leave affinity alone.
+    """
+
+    intra_op: int
+    inter_op: int
+    opencv: int
+    cpu_sets: list[list[int]] | None = None
+
+
+def available_cpus() -> list[int]:
+    """Return the CPUs this process may run on, in ascending order."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def split_cpus(cpus: list[int], workers: int, reserved: int = RESERVED_CORES) -> list[list[int]]:
+    """Split ``cpus`` into one contiguous set per worker.
+
+    The first ``reserved`` CPUs are kept for the GUI when enough remain.
+    With fewer CPUs than workers, sets wrap around and are shared.
+
+    Args:
+        cpus: Available CPU ids.
+        workers: Number of OCR workers.
+        reserved: CPUs to leave unassigned.
+
+    Returns:
+        One non-empty CPU list per worker.
+    """
+    pool = cpus[reserved:] if len(cpus) - reserved >= workers else cpus
+    if len(pool) < workers:
+        return [[pool[i % len(pool)]] for i in range(workers)]
+    size = len(pool) // workers
+    return [pool[i * size : (i + 1) * size] for i in range(workers)]
+
+
+def plan_threads(settings: AppSettings, cpus: list[int] | None = None) -> ThreadPlan:
+    """Resolve the thread settings into concrete counts.
+
+    Settings left at 0 are derived from the core count: each worker gets
+    an equal share of the cores not reserved for the GUI, torch uses a
+    single inter-op thread, and OpenCV gets one worker's share.
+
+    Args:
+        settings: Application settings.
+        cpus: Available CPU ids. Defaults to :func:`available_cpus`.
+
+    Returns:
+        ThreadPlan for the engine.
+    """
+    cpus = cpus if cpus is not None else available_cpus()
+    workers = settings.ocr_workers
+    share = max(1, (len(cpus) - RESERVED_CORES) // workers)
+    return ThreadPlan(
+        intra_op=settings.torch_intra_op_threads or share,
+        inter_op=settings.torch_inter_op_threads or 1,
+        opencv=settings.opencv_threads or share,
+        cpu_sets=split_cpus(cpus, workers) if settings.cpu_affinity else None,
+    )
+
+
+def apply_library_threads(plan: ThreadPlan) -> None:
+    """Set torch and OpenCV thread counts for the current process.
+
+    torch is imported lazily and skipped if missing. Its inter-op pool
+    can only be sized before the first parallel work, so a late call
+    keeps the existing size.
+    """
+    cv2.setNumThreads(plan.opencv)
+    try:
+        import torch
+    except ImportError:
+        logger.debug("torch not installed; skipping torch thread settings")
+        return
+    torch.set_num_threads(plan.intra_op)
+    try:
+        torch.set_num_interop_threads(plan.inter_op)
+    except RuntimeError:
+        logger.debug("torch inter-op pool already started; keeping its size")
+    logger.info(
+        "Threads: torch intra-op %d, inter-op %d, OpenCV %d",
+        plan.intra_op,
+        plan.inter_op,
+        plan.opencv,
+    )
+
+
+def pin_to_cpus(cpus: list[int], pid: int = 0) -> bool:
+    """Restrict a thread or process to ``cpus``.
+
+    Args:
+        cpus: CPU ids to allow.
+        pid: Process id, or 0 for the calling thread.
+
+    Returns:
+        True if the affinity was set, False where unsupported.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        logger.debug("CPU affinity is not supported on this platform")
+        return False
+    try:
+        os.sched_setaffinity(pid, cpus)
+    except OSError as e:
+        logger.warning("Could not set CPU affinity to %s: %s", cpus, e)
+        return False
+    return True
@@ -0,0 +1,98 @@
+"""Near-duplicate frame cache for OCR results."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+import cv2
+import numpy as np
+
+T = TypeVar("T")
+
+# Fine enough that one changed character of ordinary on-screen text moves
+# some cell by far more than the default match distance.
+FINGERPRINT_SIZE = (128, 96)
+
+
+def frame_fingerprint(frame: np.ndarray, size: tuple[int, int] = FINGERPRINT_SIZE) -> np.ndarray:
+    """Compute a cheap perceptual fingerprint of a frame.
+
+    The frame is converted to grayscale and area-averaged down to a small
+    thumbnail. Averaging over cells suppresses sensor noise, while a
+    changed character still moves the cells it covers.
+
+    Args:
+        frame: OpenCV image array (BGR or grayscale).
+        size: Thumbnail (width, height).
+
+    Returns:
+        uint8 thumbnail array of shape (height, width).
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+
+def fingerprint_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """Return the largest per-cell gray-level difference between two fingerprints."""
+    return float(np.max(np.abs(a.astype(np.int16) - b.astype(np.int16))))
+
+
+class FrameResultCache(Generic[T]):
+    """Bounded LRU cache that returns results for near-identical frames.
+
+    Entries are grouped by a hashable parameter key (language, thresholds,
+    preprocessing flags, frame shape). Within a group, a lookup hits when
+    a stored fingerprint is within ``max_distance`` of the query.
+    """
+
+    def __init__(self, max_entries: int = 32, max_distance: float = 6.0) -> None:
+        self._max_entries = max_entries
+        self._max_distance = max_distance
+        self._entries: OrderedDict[int, tuple[Hashable, np.ndarray, T]] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, fingerprint: np.ndarray, params: Hashable) -> T | None:
+        """Return the cached value for a matching frame, or None on a miss."""
+        with self._lock:
+            for entry_id, (entry_params, stored, value) in reversed(self._entries.items()):
+                if entry_params != params:
+                    continue
+                if fingerprint_distance(fingerprint, stored) <= self._max_distance:
+                    self._entries.move_to_end(entry_id)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def store(self, fingerprint: np.ndarray, params: Hashable, value: T) -> None:
+        """Insert a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[self._next_id] = (params, fingerprint, value)
+            self._next_id += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters, hit rate and current size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
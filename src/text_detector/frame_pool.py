@@ -0,0 +1,92 @@
+"""Reusable frame buffers for webcam capture, annotation and display."""
+
+import threading
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class FramePool:
+    """Capture buffers that frames are read into instead of fresh arrays.
+
+    Ownership is explicit: a buffer handed out by :meth:`acquire` (or a
+    frame recorded with :meth:`adopt`) stays in use until its owner hands
+    it back with :meth:`release`, and only then is it read into again. If
+    every buffer is in use, :meth:`acquire` returns None and the caller
+    reads into a new array, which :meth:`adopt` adds to the pool until it
+    holds ``max_buffers``. After the first few frames, capture allocates
+    nothing as long as consumers release what they take. Frames are
+    acquired and released from different threads.
+    """
+
+    def __init__(self, max_buffers: int = 8) -> None:
+        self.max_buffers = max_buffers
+        self.allocations = 0
+        self._lock = threading.Lock()
+        self._buffers: list[np.ndarray] = []
+        self._free: list[np.ndarray] = []
+
+    def acquire(self) -> np.ndarray | None:
+        """Take a free buffer for the next frame, or return None if all are in use."""
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def adopt(self, frame: np.ndarray) -> None:
+        """Record the frame a capture produced; it is in use until released.
+
+        Call with every captured frame. A frame not read into a pool
+        buffer counts as an allocation. A frame of a different shape or
+        dtype starts a new set of buffers; the old ones are dropped and
+        never handed out again.
+        """
+        with self._lock:
+            if self._owns(frame):
+                return
+            self.allocations += 1
+            if self._buffers and (
+                self._buffers[0].shape != frame.shape or self._buffers[0].dtype != frame.dtype
+            ):
+                self._buffers = []
+                self._free = []
+            if len(self._buffers) < self.max_buffers and frame.base is None:
+                self._buffers.append(frame)
+
+    def release(self, frame: np.ndarray) -> None:
+        """Hand back a frame so it can be read into again.
+
+        Neither the frame nor any view of it may be used afterwards.
+        Frames the pool does not own and repeated releases are ignored.
+        """
+        with self._lock:
+            if self._owns(frame) and not any(frame is free for free in self._free):
+                self._free.append(frame)
+
+    def clear(self) -> None:
+        """Drop every buffer, for example when capture stops."""
+        with self._lock:
+            self._buffers = []
+            self._free = []
+
+    def _owns(self, frame: np.ndarray) -> bool:
+        return any(frame is buffer for buffer in self._buffers)
+
+
+class ScratchBuffers:
+    """Named arrays reused from frame to frame, reallocated only when the shape changes.
+
+    Meant for intermediate images that are consumed before the next frame
+    is drawn, such as the annotated copy and its RGB conversion for
+    display. Whatever is written into a scratch array must not be kept.
+    """
+
+    def __init__(self) -> None:
+        self.allocations = 0
+        self._buffers: dict[str, np.ndarray] = {}
+
+    def get(self, name: str, shape: tuple[int, ...], dtype: DTypeLike = np.uint8) -> np.ndarray:
+        """Return the ``name`` buffer with ``shape`` and ``dtype``; its contents are undefined."""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._buffers[name] = np.empty(shape, dtype=dtype)
+            self.allocations += 1
+        return buffer
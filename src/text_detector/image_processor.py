@@ -60,6 +60,64 @@ def scale_detections(
     ]
 
 
+def offset_detections(
+    detections: list[Detection],
+    dx: float,
+    dy: float,
+) -> list[Detection]:
+    """Translate bounding box coordinates by a fixed offset.
+
+    Used to map detections from a crop or tile back onto the full frame.
+
+    Args:
+        detections: List of (bbox, text, confidence) tuples from EasyOCR.
+        dx: Horizontal offset in pixels.
+        dy: Vertical offset in pixels.
+
+    Returns:
+        List of detections with translated bounding boxes.
+    """
+    if dx == 0 and dy == 0:
+        return detections
+
+    return [
+        (
+            [[pt[0] + dx, pt[1] + dy] for pt in bbox],
+            text,
+            confidence,
+        )
+        for bbox, text, confidence in detections
+    ]
+
+
+def pad_to_common_size(frames: list[np.ndarray]) -> list[np.ndarray]:
+    """Pad frames with black borders so they all share one shape.
+
+    Padding is added to the right and bottom only, so pixel coordinates
+    inside each padded frame match the original frame. Grayscale frames
+    are converted to 3-channel BGR.
+
+    Args:
+        frames: OpenCV image arrays (BGR or grayscale).
+
+    Returns:
+        List of BGR frames with identical height and width.
+    """
+    bgr = [cv2.cvtColor(f, cv2.COLOR_GRAY2BGR) if f.ndim == 2 else f for f in frames]
+    height = max(f.shape[0] for f in bgr)
+    width = max(f.shape[1] for f in bgr)
+
+    padded = []
+    for frame in bgr:
+        if frame.shape[:2] == (height, width):
+            padded.append(frame)
+            continue
+        canvas = np.zeros((height, width, 3), dtype=frame.dtype)
+        canvas[: frame.shape[0], : frame.shape[1]] = frame
+        padded.append(canvas)
+    return padded
+
+
 def filter_text(
     detections: list[Detection],
     threshold: float,
@@ -107,6 +165,7 @@ def draw_boxes_with_colors(
     detections: list[Detection],
     box_color: tuple[int, int, int] = (0, 255, 0),
     text_color: tuple[int, int, int] = (0, 0, 255),
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Draw bounding boxes and text labels on a frame.
 
@@ -115,11 +174,17 @@ def draw_boxes_with_colors(
         detections: List of (bbox, text, confidence) tuples.
         box_color: BGR color for bounding box lines.
         text_color: BGR color for text labels.
+        out: Optional array of the frame's shape and dtype to copy into and
+            draw on, instead of allocating a new one.
 
     Returns:
-        New frame with bounding boxes and labels drawn.
+        Frame with bounding boxes and labels drawn (``out`` if given).
     """
-    result = frame.copy()
+    if out is None:
+        result = frame.copy()
+    else:
+        np.copyto(out, frame)
+        result = out
 
     for bbox, text, confidence in detections:
         points = [(int(pt[0]), int(pt[1])) for pt in bbox]
@@ -140,16 +205,17 @@ def draw_boxes_with_colors(
     return result
 
 
-def bgr_to_rgb(frame: np.ndarray) -> np.ndarray:
+def bgr_to_rgb(frame: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """Convert OpenCV BGR image to RGB.
 
     Args:
         frame: OpenCV image array (BGR).
+        out: Optional array of the frame's shape to write the result into.
 
     Returns:
-        RGB image array.
+        RGB image array (``out`` if given).
     """
-    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
 
 
 def preprocess_for_ocr(
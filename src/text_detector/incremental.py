@@ -0,0 +1,188 @@
+"""Incremental OCR that re-runs text detection only at a low cadence."""
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+Detection = tuple[list[list[float]], str, float]
+
+_SIGNATURE_SIZE = (32, 8)
+
+
+@dataclass
+class _TrackedBox:
+    """A detected text region with the pixels and text it had when last read."""
+
+    horizontal: list[int] | None
+    free: list[list[float]] | None
+    signature: np.ndarray
+    result: Detection | None = None
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Return the (x_min, x_max, y_min, y_max) bounding rectangle."""
+        if self.horizontal is not None:
+            x_min, x_max, y_min, y_max = self.horizontal
+            return int(x_min), int(x_max), int(y_min), int(y_max)
+        assert self.free is not None
+        xs = [pt[0] for pt in self.free]
+        ys = [pt[1] for pt in self.free]
+        return int(min(xs)), int(max(xs)), int(min(ys)), int(max(ys))
+
+    @property
+    def center(self) -> tuple[float, float]:
+        x_min, x_max, y_min, y_max = self.bounds
+        return (x_min + x_max) / 2, (y_min + y_max) / 2
+
+
+def _box_signature(gray: np.ndarray, bounds: tuple[int, int, int, int]) -> np.ndarray:
+    """Downsample the pixels under a box into a small float signature."""
+    x_min, x_max, y_min, y_max = bounds
+    height, width = gray.shape[:2]
+    x_min, x_max = max(0, x_min), min(width, max(x_max, x_min + 1))
+    y_min, y_max = max(0, y_min), min(height, max(y_max, y_min + 1))
+    crop = gray[y_min:y_max, x_min:x_max]
+    if crop.size == 0:
+        return np.zeros(_SIGNATURE_SIZE[::-1], dtype=np.float32)
+    return cv2.resize(crop, _SIGNATURE_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+def _center(bbox: list[list[float]]) -> tuple[float, float]:
+    xs = [pt[0] for pt in bbox]
+    ys = [pt[1] for pt in bbox]
+    return (min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2
+
+
+class IncrementalRecognizer:
+    """Split EasyOCR's detect and recognize stages across frames.
+
+    The CRAFT detector runs every ``detect_interval`` calls (or when the
+    frame size, reader key or most of the boxes change). In between, only
+    boxes whose pixels differ from the last time they were read go back
+    through the recognizer; unchanged boxes reuse their previous text.
+    Intended for a single live stream, one instance per worker.
+    """
+
+    def __init__(
+        self,
+        detect_interval: int = 10,
+        change_threshold: float = 12.0,
+        redetect_ratio: float = 0.5,
+    ) -> None:
+        self.detect_interval = detect_interval
+        self.change_threshold = change_threshold
+        self.redetect_ratio = redetect_ratio
+        self._boxes: list[_TrackedBox] = []
+        self._calls_since_detect = 0
+        self._shape: tuple[int, ...] | None = None
+        self._key: Hashable = None
+        self.detections = 0
+        self.recognized_boxes = 0
+        self.reused_boxes = 0
+
+    def reset(self) -> None:
+        """Drop the tracked boxes so the next call runs the detector."""
+        self._boxes = []
+        self._shape = None
+
+    def stats(self) -> dict[str, int]:
+        """Return how often the detector ran and how many boxes were reused."""
+        return {
+            "detections": self.detections,
+            "recognized_boxes": self.recognized_boxes,
+            "reused_boxes": self.reused_boxes,
+        }
+
+    def readtext(self, reader: Any, image: np.ndarray, key: Hashable = None) -> list[Detection]:
+        """Return detections for ``image``, reusing earlier work where possible.
+
+        Args:
+            reader: EasyOCR reader (anything with ``detect`` and ``recognize``).
+            image: OCR-ready image array (BGR or grayscale).
+            key: Identifies the reader configuration; a new key forces detection.
+
+        Returns:
+            List of (bbox, text, confidence) tuples, as from ``readtext``.
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+
+        if self._needs_detection(image.shape, key):
+            return self._detect(reader, image, gray, key)
+
+        changed = [
+            box
+            for box in self._boxes
+            if float(np.mean(np.abs(_box_signature(gray, box.bounds) - box.signature)))
+            > self.change_threshold
+        ]
+        if self._boxes and len(changed) / len(self._boxes) > self.redetect_ratio:
+            return self._detect(reader, image, gray, key)
+
+        self._calls_since_detect += 1
+        self.reused_boxes += len(self._boxes) - len(changed)
+        if changed:
+            self._recognize(reader, image, gray, changed)
+        return [box.result for box in self._boxes if box.result is not None]
+
+    def _needs_detection(self, shape: tuple[int, ...], key: Hashable) -> bool:
+        return (
+            self._shape != shape
+            or self._key != key
+            or not self._boxes
+            or self._calls_since_detect >= self.detect_interval
+        )
+
+    def _detect(
+        self, reader: Any, image: np.ndarray, gray: np.ndarray, key: Hashable
+    ) -> list[Detection]:
+        horizontal_list, free_list = reader.detect(image)
+        self._boxes = [
+            _TrackedBox(horizontal=list(box), free=None, signature=np.empty(0))
+            for box in horizontal_list[0]
+        ] + [
+            _TrackedBox(horizontal=None, free=[list(pt) for pt in box], signature=np.empty(0))
+            for box in free_list[0]
+        ]
+        self._shape = image.shape
+        self._key = key
+        self._calls_since_detect = 1
+        self.detections += 1
+        if self._boxes:
+            self._recognize(reader, image, gray, self._boxes)
+        return [box.result for box in self._boxes if box.result is not None]
+
+    def _recognize(
+        self,
+        reader: Any,
+        image: np.ndarray,
+        gray: np.ndarray,
+        boxes: list[_TrackedBox],
+    ) -> None:
+        """Recognize ``boxes`` in one call and match results back by position.
+
+        The recognizer sorts regions by their vertical position, so results
+        are assigned to the nearest requested box rather than by index.
+        """
+        results = reader.recognize(
+            image,
+            horizontal_list=[box.horizontal for box in boxes if box.horizontal is not None],
+            free_list=[box.free for box in boxes if box.free is not None],
+        )
+        self.recognized_boxes += len(boxes)
+
+        unassigned = list(boxes)
+        for box in boxes:
+            box.signature = _box_signature(gray, box.bounds)
+            box.result = None
+        for result in results:
+            if not unassigned:
+                break
+            cx, cy = _center(result[0])
+            nearest = min(
+                unassigned, key=lambda b: (b.center[0] - cx) ** 2 + (b.center[1] - cy) ** 2
+            )
+            nearest.result = result
+            unassigned.remove(nearest)
@@ -0,0 +1,141 @@
+"""Rolling per-stage timings and Prometheus text output for the OCR pipeline."""
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+# Recent samples kept per stage for the percentiles.
+DEFAULT_WINDOW = 512
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def summarize(samples: Iterable[float]) -> dict[str, Any]:
+    """Return the count, p50/p95/p99 and maximum of ``samples`` (seconds) in milliseconds."""
+    values = np.fromiter(samples, dtype=np.float64) * 1000
+    if not values.size:
+        return {"samples": 0}
+    p50, p95, p99 = np.percentile(values, [q * 100 for q in QUANTILES])
+    return {
+        "samples": int(values.size),
+        "p50_ms": round(float(p50), 1),
+        "p95_ms": round(float(p95), 1),
+        "p99_ms": round(float(p99), 1),
+        "max_ms": round(float(values.max()), 1),
+    }
+
+
+class StageTimer:
+    """Context manager timing one pipeline stage into :class:`StageMetrics`."""
+
+    __slots__ = ("_metrics", "_stage", "_times", "_start")
+
+    def __init__(self, metrics: "StageMetrics", stage: str, times: dict[str, float] | None) -> None:
+        self._metrics = metrics
+        self._stage = stage
+        self._times = times
+        self._start = 0.0
+
+    def __enter__(self) -> "StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self._start
+        self._metrics.record(self._stage, elapsed)
+        if self._times is not None:
+            self._times[self._stage] = self._times.get(self._stage, 0.0) + elapsed
+
+
+class StageMetrics:
+    """Rolling duration histograms for named pipeline stages.
+
+    Each stage keeps its last ``window`` durations for percentiles, plus a
+    running count and sum since start, which is what Prometheus expects
+    of a summary. Recording is one ``perf_counter`` pair and a deque
+    append under a lock, cheap next to any OCR stage.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._sums: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def time(self, stage: str, times: dict[str, float] | None = None) -> StageTimer:
+        """Return a context manager that records how long its body takes.
+
+        Args:
+            stage: Stage name.
+            times: Optional per-call dictionary the duration is also added to.
+        """
+        return StageTimer(self, stage, times)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one duration for ``stage``."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self._window)
+                self._counts[stage] = 0
+                self._sums[stage] = 0.0
+            samples.append(seconds)
+            self._counts[stage] += 1
+            self._sums[stage] += seconds
+
+    def record_many(self, times: dict[str, float]) -> None:
+        """Add one duration per stage, for example timings measured in a child process."""
+        for stage, seconds in times.items():
+            self.record(stage, seconds)
+
+    def _snapshot(self) -> dict[str, tuple[list[float], int, float]]:
+        """Return (recent samples, total count, total seconds) per stage."""
+        with self._lock:
+            return {
+                stage: (list(samples), self._counts[stage], self._sums[stage])
+                for stage, samples in self._samples.items()
+            }
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return percentiles of the recent durations per stage, in milliseconds."""
+        return {
+            stage: {**summarize(samples), "count": count, "total_s": round(total, 3)}
+            for stage, (samples, count, total) in self._snapshot().items()
+        }
+
+    def prometheus_lines(self, name: str, help_text: str, label: str = "stage") -> list[str]:
+        """Render the stages as one Prometheus summary, each stage as a ``label`` value."""
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+        for stage, (samples, count, total) in sorted(self._snapshot().items()):
+            values = np.percentile(samples, [q * 100 for q in QUANTILES])
+            for quantile, value in zip(QUANTILES, values, strict=True):
+                lines.append(f'{name}{{{label}="{stage}",quantile="{quantile:g}"}} {value:.6f}')
+            lines.append(f'{name}_count{{{label}="{stage}"}} {count}')
+            lines.append(f'{name}_sum{{{label}="{stage}"}} {total:.6f}')
+        return lines
+
+
+def counter_lines(name: str, help_text: str, label: str, values: dict[str, int]) -> list[str]:
+    """Render a Prometheus counter with one sample per ``label`` value."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    lines.extend(f'{name}{{{label}="{key}"}} {value}' for key, value in values.items())
+    return lines
+
+
+def write_textfile(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` atomically, as textfile collectors expect."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
@@ -0,0 +1,119 @@
+"""Change detection gate that decides when a live scene needs OCR."""
+
+import time
+
+import cv2
+import numpy as np
+
+from text_detector.config import AppSettings
+
+
+class MotionGate:
+    """Gate OCR on scene changes using a downsampled frame difference.
+
+    Every captured frame is fed to :meth:`update`, which scores how much
+    the scene moved since the previous frame. At each OCR opportunity
+    :meth:`should_run` returns True only once a change has been seen and
+    the scene has settled again, or when the last OCR run is older than
+    ``max_staleness`` seconds. The change is only consumed by
+    :meth:`mark_run`, so a frame the engine refuses does not lose it.
+    """
+
+    def __init__(
+        self,
+        change_threshold: float = 6.0,
+        settle_threshold: float = 2.0,
+        settle_frames: int = 3,
+        max_staleness: float = 10.0,
+        width: int = 64,
+    ) -> None:
+        self.change_threshold = change_threshold
+        self.settle_threshold = settle_threshold
+        self.settle_frames = settle_frames
+        self.max_staleness = max_staleness
+        self._width = width
+        self._previous: np.ndarray | None = None
+        self._pending = True
+        self._still_frames = 0
+        self._last_run: float | None = None
+        self.last_score = 0.0
+        self.triggered = 0
+        self.saved = 0
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "MotionGate":
+        """Create a gate using the thresholds configured in ``settings``."""
+        return cls(
+            change_threshold=settings.motion_change_threshold,
+            settle_threshold=settings.motion_settle_threshold,
+            settle_frames=settings.motion_settle_frames,
+            max_staleness=settings.motion_max_staleness,
+        )
+
+    def _downsample(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        height = max(1, round(gray.shape[0] * self._width / gray.shape[1]))
+        small = cv2.resize(gray, (self._width, height), interpolation=cv2.INTER_AREA)
+        return cv2.GaussianBlur(small, (3, 3), 0)
+
+    def update(self, frame: np.ndarray) -> float:
+        """Score a captured frame against the previous one.
+
+        Args:
+            frame: OpenCV image array (BGR or grayscale).
+
+        Returns:
+            Mean absolute gray-level difference of the downsampled frames.
+        """
+        small = self._downsample(frame)
+        if self._previous is None or self._previous.shape != small.shape:
+            score = 0.0
+            self._pending = True
+        else:
+            score = float(cv2.absdiff(small, self._previous).mean())
+
+        if score >= self.change_threshold:
+            self._pending = True
+            self._still_frames = 0
+        elif score <= self.settle_threshold:
+            self._still_frames += 1
+        else:
+            self._still_frames = 0
+
+        self._previous = small
+        self.last_score = score
+        return score
+
+    def should_run(self, now: float | None = None) -> bool:
+        """Decide whether OCR should run at this opportunity.
+
+        Args:
+            now: Monotonic timestamp in seconds. Defaults to the current time.
+
+        Returns:
+            True if the scene changed and settled, or the last run is stale.
+        """
+        now = time.monotonic() if now is None else now
+        stale = self._last_run is None or now - self._last_run >= self.max_staleness
+        settled = self._pending and self._still_frames >= self.settle_frames
+        if settled or stale:
+            return True
+        self.saved += 1
+        return False
+
+    def mark_run(self, now: float | None = None) -> None:
+        """Record that OCR was submitted for the current scene.
+
+        Args:
+            now: Monotonic timestamp in seconds. Defaults to the current time.
+        """
+        self._pending = False
+        self._last_run = time.monotonic() if now is None else now
+        self.triggered += 1
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next opportunity runs OCR."""
+        self._previous = None
+        self._pending = True
+        self._still_frames = 0
+        self._last_run = None
@@ -1,23 +1,57 @@
-"""OCR engine wrapper for EasyOCR with model caching and threading support."""
+"""OCR engine wrapper around pluggable backends with model caching and threading support."""
 
+import asyncio
+import contextlib
+import multiprocessing
 import queue
 import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import Future, InvalidStateError
+from copy import copy
+from dataclasses import dataclass, field, replace
+from multiprocessing.connection import Connection
+from pathlib import Path
 from typing import Any
 
+import cv2
 import numpy as np
 
+from text_detector.adaptive import AdaptiveWidthController
+from text_detector.backends import DEFAULT_ONNX_DIR, BackendOptions, OCRBackend, load_backend
 from text_detector.config import AppSettings
-from text_detector.image_processor import preprocess_for_ocr, resize_frame_for_ocr, scale_detections
+from text_detector.cpu_threads import ThreadPlan, apply_library_threads, pin_to_cpus, plan_threads
+from text_detector.frame_cache import FrameResultCache, frame_fingerprint
+from text_detector.image_processor import (
+    offset_detections,
+    pad_to_common_size,
+    preprocess_for_ocr,
+    resize_frame_for_ocr,
+    scale_detections,
+)
+from text_detector.incremental import IncrementalRecognizer
+from text_detector.metrics import StageMetrics, counter_lines, write_textfile
+from text_detector.reader_cache import ReaderCache
+from text_detector.shared_frames import FrameReader, FrameSlot
+from text_detector.tiling import suppress_duplicates, tile_grid
 from text_detector.utils.logging_setup import get_logger
+from text_detector.work_queue import PriorityWorkQueue
 
 logger = get_logger("ocr_engine")
 
-_MAX_CACHE_SIZE = 2
+_WARM_UP_TEXT = "Warm up 0123"
+
+# Request classes, most important first. Interactive requests (a loaded or
+# pasted image) overtake streaming ones (webcam frames) and may evict them.
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_STREAMING = "streaming"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_STREAMING)
+# Seconds between watchdog checks for hung workers.
+_WATCHDOG_INTERVAL = 1.0
 
 BBox = list[list[float]]
 Detection = tuple[BBox, str, float]
+ROI = tuple[int, int, int, int]
 
 
 @dataclass
@@ -27,125 +61,824 @@ class DetectionResult:
     languages: list[str]
     success: bool = True
     error: str | None = None
+    captured_at: float | None = None
+    started_at: float | None = None
+    completed_at: float | None = None
+    stage_times: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def latency(self) -> float | None:
+        """Return seconds from frame capture to result delivery, if known."""
+        if self.captured_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.captured_at
+
+    @property
+    def service_time(self) -> float | None:
+        """Return seconds from a worker picking the frame up to delivery, if known."""
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.started_at
+
+
+@dataclass
+class _OCRRequest:
+    """A frame waiting in the work queue, tagged with its class and submission order."""
+
+    seq: int
+    frame: np.ndarray
+    languages: list[str] | None
+    threshold: float | None
+    callback: Callable[[DetectionResult], None] | None
+    captured_at: float
+    future: Future[DetectionResult] | None = None
+    reuse_similar: bool = False
+    started_at: float | None = None
+    deadline: float | None = None
+    priority: str = PRIORITY_STREAMING
+
+
+def _warm_up_image() -> np.ndarray:
+    """Create a small synthetic text image used to run a first inference."""
+    image = np.full((64, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(image, _WARM_UP_TEXT, (8, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    return image
+
+
+def _worker_process_main(
+    conn: Connection,
+    settings: AppSettings,
+    language_sets: list[list[str]] | None = None,
+    thread_plan: ThreadPlan | None = None,
+) -> None:
+    """Serve OCR requests from the parent engine inside a child process.
+
+    The child owns a private in-process engine (and therefore its own
+    EasyOCR reader). Frames arrive through a shared-memory
+    :class:`FrameSlot` and are read in place, so only a small header goes
+    in and the detections come back over the pipe. Before serving, the
+    child warms up each of
+    ``language_sets`` and reports it with a ``("warm", languages)``
+    message (``"failed"`` if it could not load), followed by
+    ``("ready", None)``.
+    """
+    if thread_plan is not None:
+        apply_library_threads(thread_plan)
+    # The parent engine owns the adaptive width and sends it with each request.
+    engine = OCREngine(
+        replace(
+            settings,
+            ocr_workers=1,
+            ocr_pool_mode="thread",
+            result_cache_size=0,
+            adaptive_ocr_width=False,
+        ),
+        start_workers=False,
+    )
+    for languages in language_sets or []:
+        warmed = engine.warm_up(languages)
+        conn.send(("warm" if warmed else "failed", languages))
+    conn.send(("ready", None))
+    frames = FrameReader()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        header, languages, threshold, current = message
+        if current.gpu_enabled != engine._settings.gpu_enabled:
+            engine.clear_cache()
+        engine._settings = copy(current)
+        engine._settings.ocr_workers = 1
+        engine._settings.ocr_pool_mode = "thread"
+        engine._settings.result_cache_size = 0
+        engine._settings.adaptive_ocr_width = False
+        frame = frames.read(header)
+        result = engine.detect_text(frame, languages, threshold)
+        # Drop the shared-memory view before the parent reuses the slot.
+        del frame
+        conn.send(result)
+    frames.close()
+    engine.shutdown()
+    conn.close()
+
+
+class _WorkerProcess:
+    """Handle on a child process that runs OCR for one pool slot."""
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        name: str,
+        language_sets: list[list[str]] | None = None,
+        thread_plan: ThreadPlan | None = None,
+    ) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._frames = FrameSlot()
+        self._process = ctx.Process(
+            target=_worker_process_main,
+            args=(child_conn, settings, language_sets, thread_plan),
+            daemon=True,
+            name=name,
+        )
+        self._process.start()
+        child_conn.close()
+
+    @property
+    def pid(self) -> int | None:
+        """Return the child's process id."""
+        return self._process.pid
+
+    def wait_ready(self, on_warm: Callable[[list[str], bool], None]) -> None:
+        """Block until the child has warmed up, calling ``on_warm`` per language set."""
+        while True:
+            try:
+                kind, languages = self._conn.recv()
+            except EOFError:
+                return
+            if kind == "ready":
+                return
+            on_warm(languages, kind == "warm")
+
+    def run(
+        self,
+        frame: np.ndarray,
+        languages: list[str] | None,
+        threshold: float | None,
+        settings: AppSettings,
+    ) -> DetectionResult:
+        """Hand a frame to the child through shared memory and wait for its detections."""
+        header = self._frames.write(frame)
+        self._conn.send((header, languages, threshold, settings))
+        result: DetectionResult = self._conn.recv()
+        return result
+
+    def kill(self) -> None:
+        """Terminate the child at once, abandoning the request it is running."""
+        self._process.kill()
+        self._process.join(timeout=1.0)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Ask the child to exit, terminating it if it does not comply."""
+        with contextlib.suppress(OSError):
+            self._conn.send(None)
+        self._process.join(timeout=timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._conn.close()
+        self._frames.release()
 
 
 class OCREngine:
     """Thread-safe OCR engine with model caching.
 
-    Uses a single worker thread with a bounded queue to prevent
-    thread explosion and memory exhaustion. Only processes one
-    frame at a time; excess frames are dropped.
+    Runs ``settings.ocr_workers`` worker threads fed by a bounded queue
+    to prevent thread explosion and memory exhaustion. Each worker owns
+    its own reader: in ``"thread"`` pool mode the reader lives in this
+    process, in ``"process"`` mode the worker forwards frames to a
+    dedicated child process. Results are delivered in submission order.
+    When the queue is full, ``settings.ocr_queue_mode`` decides what
+    happens to a new frame: ``"drop"`` rejects it, ``"latest"`` replaces
+    the oldest waiting frame so results never lag far behind the camera.
+
+    Each request is either ``"interactive"`` or ``"streaming"``. Workers
+    take waiting interactive requests first, and an interactive request
+    that finds the queue full evicts a waiting streaming frame. Results are
+    delivered in submission order within each class, so a still image is
+    never held back behind webcam frames. Streaming work resumes once no
+    interactive request is waiting.
+
+    Besides callbacks, :meth:`submit` returns a ``concurrent.futures.Future``
+    and :meth:`detect_text_asyncio` can be awaited. Results are only kept
+    on a queue for :meth:`get_result` when ``settings.result_channel_size``
+    is set, and that channel is bounded.
+
+    Results are also kept in a small near-duplicate cache, so a frame that
+    looks like one recognised recently is answered without running OCR.
+
+    Latency is bounded in two ways. A request may carry a deadline; if no
+    worker has started it by then it is discarded unrun. A watchdog thread
+    fails any request running longer than ``settings.ocr_hang_timeout_ms``
+    and replaces its worker: a child process is killed, while a stuck
+    thread cannot be stopped and is abandoned with its reader.
+
+    With ``settings.preload_models`` the default language (and any
+    ``settings.preload_languages``) is loaded and run once on a background
+    thread as soon as the engine starts. Async frames for a language that
+    is still loading are dropped rather than left waiting in the queue.
     """
 
-    def __init__(self, settings: AppSettings | None = None) -> None:
+    def __init__(self, settings: AppSettings | None = None, *, start_workers: bool = True) -> None:
         self._settings = settings or AppSettings()
-        self._cache: dict[tuple[str, ...], Any] = {}
+        self._readers = ReaderCache(
+            max_bytes=self._settings.reader_cache_max_mb * 1024 * 1024,
+            idle_ttl=self._settings.reader_idle_ttl,
+        )
         self._lock = threading.Lock()
-        self._result_queue: queue.Queue[DetectionResult] = queue.Queue()
-        self._work_queue: queue.Queue[tuple] = queue.Queue(maxsize=1)
-        self._worker_thread: threading.Thread | None = None
+        self._local = threading.local()
+        self._result_queue: queue.Queue[DetectionResult] | None = None
+        if self._settings.result_channel_size > 0:
+            self._result_queue = queue.Queue(maxsize=self._settings.result_channel_size)
+        self._num_workers = self._settings.ocr_workers
+        self._work_queue: PriorityWorkQueue[_OCRRequest] = PriorityWorkQueue(
+            self._num_workers, PRIORITIES, lambda request: request.priority
+        )
+        # Signalled when a worker takes a request off the queue or the engine stops.
+        self._slot_free = threading.Condition()
+        # Events of detect_text_asyncio calls waiting for room, with their loops.
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._worker_threads: list[threading.Thread] = []
+        self._processes: dict[int, _WorkerProcess] = {}
         self._running = True
-        self._is_processing = False
-        self._start_worker()
+        self._stopped = threading.Event()
+        # Request each worker slot is currently running, watched for hangs.
+        self._running_requests: dict[int, _OCRRequest] = {}
+        self._state_lock = threading.Lock()
+        self._delivery_lock = threading.Lock()
+        self._active = 0
+        self._next_seq = dict.fromkeys(PRIORITIES, 0)
+        self._next_delivery = dict.fromkeys(PRIORITIES, 0)
+        self._completed: dict[tuple[str, int], tuple[_OCRRequest, DetectionResult | None]] = {}
+        self.submitted_frames = 0
+        self.dropped_frames = 0
+        self.replaced_frames = 0
+        self.evicted_frames = 0
+        self.expired_frames = 0
+        self.hung_workers = 0
+        self.cancelled_running = 0
+        self._last_latency: float | None = None
+        # Capture-to-delivery latency, recorded per priority class.
+        self._latency = StageMetrics()
+        self._metrics = StageMetrics()
+        self._result_cache: FrameResultCache[DetectionResult] | None = None
+        if self._settings.result_cache_size > 0:
+            self._result_cache = FrameResultCache(
+                self._settings.result_cache_size,
+                self._settings.result_cache_max_distance,
+            )
+        self._incremental: dict[int, IncrementalRecognizer] = {}
+        self._thread_plan = plan_threads(self._settings)
+        self._warm: set[tuple[int, tuple[str, ...]]] = set()
+        self._process_preload: list[list[str]] | None = None
+        self._preload_total = 0
+        self._preload_done = 0
+        self.dropped_while_loading = 0
+        self.tiled_frames = 0
+        self.tiles_processed = 0
+        self._width_controller: AdaptiveWidthController | None = None
+        if self._settings.adaptive_ocr_width:
+            self._width_controller = AdaptiveWidthController.from_settings(self._settings)
+        if start_workers:
+            if self._settings.preload_models:
+                self.preload()
+            self._start_workers()
+
+    def _preload_language_sets(self) -> list[list[str]]:
+        """Return the configured language sets to load ahead of the first frame."""
+        sets = [[self._settings.default_language]]
+        sets.extend([lang] for lang in self._settings.preload_languages)
+        unique: list[list[str]] = []
+        for languages in sets:
+            if languages not in unique:
+                unique.append(languages)
+        return unique
+
+    def preload(self, language_sets: list[list[str]] | None = None) -> None:
+        """Load and warm up readers in the background.
+
+        In ``"thread"`` pool mode a daemon thread builds one reader per
+        worker slot for each language set and runs it once on a small
+        synthetic image, so the first real frame does not pay for the
+        import, model construction or first inference. In ``"process"``
+        mode each child process does the same before it starts serving.
+
+        Args:
+            language_sets: Language lists to load, in order. Defaults to the
+                default language followed by ``settings.preload_languages``.
+        """
+        sets = language_sets or self._preload_language_sets()
+        if self._settings.ocr_pool_mode == "process":
+            if self._worker_threads:
+                logger.debug("Process workers already started; languages load on demand")
+                return
+            self._process_preload = sets
+            with self._state_lock:
+                self._preload_total += len(sets) * self._num_workers
+            return
 
-    def _start_worker(self) -> None:
-        """Start the single OCR worker thread."""
-        self._worker_thread = threading.Thread(
-            target=self._worker_loop, daemon=True, name="ocr-worker"
+        with self._state_lock:
+            self._preload_total += len(sets) * self._num_workers
+        thread = threading.Thread(
+            target=self._preload_loop, args=(sets,), daemon=True, name="ocr-preload"
         )
-        self._worker_thread.start()
+        thread.start()
+
+    def _preload_loop(self, language_sets: list[list[str]]) -> None:
+        """Warm every worker slot for each language set, most likely first."""
+        for languages in language_sets:
+            for slot in range(self._num_workers):
+                if not self._running:
+                    return
+                if self._reader_key(slot, languages) in self._readers:
+                    self._preload_step_done(slot, languages, True)
+                    continue
+                self._local.slot = slot
+                self._preload_step_done(slot, languages, self.warm_up(languages))
+
+    def _preload_step_done(self, slot: int, languages: list[str], warmed: bool) -> None:
+        """Count a finished preload step, remembering the slot as ready if it warmed."""
+        with self._state_lock:
+            if warmed:
+                self._warm.add((slot, tuple(sorted(languages))))
+            self._preload_done += 1
+
+    def warm_up(self, languages: list[str]) -> bool:
+        """Load the reader for ``languages`` in the calling slot and run it once.
+
+        Args:
+            languages: Language codes to load.
+
+        Returns:
+            True if the reader loaded and ran, False if it failed.
+        """
+        try:
+            reader = self._get_reader(languages)
+            reader.readtext(_warm_up_image())
+        except Exception as e:
+            logger.warning("OCR warm-up failed for %s: %s", languages, e)
+            return False
+        logger.info("OCR model warmed up for languages: %s", languages)
+        return True
+
+    @property
+    def is_loading(self) -> bool:
+        """Return True while background model preloading is still running."""
+        with self._state_lock:
+            return self._preload_done < self._preload_total
+
+    @property
+    def preload_progress(self) -> tuple[int, int]:
+        """Return (finished, total) preload steps, one per worker and language set."""
+        with self._state_lock:
+            return self._preload_done, self._preload_total
+
+    def is_ready(self, languages: list[str] | None = None) -> bool:
+        """Return True if every worker has a warmed-up reader for ``languages``."""
+        langs = tuple(sorted(languages or [self._settings.default_language]))
+        with self._state_lock:
+            return all((slot, langs) in self._warm for slot in range(self._num_workers))
+
+    def _start_workers(self) -> None:
+        """Start one OCR worker thread per pool slot, plus the hang watchdog."""
+        preload = self._process_preload if self._settings.ocr_pool_mode == "process" else None
+        for slot in range(self._num_workers):
+            self._worker_threads.append(self._start_worker(slot, preload))
+        threading.Thread(target=self._watchdog_loop, daemon=True, name="ocr-watchdog").start()
+        if self._settings.metrics_file:
+            threading.Thread(target=self._metrics_loop, daemon=True, name="ocr-metrics").start()
+
+    def _start_worker(
+        self, slot: int, language_sets: list[list[str]] | None = None
+    ) -> threading.Thread:
+        """Start the worker thread for ``slot``, warming ``language_sets`` before serving."""
+        name = "ocr-worker" if self._num_workers == 1 else f"ocr-worker-{slot}"
+        thread = threading.Thread(
+            target=self._worker_loop, args=(slot, language_sets), daemon=True, name=name
+        )
+        thread.start()
+        return thread
+
+    def _worker_loop(self, slot: int, language_sets: list[list[str]] | None = None) -> None:
+        """Process OCR requests one at a time from the shared work queue."""
+        self._local.slot = slot
+        plan = self._thread_plan
+        cpus = plan.cpu_sets[slot] if plan.cpu_sets else None
+        process: _WorkerProcess | None = None
+        if self._settings.ocr_pool_mode == "process":
+            process = _WorkerProcess(
+                self._settings,
+                name=f"ocr-process-{slot}",
+                language_sets=language_sets,
+                thread_plan=plan,
+            )
+            with self._state_lock:
+                self._processes[slot] = process
+            if cpus and process.pid is not None:
+                pin_to_cpus(cpus, process.pid)
+            process.wait_ready(
+                lambda languages, warmed: self._preload_step_done(slot, languages, warmed)
+            )
+        else:
+            apply_library_threads(plan)
+            if cpus:
+                pin_to_cpus(cpus)
+            for languages in language_sets or []:
+                self._preload_step_done(slot, languages, self.warm_up(languages))
 
-    def _worker_loop(self) -> None:
-        """Process OCR requests one at a time from the work queue."""
         while self._running:
             try:
-                item = self._work_queue.get(timeout=1.0)
+                request = self._work_queue.get(timeout=1.0)
             except queue.Empty:
+                self._readers.evict_idle()
+                continue
+            self._notify_slot_free()
+
+            if request.deadline is not None and time.monotonic() > request.deadline:
+                self._expire(request)
+                continue
+            if request.future is not None and request.future.cancelled():
+                self._cancel_future(request.future)
+                self._complete(request, None)
+                self._work_queue.task_done()
                 continue
 
-            frame, languages, threshold, callback = item
-            self._is_processing = True
+            request.started_at = time.monotonic()
+            self._metrics.record("wait", request.started_at - request.captured_at)
+            with self._state_lock:
+                self._active += 1
+                self._running_requests[slot] = request
             try:
-                result = self.detect_text(frame, languages, threshold)
+                if process is not None:
+                    result = self._run_in_process(process, request)
+                else:
+                    result = self.detect_text(
+                        request.frame,
+                        request.languages,
+                        request.threshold,
+                        reuse_similar=request.reuse_similar,
+                    )
             except Exception as e:
                 logger.error("OCR worker error: %s", e)
                 result = DetectionResult(
                     detections=[],
-                    languages=languages or [self._settings.default_language],
+                    languages=request.languages or [self._settings.default_language],
                     success=False,
                     error=str(e),
                 )
-            finally:
-                self._is_processing = False
 
-            if callback:
-                callback(result)
-            self._result_queue.put(result)
+            with self._state_lock:
+                abandoned = self._running_requests.get(slot) is not request
+                if not abandoned:
+                    del self._running_requests[slot]
+                    self._active -= 1
+            if abandoned:
+                # The watchdog already failed this request and started a replacement.
+                logger.warning("Abandoned OCR worker %d finished after all; exiting", slot)
+                if process is not None:
+                    process.close(timeout=1.0)
+                return
+            self._complete(request, result)
             self._work_queue.task_done()
 
-    def _evict_cache_if_needed(self) -> None:
-        """Evict oldest cached model if cache exceeds max size."""
-        while len(self._cache) > _MAX_CACHE_SIZE:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            logger.info("Evicted cached model: %s", oldest_key)
+    def _expire(self, request: _OCRRequest) -> None:
+        """Discard a request whose deadline passed before a worker could start it."""
+        with self._state_lock:
+            self.expired_frames += 1
+        if request.future is not None:
+            self._cancel_future(request.future)
+        self._complete(request, None)
+        self._work_queue.task_done()
 
-    def _get_reader(self, languages: list[str]) -> Any:
-        """Get or create a cached EasyOCR reader.
+    def _watchdog_loop(self) -> None:
+        """Check for hung workers until the engine shuts down."""
+        while not self._stopped.wait(_WATCHDOG_INTERVAL):
+            self._check_hung_workers()
+
+    def _check_hung_workers(self, now: float | None = None) -> int:
+        """Fail requests running longer than the hang timeout and replace their workers.
+
+        Args:
+            now: Monotonic timestamp to measure against. Defaults to the current time.
+
+        Returns:
+            Number of workers replaced.
+        """
+        timeout = self._settings.ocr_hang_timeout_ms / 1000
+        if timeout <= 0:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._state_lock:
+            hung = [
+                (slot, request)
+                for slot, request in self._running_requests.items()
+                if request.started_at is not None and now - request.started_at > timeout
+            ]
+        replaced = 0
+        for slot, request in hung:
+            result = DetectionResult(
+                detections=[],
+                languages=request.languages or [self._settings.default_language],
+                success=False,
+                error=f"OCR timed out after {timeout:g} s",
+            )
+            if self._abandon(slot, request, result):
+                logger.error("OCR worker %d hung for over %g s; replaced it", slot, timeout)
+                with self._state_lock:
+                    self.hung_workers += 1
+                replaced += 1
+        return replaced
+
+    def _abandon(self, slot: int, request: _OCRRequest, result: DetectionResult | None) -> bool:
+        """Finish a running request with ``result`` and give its slot a fresh worker.
+
+        A child process is killed, which interrupts the request. A worker
+        thread cannot be interrupted: it keeps running in the background,
+        its reader and incremental state are dropped from the caches so the
+        replacement never shares them, and it exits once its call returns.
+        The replacement warms the languages the old worker had loaded.
+
+        Returns:
+            False if the request finished before it could be abandoned.
+        """
+        with self._state_lock:
+            if self._running_requests.get(slot) is not request:
+                return False
+            del self._running_requests[slot]
+            self._active -= 1
+            warm = [key for key in self._warm if key[0] == slot]
+            self._warm.difference_update(warm)
+            self._preload_total += len(warm)
+            process = self._processes.pop(slot, None)
+        if process is not None:
+            process.kill()
+        else:
+            self._readers.discard(lambda key: isinstance(key, tuple) and key[0] == slot)
+            # Not under self._lock: a hung thread may be holding it inside a model load.
+            self._incremental.pop(slot, None)
+        self._complete(request, result)
+        self._work_queue.task_done()
+        if self._running:
+            self._worker_threads[slot] = self._start_worker(slot, [list(k[1]) for k in warm])
+        return True
+
+    def _run_in_process(self, process: _WorkerProcess, request: _OCRRequest) -> DetectionResult:
+        """Forward a request to a child process, consulting the result cache first."""
+        langs = request.languages or [self._settings.default_language]
+        width = self.ocr_width
+        key = None
+        if request.reuse_similar:
+            key = self._cache_key(request.frame, langs, request.threshold, width)
+        if key is not None:
+            cached = self._lookup_cached(*key)
+            if cached is not None:
+                return cached
+        settings = self._settings
+        if width != settings.ocr_max_width:
+            settings = copy(settings)
+            settings.ocr_max_width = width
+        start = time.perf_counter()
+        result = process.run(request.frame, request.languages, request.threshold, settings)
+        self._metrics.record_many(result.stage_times)
+        if result.success:
+            # A model the child loaded for this request says nothing about OCR speed.
+            load = result.stage_times.get("load", 0.0)
+            self._adapt_width(max(0.0, time.perf_counter() - start - load), result.detections)
+        if key is not None and result.success:
+            self._store_cached(*key, result)
+        return result
+
+    @property
+    def ocr_width(self) -> int:
+        """Return the width frames are downscaled to, adaptive or fixed.
+
+        Tiled OCR reads at full resolution, so it always uses the fixed width.
+        """
+        if self._width_controller is not None and not self._settings.tiled_ocr:
+            return self._width_controller.width
+        return self._settings.ocr_max_width
+
+    def _adapt_width(self, elapsed: float, detections: list[Detection]) -> None:
+        """Feed one call's latency and mean confidence to the width controller."""
+        if self._width_controller is None:
+            return
+        confidence = sum(d[2] for d in detections) / len(detections) if detections else None
+        self._width_controller.update(elapsed, confidence)
+
+    def _cache_key(
+        self,
+        frame: np.ndarray,
+        langs: list[str],
+        threshold: float | None,
+        width: int,
+    ) -> tuple[np.ndarray, tuple[Any, ...]] | None:
+        """Return the (fingerprint, params) cache key for a request, or None if disabled.
+
+        ``width`` is the OCR input width the request runs at, so a result
+        computed at another adaptive width is never reused.
+        """
+        if self._result_cache is None:
+            return None
+        conf_threshold = threshold if threshold is not None else self._settings.default_confidence
+        params = (
+            tuple(langs),
+            conf_threshold,
+            self._settings.preprocess_enabled,
+            width,
+            self._settings.paragraph_merge,
+            frame.shape,
+        )
+        return frame_fingerprint(frame), params
+
+    def _lookup_cached(
+        self, fingerprint: np.ndarray, params: tuple[Any, ...]
+    ) -> DetectionResult | None:
+        if self._result_cache is None:
+            return None
+        return self._result_cache.lookup(fingerprint, params)
+
+    def _store_cached(
+        self, fingerprint: np.ndarray, params: tuple[Any, ...], result: DetectionResult
+    ) -> None:
+        if self._result_cache is not None:
+            self._result_cache.store(fingerprint, params, result)
+
+    def _complete(self, request: _OCRRequest, result: DetectionResult | None) -> None:
+        """Record a finished request and deliver every result of its class now in order.
+
+        A ``None`` result marks a request that was replaced or cancelled
+        before it ran; it keeps its place in the order but nothing is
+        delivered for it.
+        """
+        priority = request.priority
+        with self._state_lock:
+            self._completed[priority, request.seq] = (request, result)
+
+        with self._delivery_lock:
+            while True:
+                with self._state_lock:
+                    entry = self._completed.pop((priority, self._next_delivery[priority]), None)
+                    if entry is None:
+                        return
+                    self._next_delivery[priority] += 1
+                if entry[1] is not None:
+                    self._deliver(entry[0], entry[1])
+
+    def _deliver(self, request: _OCRRequest, result: DetectionResult) -> None:
+        """Stamp a result with its timings and hand it to its future, callback and channel."""
+        # Copy so a result shared through the result cache is never mutated.
+        result = replace(
+            result,
+            captured_at=request.captured_at,
+            started_at=request.started_at,
+            completed_at=time.monotonic(),
+        )
+        self._last_latency = result.latency
+        if result.latency is not None:
+            self._latency.record(request.priority, result.latency)
+        if request.future is not None:
+            try:
+                request.future.set_result(result)
+            except InvalidStateError:
+                # Cancelled while it ran; nobody wants the result.
+                self._cancel_future(request.future)
+                return
+        if request.callback:
+            try:
+                request.callback(result)
+            except Exception:
+                logger.exception("OCR result callback failed")
+        if self._result_queue is not None:
+            self._publish(self._result_queue, result)
+
+    @staticmethod
+    def _publish(channel: queue.Queue[DetectionResult], result: DetectionResult) -> None:
+        """Put a result on the bounded channel, discarding the oldest one if it is full."""
+        while True:
+            try:
+                channel.put_nowait(result)
+                return
+            except queue.Full:
+                with contextlib.suppress(queue.Empty):
+                    channel.get_nowait()
+
+    def _reader_key(
+        self, slot: int, languages: list[str]
+    ) -> tuple[int, tuple[str, ...], bool, str]:
+        """Return the reader cache key for a worker slot and language list."""
+        settings = self._settings
+        return slot, tuple(sorted(languages)), settings.gpu_enabled, settings.ocr_backend
+
+    def _get_reader(
+        self, languages: list[str], times: dict[str, float] | None = None
+    ) -> OCRBackend:
+        """Get or create a cached reader from the configured backend.
+
+        Readers are cached per worker slot so pooled workers never share
+        one model instance, and per device and backend so toggling the GPU
+        or switching backend does not discard the other readers. The cache
+        is an LRU bounded by ``settings.reader_cache_max_mb`` and
+        ``settings.reader_idle_ttl``.
 
         Args:
             languages: List of language codes.
+            times: Per-call stage timings; a model load is added as ``"load"``.
 
         Returns:
-            EasyOCR Reader instance.
+            Backend instance (an EasyOCR Reader for both built-in backends).
         """
-        import easyocr
+        key = self._reader_key(getattr(self._local, "slot", 0), languages)
+        _slot, langs, gpu, backend = key
+        model_dir = self._settings.onnx_model_dir
+        options = BackendOptions(
+            gpu=gpu,
+            threads=self._thread_plan.intra_op,
+            model_dir=Path(model_dir) if model_dir else DEFAULT_ONNX_DIR,
+        )
 
-        key = tuple(sorted(languages))
+        def load() -> OCRBackend:
+            logger.info("Loading %s OCR model for languages: %s", backend, languages)
+            with self._metrics.time("load", times):
+                return load_backend(backend, list(langs), options)
 
         with self._lock:
-            if key not in self._cache:
-                self._evict_cache_if_needed()
-                logger.info("Loading OCR model for languages: %s", languages)
-                self._cache[key] = easyocr.Reader(
-                    list(key),
-                    gpu=self._settings.gpu_enabled,
-                )
-                logger.info("OCR model loaded successfully")
+            reader: OCRBackend = self._readers.get(key, load)
+            return reader
 
-        return self._cache[key]
+    def _incremental_recognizer(self) -> IncrementalRecognizer:
+        """Return the incremental recognizer owned by the calling worker slot."""
+        slot = getattr(self._local, "slot", 0)
+        with self._lock:
+            if slot not in self._incremental:
+                self._incremental[slot] = IncrementalRecognizer(
+                    detect_interval=self._settings.incremental_detect_interval,
+                    change_threshold=self._settings.incremental_change_threshold,
+                )
+            return self._incremental[slot]
 
     def detect_text(
         self,
         frame: np.ndarray,
         languages: list[str] | None = None,
         threshold: float | None = None,
+        reuse_similar: bool = False,
     ) -> DetectionResult:
         """Run OCR on a frame and return filtered detections.
 
+        With ``settings.tiled_ocr``, frames larger than ``ocr_max_width``
+        are read at full resolution in overlapping tiles instead of being
+        downscaled. Each pipeline stage is timed into :meth:`stats` and
+        onto the result's ``stage_times``.
+
         Args:
             frame: Image array (numpy) to process.
             languages: Language codes for OCR. Uses default if None.
             threshold: Confidence threshold for filtering. Uses default if None.
+            reuse_similar: Answer from the near-duplicate result cache when a
+                recent frame looks the same. Meant for live video, where
+                consecutive frames repeat; leave off for distinct images.
 
         Returns:
             DetectionResult with detections and metadata.
         """
         langs = languages or [self._settings.default_language]
         conf_threshold = threshold if threshold is not None else self._settings.default_confidence
+        times: dict[str, float] = {}
+        timer = self._metrics.time
+
+        width = self.ocr_width
 
         try:
-            reader = self._get_reader(langs)
-            ocr_frame, scale = resize_frame_for_ocr(frame, self._settings.ocr_max_width)
-            if self._settings.preprocess_enabled:
-                ocr_frame = preprocess_for_ocr(ocr_frame)
-            raw_results = reader.readtext(
-                ocr_frame,
-                paragraph=self._settings.paragraph_merge,
-            )
-            detections = [item for item in raw_results if item[2] >= conf_threshold]
-            detections = scale_detections(detections, 1.0 / scale)
-            return DetectionResult(detections=detections, languages=langs)
+            key = self._cache_key(frame, langs, conf_threshold, width) if reuse_similar else None
+            if key is not None:
+                with timer("cache_lookup", times):
+                    cached = self._lookup_cached(*key)
+                if cached is not None:
+                    return cached
+
+            if self._settings.tiled_ocr and max(frame.shape[:2]) > self._settings.ocr_max_width:
+                result = self._detect_tiled(frame, langs, conf_threshold, times)
+            else:
+                reader = self._get_reader(langs, times)
+                # Timed from here so a model load never counts as a slow OCR call.
+                start = time.perf_counter()
+                with timer("resize", times):
+                    ocr_frame, scale = resize_frame_for_ocr(frame, width)
+                if self._settings.preprocess_enabled:
+                    with timer("preprocess", times):
+                        ocr_frame = preprocess_for_ocr(ocr_frame)
+                with timer("inference", times):
+                    if self._settings.incremental_ocr and not self._settings.paragraph_merge:
+                        raw_results = self._incremental_recognizer().readtext(
+                            reader, ocr_frame, key=(tuple(langs), self._settings.preprocess_enabled)
+                        )
+                    else:
+                        raw_results = reader.readtext(
+                            ocr_frame,
+                            paragraph=self._settings.paragraph_merge,
+                        )
+                self._adapt_width(time.perf_counter() - start, raw_results)
+                with timer("filter", times):
+                    detections = [item for item in raw_results if item[2] >= conf_threshold]
+                with timer("scale", times):
+                    detections = scale_detections(detections, 1.0 / scale)
+                result = DetectionResult(detections=detections, languages=langs)
+            result.stage_times = times
+            if key is not None:
+                self._store_cached(*key, result)
+            return result
         except Exception as e:
             logger.error("OCR detection failed: %s", e)
             return DetectionResult(
@@ -155,47 +888,462 @@ class OCREngine:
                 error=str(e),
             )
 
+    def detect_text_batch(
+        self,
+        frames: list[np.ndarray] | np.ndarray,
+        languages: list[str] | None = None,
+        threshold: float | None = None,
+        rois: list[ROI] | None = None,
+    ) -> list[DetectionResult]:
+        """Run OCR on many images with batched inference calls.
+
+        Each image goes through the same resize, preprocess and rescale
+        steps as :meth:`detect_text`. Images are padded to a common size
+        and sent to the reader's ``readtext_batched`` in chunks of
+        ``settings.ocr_batch_size``, so the detector runs once per chunk
+        instead of once per image.
+
+        Args:
+            frames: List of image arrays, or a single frame when ``rois`` is given.
+            languages: Language codes for OCR. Uses default if None.
+            threshold: Confidence threshold for filtering. Uses default if None.
+            rois: Optional (x1, y1, x2, y2) regions of a single frame. Boxes are
+                returned in full-frame coordinates.
+
+        Returns:
+            One DetectionResult per input image or region, in input order.
+
+        Raises:
+            ValueError: If ``rois`` is given with a list of frames.
+        """
+        langs = languages or [self._settings.default_language]
+        conf_threshold = threshold if threshold is not None else self._settings.default_confidence
+
+        if rois is not None:
+            if not isinstance(frames, np.ndarray):
+                raise ValueError("rois requires a single frame")
+            items = [(frames[y1:y2, x1:x2], (x1, y1)) for x1, y1, x2, y2 in rois]
+        else:
+            items = [(frame, (0, 0)) for frame in frames]
+
+        results: list[DetectionResult] = []
+        size = self._settings.ocr_batch_size
+        for start in range(0, len(items), size):
+            results.extend(self._detect_chunk(items[start : start + size], langs, conf_threshold))
+        return results
+
+    def _detect_chunk(
+        self,
+        items: list[tuple[np.ndarray, tuple[int, int]]],
+        langs: list[str],
+        conf_threshold: float,
+        times: dict[str, float] | None = None,
+    ) -> list[DetectionResult]:
+        """Run one batched inference call over a chunk of images."""
+        timer = self._metrics.time
+        try:
+            reader = self._get_reader(langs, times)
+            ocr_frames = []
+            scales = []
+            for frame, _offset in items:
+                with timer("resize", times):
+                    ocr_frame, scale = resize_frame_for_ocr(frame, self._settings.ocr_max_width)
+                if self._settings.preprocess_enabled:
+                    with timer("preprocess", times):
+                        ocr_frame = preprocess_for_ocr(ocr_frame)
+                ocr_frames.append(ocr_frame)
+                scales.append(scale)
+
+            with timer("inference", times):
+                if hasattr(reader, "readtext_batched"):
+                    batch_results = reader.readtext_batched(
+                        pad_to_common_size(ocr_frames),
+                        paragraph=self._settings.paragraph_merge,
+                        batch_size=len(ocr_frames),
+                    )
+                else:
+                    batch_results = [
+                        reader.readtext(f, paragraph=self._settings.paragraph_merge)
+                        for f in ocr_frames
+                    ]
+
+            results = []
+            for raw_results, scale, (_frame, (dx, dy)) in zip(
+                batch_results, scales, items, strict=True
+            ):
+                with timer("filter", times):
+                    detections = [item for item in raw_results if item[2] >= conf_threshold]
+                with timer("scale", times):
+                    detections = scale_detections(detections, 1.0 / scale)
+                    detections = offset_detections(detections, dx, dy)
+                results.append(DetectionResult(detections=detections, languages=langs))
+            return results
+        except Exception as e:
+            logger.error("Batched OCR detection failed: %s", e)
+            return [
+                DetectionResult(detections=[], languages=langs, success=False, error=str(e))
+                for _ in items
+            ]
+
+    def _detect_tiled(
+        self,
+        frame: np.ndarray,
+        langs: list[str],
+        conf_threshold: float,
+        times: dict[str, float] | None = None,
+    ) -> DetectionResult:
+        """OCR a large frame at full resolution in overlapping tiles.
+
+        Tiles are ``ocr_max_width`` pixels square, so none is downscaled.
+        They go through the reader ``ocr_batch_size`` at a time in one
+        batched call each, which also bounds peak memory: only one chunk
+        of tiles is preprocessed and padded at once, whatever the frame
+        size. Duplicates along tile seams are then suppressed.
+        """
+        size = self._settings.ocr_max_width
+        tiles = tile_grid(frame.shape[0], frame.shape[1], size, self._settings.ocr_tile_overlap)
+        detections: list[Detection] = []
+        chunk = self._settings.ocr_batch_size
+        for start in range(0, len(tiles), chunk):
+            batch = tiles[start : start + chunk]
+            items = [(frame[y1:y2, x1:x2], (x1, y1)) for x1, y1, x2, y2 in batch]
+            for result in self._detect_chunk(items, langs, conf_threshold, times):
+                if not result.success:
+                    raise RuntimeError(result.error)
+                detections.extend(result.detections)
+        with self._state_lock:
+            self.tiled_frames += 1
+            self.tiles_processed += len(tiles)
+        with self._metrics.time("merge_tiles", times):
+            detections = suppress_duplicates(detections)
+        return DetectionResult(detections=detections, languages=langs)
+
     def detect_text_async(
         self,
         frame: np.ndarray,
         languages: list[str] | None = None,
         threshold: float | None = None,
         callback: Callable[[DetectionResult], None] | None = None,
+        captured_at: float | None = None,
+        reuse_similar: bool = False,
+        deadline: float | None = None,
+        priority: str = PRIORITY_STREAMING,
     ) -> bool:
         """Submit a frame for async OCR processing.
 
-        Only one frame is processed at a time. If the worker is busy,
-        the new frame is dropped (non-blocking).
+        Up to ``ocr_workers`` frames can wait in the queue. If it is full,
+        the new frame is dropped in ``"drop"`` queue mode, or replaces the
+        oldest waiting frame in ``"latest"`` mode (whose callback then never
+        fires). Never blocks. Callbacks fire in the order frames were
+        accepted, even when workers finish out of order.
 
         Args:
             frame: Image array to process.
             languages: Language codes for OCR.
             threshold: Confidence threshold.
             callback: Function called with DetectionResult when complete.
+            captured_at: ``time.monotonic()`` timestamp of the frame capture,
+                copied onto the result. Defaults to the submission time.
+            reuse_similar: Allow a near-duplicate cached result, as in
+                :meth:`detect_text`.
+            deadline: Seconds after ``captured_at`` by which a worker must
+                start the frame. Later it is discarded and its callback never
+                fires. None waits however long it takes.
+            priority: ``"streaming"`` for live frames, ``"interactive"`` for
+                an image the user is waiting on.
+
+        Returns:
+            True if the frame was queued, False if dropped (workers busy or
+            the model for ``languages`` is still being preloaded).
+        """
+        if self._loading_gate_closed(languages):
+            return False
+        request = self._new_request(
+            frame, languages, threshold, callback, None, captured_at, deadline, priority
+        )
+        request.reuse_similar = reuse_similar
+        if self._try_enqueue(request, self._settings.ocr_queue_mode == "latest"):
+            return True
+        with self._state_lock:
+            self.dropped_frames += 1
+        return False
+
+    def submit(
+        self,
+        frame: np.ndarray,
+        languages: list[str] | None = None,
+        threshold: float | None = None,
+        captured_at: float | None = None,
+        block: bool = False,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        priority: str = PRIORITY_STREAMING,
+    ) -> Future[DetectionResult]:
+        """Submit a frame and return a future for its result.
+
+        Without ``block`` admission follows :meth:`detect_text_async`: a
+        dropped frame, or one later replaced in ``"latest"`` mode, comes
+        back as a cancelled future. With ``block`` the call waits for a
+        free queue slot instead, so no frame is dropped or replaced.
+
+        Args:
+            frame: Image array to process.
+            languages: Language codes for OCR.
+            threshold: Confidence threshold.
+            captured_at: ``time.monotonic()`` timestamp of the frame capture.
+            block: Wait for room in the queue rather than dropping.
+            timeout: Longest wait in seconds when blocking. None waits forever.
+            deadline: Seconds after ``captured_at`` by which a worker must
+                start the frame, as in :meth:`detect_text_async`.
+            priority: Request class, as in :meth:`detect_text_async`.
 
         Returns:
-            True if the frame was queued, False if dropped (worker busy).
+            Future resolved with the DetectionResult, or cancelled if the
+            frame was dropped, replaced or cancelled. It stays pending while
+            the frame runs; pass it to :meth:`cancel` to abandon it even then.
         """
+        future: Future[DetectionResult] = Future()
+        if not block and self._loading_gate_closed(languages):
+            future.cancel()
+            return future
+
+        request = self._new_request(
+            frame, languages, threshold, None, future, captured_at, deadline, priority
+        )
+        wait_until = None if timeout is None else time.monotonic() + timeout
+        replace_pending = not block and self._settings.ocr_queue_mode == "latest"
+        # Holding the condition while trying to enqueue means a worker that
+        # frees a slot in between cannot notify before we wait.
+        with self._slot_free:
+            while not (self._running and self._try_enqueue(request, replace_pending)):
+                remaining = None if wait_until is None else wait_until - time.monotonic()
+                expired = remaining is not None and remaining <= 0
+                if not block or expired or not self._running:
+                    with self._state_lock:
+                        self.dropped_frames += 1
+                    future.cancel()
+                    return future
+                self._slot_free.wait(remaining)
+        return future
+
+    async def detect_text_asyncio(
+        self,
+        frame: np.ndarray,
+        languages: list[str] | None = None,
+        threshold: float | None = None,
+        captured_at: float | None = None,
+    ) -> DetectionResult:
+        """Run OCR on a frame from asyncio code without blocking the event loop.
+
+        Waits for a free queue slot rather than dropping, so many calls
+        can be awaited concurrently (for example with ``asyncio.gather``)
+        and are processed by the worker pool as slots free up. The wait
+        happens on the event loop, not in an executor thread, and a call
+        cancelled while waiting never queues its frame.
+
+        Args:
+            frame: Image array to process.
+            languages: Language codes for OCR.
+            threshold: Confidence threshold.
+            captured_at: ``time.monotonic()`` timestamp of the frame capture.
+
+        Returns:
+            DetectionResult with detections and metadata.
+
+        Raises:
+            asyncio.CancelledError: If the engine shut down before the frame ran.
+        """
+        future: Future[DetectionResult] = Future()
+        request = self._new_request(frame, languages, threshold, None, future, captured_at)
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._slot_free:
+            self._async_waiters.add(waiter)
         try:
-            self._work_queue.put_nowait((frame, languages, threshold, callback))
+            while True:
+                # Cleared before trying, so a slot freed after a failed try
+                # still wakes the wait below.
+                waiter[1].clear()
+                if not self._running:
+                    with self._state_lock:
+                        self.dropped_frames += 1
+                    future.cancel()
+                    break
+                if self._try_enqueue(request, replace_pending=False):
+                    break
+                await waiter[1].wait()
+        finally:
+            with self._slot_free:
+                self._async_waiters.discard(waiter)
+        return await asyncio.wrap_future(future)
+
+    def _notify_slot_free(self) -> None:
+        """Wake blocked :meth:`submit` calls and waiting :meth:`detect_text_asyncio` calls."""
+        with self._slot_free:
+            self._slot_free.notify_all()
+            waiters = list(self._async_waiters)
+        for loop, event in waiters:
+            # The loop may have closed since the waiter registered.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(event.set)
+
+    def _loading_gate_closed(self, languages: list[str] | None) -> bool:
+        """Return True (and count the drop) if ``languages`` is still preloading."""
+        if self.is_loading and not self.is_ready(languages):
+            with self._state_lock:
+                self.dropped_while_loading += 1
             return True
+        return False
+
+    def _new_request(
+        self,
+        frame: np.ndarray,
+        languages: list[str] | None,
+        threshold: float | None,
+        callback: Callable[[DetectionResult], None] | None,
+        future: Future[DetectionResult] | None,
+        captured_at: float | None,
+        deadline: float | None = None,
+        priority: str = PRIORITY_STREAMING,
+    ) -> _OCRRequest:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown request priority: {priority!r}")
+        if captured_at is None:
+            captured_at = time.monotonic()
+        request = _OCRRequest(-1, frame, languages, threshold, callback, captured_at, future)
+        request.priority = priority
+        if deadline is not None:
+            request.deadline = captured_at + deadline
+        return request
+
+    def cancel(self, future: Future[DetectionResult]) -> bool:
+        """Cancel a request submitted with :meth:`submit`, even one already running.
+
+        Futures stay pending until their result is set, so the future is
+        cancelled (``future.cancelled()`` is True) unless the result is
+        already there, in either pool mode. A waiting request is skipped by
+        the workers. A running request is interrupted in ``"process"`` pool
+        mode by killing its child process; the slot's replacement process
+        must reload its models. A worker thread cannot be stopped, so in
+        ``"thread"`` mode a running request runs to the end and its result
+        is discarded.
+
+        Args:
+            future: Future returned by :meth:`submit`.
+
+        Returns:
+            True if the future was cancelled, False if it already had a result.
+        """
+        if not future.cancel():
+            return False
+        if self._settings.ocr_pool_mode == "process":
+            with self._state_lock:
+                running = [
+                    (slot, request)
+                    for slot, request in self._running_requests.items()
+                    if request.future is future
+                ]
+            for slot, request in running:
+                if self._abandon(slot, request, None):
+                    with self._state_lock:
+                        self.cancelled_running += 1
+                    self._cancel_future(future)
+        return True
+
+    @staticmethod
+    def _cancel_future(future: Future[DetectionResult]) -> bool:
+        """Cancel the future of a request that is being discarded.
+
+        Also wakes any ``concurrent.futures.wait`` on it, which ``cancel()``
+        alone does not do. Call once per request, where it is disposed of.
+
+        Returns:
+            False if the future already has a result.
+        """
+        if not future.cancel():
+            return False
+        future.set_running_or_notify_cancel()
+        return True
+
+    def _try_enqueue(self, request: _OCRRequest, replace_pending: bool) -> bool:
+        """Give ``request`` the next sequence number of its class and queue it without blocking."""
+        with self._state_lock:
+            request.seq = self._next_seq[request.priority]
+            try:
+                self._work_queue.put_nowait(request)
+            except queue.Full:
+                if not self._replace_pending(request, replace_pending):
+                    return False
+            self._next_seq[request.priority] += 1
+            self.submitted_frames += 1
+        return True
+
+    def _replace_pending(self, request: _OCRRequest, replace_pending: bool) -> bool:
+        """Make room for ``request`` by discarding a waiting one. Caller holds the state lock.
+
+        An interactive request evicts the oldest waiting streaming frame.
+        With ``replace_pending`` a request may instead replace the oldest
+        waiting one of its own class. Streaming frames never evict
+        interactive requests.
+        """
+        if request.priority != PRIORITY_STREAMING and self._discard_waiting(PRIORITY_STREAMING):
+            self.evicted_frames += 1
+        elif replace_pending and self._discard_waiting(request.priority):
+            self.replaced_frames += 1
+        try:
+            self._work_queue.put_nowait(request)
         except queue.Full:
             return False
+        return True
+
+    def _discard_waiting(self, priority: str) -> bool:
+        """Cancel the oldest waiting request of ``priority``. Caller holds the state lock."""
+        stale = self._work_queue.pop_oldest(priority)
+        if stale is None:
+            return False
+        self._work_queue.task_done()
+        self._completed[stale.priority, stale.seq] = (stale, None)
+        if stale.future is not None:
+            self._cancel_future(stale.future)
+        return True
+
+    def has_room(self, priority: str = PRIORITY_STREAMING) -> bool:
+        """Return True if a request of ``priority`` would be queued rather than dropped now."""
+        if not self._work_queue.full():
+            return True
+        if priority != PRIORITY_STREAMING and self._work_queue.qsize(PRIORITY_STREAMING):
+            return True
+        return self._settings.ocr_queue_mode == "latest" and self._work_queue.qsize(priority) > 0
 
     @property
     def is_busy(self) -> bool:
-        """Return True if the OCR worker is currently processing."""
-        return self._is_processing or not self._work_queue.empty()
+        """Return True if every OCR worker is occupied or the queue is full."""
+        return self._active >= self._num_workers or self._work_queue.full()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests queued or being processed."""
+        return self._active + self._work_queue.qsize()
+
+    @property
+    def num_workers(self) -> int:
+        """Return the number of OCR worker slots."""
+        return self._num_workers
 
     def get_result(self, timeout: float = 30.0) -> DetectionResult | None:
-        """Get the next result from the async queue.
+        """Get the next result from the bounded result channel.
+
+        The channel only exists when ``settings.result_channel_size`` is
+        positive; it keeps the newest results and discards the oldest when
+        nobody drains it. Prefer callbacks or :meth:`submit` futures.
 
         Args:
             timeout: Seconds to wait for a result.
 
         Returns:
-            DetectionResult or None if timeout.
+            DetectionResult, or None on timeout or if the channel is disabled.
         """
+        if self._result_queue is None:
+            return None
         try:
             return self._result_queue.get(timeout=timeout)
         except queue.Empty:
@@ -204,18 +1352,150 @@ class OCREngine:
     def clear_cache(self) -> None:
         """Clear the model cache to free memory."""
         with self._lock:
-            self._cache.clear()
+            self._readers.clear()
             logger.info("OCR model cache cleared")
+        if self._settings.ocr_pool_mode == "thread":
+            with self._state_lock:
+                self._warm.clear()
 
     def shutdown(self) -> None:
-        """Shut down the worker thread and clear cache."""
+        """Shut down the worker threads and processes and clear cache."""
         self._running = False
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=5.0)
+        self._stopped.set()
+        self._notify_slot_free()
+        for thread in self._worker_threads:
+            if thread.is_alive():
+                thread.join(timeout=5.0)
+        for process in self._processes.values():
+            process.close()
+        self._processes.clear()
+        self._cancel_pending()
         self.clear_cache()
         logger.info("OCR engine shut down")
 
+    def _cancel_pending(self) -> None:
+        """Cancel the futures of requests still waiting when the workers stopped."""
+        while True:
+            try:
+                request = self._work_queue.get_nowait()
+            except queue.Empty:
+                return
+            if request.future is not None:
+                self._cancel_future(request.future)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of engine counters for monitoring.
+
+        Returns:
+            Dictionary of counter groups keyed by component name.
+        """
+        done, total = self.preload_progress
+        latency = self._latency.stats()
+        stats: dict[str, Any] = {
+            "workers": self._num_workers,
+            "preload": {
+                "done": done,
+                "total": total,
+                "dropped_while_loading": self.dropped_while_loading,
+            },
+            "readers": self._readers.stats(),
+            "queue": {
+                "mode": self._settings.ocr_queue_mode,
+                "submitted": self.submitted_frames,
+                "dropped": self.dropped_frames,
+                "replaced": self.replaced_frames,
+                "evicted": self.evicted_frames,
+                "last_latency_ms": (
+                    round(self._last_latency * 1000, 1) if self._last_latency is not None else None
+                ),
+            },
+            "latency": {priority: latency.get(priority, {"samples": 0}) for priority in PRIORITIES},
+            "stages": self._metrics.stats(),
+            "timeouts": {
+                "expired": self.expired_frames,
+                "hung": self.hung_workers,
+                "cancelled_running": self.cancelled_running,
+            },
+        }
+        if self._result_cache is not None:
+            stats["result_cache"] = self._result_cache.stats()
+        if self._width_controller is not None:
+            stats["adaptive_width"] = self._width_controller.stats()
+        if self.tiled_frames:
+            stats["tiling"] = {"frames": self.tiled_frames, "tiles": self.tiles_processed}
+        if self._incremental:
+            totals: dict[str, int] = {}
+            for recognizer in self._incremental.values():
+                for name, value in recognizer.stats().items():
+                    totals[name] = totals.get(name, 0) + value
+            stats["incremental"] = totals
+        return stats
+
+    def prometheus_text(self) -> str:
+        """Render stage timings, latency and counters in Prometheus text format."""
+        readers = self._readers.stats()
+        lines = [
+            *self._metrics.prometheus_lines(
+                "text_detector_ocr_stage_seconds", "Time spent in each OCR pipeline stage."
+            ),
+            *self._latency.prometheus_lines(
+                "text_detector_ocr_latency_seconds",
+                "Frame capture to result delivery, per priority class.",
+                label="priority",
+            ),
+            *counter_lines(
+                "text_detector_ocr_requests_total",
+                "OCR requests by outcome.",
+                "outcome",
+                {
+                    "submitted": self.submitted_frames,
+                    "dropped": self.dropped_frames,
+                    "dropped_while_loading": self.dropped_while_loading,
+                    "replaced": self.replaced_frames,
+                    "evicted": self.evicted_frames,
+                    "expired": self.expired_frames,
+                    "timed_out": self.hung_workers,
+                    "cancelled": self.cancelled_running,
+                },
+            ),
+            *counter_lines(
+                "text_detector_ocr_reader_cache_total",
+                "OCR model cache lookups and evictions.",
+                "result",
+                {
+                    "hit": readers["hits"],
+                    "miss": readers["misses"],
+                    "eviction": readers["evictions"],
+                },
+            ),
+        ]
+        if self._result_cache is not None:
+            cache = self._result_cache.stats()
+            lines.extend(
+                counter_lines(
+                    "text_detector_ocr_result_cache_total",
+                    "Near-duplicate frame result cache lookups.",
+                    "result",
+                    {"hit": int(cache["hits"]), "miss": int(cache["misses"])},
+                )
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_metrics(self, path: Path | None = None) -> None:
+        """Write :meth:`prometheus_text` to ``path`` (default ``settings.metrics_file``)."""
+        target = path or Path(self._settings.metrics_file)
+        try:
+            write_textfile(target, self.prometheus_text())
+        except OSError as e:
+            logger.warning("Could not write OCR metrics to %s: %s", target, e)
+
+    def _metrics_loop(self) -> None:
+        """Rewrite the metrics file every ``metrics_interval`` seconds until shutdown."""
+        while not self._stopped.wait(self._settings.metrics_interval):
+            self.write_metrics()
+        self.write_metrics()
+
     @property
     def cache_size(self) -> int:
         """Return number of cached models."""
-        return len(self._cache)
+        return len(self._readers)
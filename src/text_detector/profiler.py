@@ -0,0 +1,311 @@
+"""Opt-in sampling profiler with collapsed-stack and speedscope output."""
+
+import argparse
+import json
+import math
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+from text_detector.utils.logging_setup import get_logger
+
+logger = get_logger("profiler")
+
+PROFILE_ENV = "TEXT_DETECTOR_PROFILE"
+PROFILE_RATE_ENV = "TEXT_DETECTOR_PROFILE_RATE"
+DEFAULT_RATE = 100.0
+# The Tk main thread, webcam capture and the OCR workers ("ocr-worker" or
+# "ocr-worker-N").
+DEFAULT_THREADS = ("MainThread", "capture", "ocr-worker")
+MAX_DEPTH = 128
+
+# (function name, file, first line) identifying one stack frame.
+FrameKey = tuple[str, str, int]
+
+
+def _thread_matches(name: str, prefixes: tuple[str, ...] | None) -> bool:
+    if prefixes is None:
+        return True
+    return any(name == prefix or name.startswith(f"{prefix}-") for prefix in prefixes)
+
+
+class SamplingProfiler:
+    """Periodically sample the Python stacks of selected threads.
+
+    A daemon thread wakes ``rate`` times a second, reads every thread's
+    current frame with ``sys._current_frames()`` and counts each distinct
+    stack per thread name. Nothing is installed in the sampled threads, so
+    the cost is one stack walk per thread per sample, paid by the sampler
+    while it holds the GIL.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        threads: tuple[str, ...] | None = DEFAULT_THREADS,
+        output: Path | None = None,
+    ) -> None:
+        """Create a stopped profiler.
+
+        Args:
+            rate: Samples per second.
+            threads: Thread names to sample. A name also matches its
+                numbered variants ("ocr-worker" matches "ocr-worker-1").
+                None samples every thread.
+            output: Default file for :meth:`dump`.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.threads = threads
+        self.output = output
+        self._stacks: dict[str, Counter[tuple[FrameKey, ...]]] = {}
+        self._keys: dict[CodeType, FrameKey] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._dump_requested = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._samples = 0
+        self._sampling_time = 0.0
+        self._started_at = 0.0
+        self._elapsed = 0.0
+
+    @property
+    def running(self) -> bool:
+        """True while the sampler thread runs."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="profiler")
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; collected stacks are kept for :meth:`dump`."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._elapsed += time.perf_counter() - self._started_at
+
+    def request_dump(self) -> None:
+        """Ask the sampler thread to write :attr:`output` at its next sample.
+
+        Safe to call from a signal handler.
+        """
+        self._dump_requested.set()
+
+    def _run(self) -> None:
+        interval = 1.0 / self.rate
+        own_ident = threading.get_ident()
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            self.sample(exclude=own_ident)
+            self._sampling_time += time.perf_counter() - start
+            if self._dump_requested.is_set():
+                self._dump_requested.clear()
+                self._safe_dump()
+            next_sample += interval
+            # Skip missed ticks rather than sampling in a burst.
+            next_sample = max(next_sample, time.perf_counter())
+            self._stop.wait(next_sample - time.perf_counter())
+
+    def sample(self, exclude: int | None = None) -> None:
+        """Record one stack for every selected thread.
+
+        Args:
+            exclude: Thread ident to leave out, normally the sampler itself.
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        with self._lock:
+            self._samples += 1
+            for ident, frame in frames.items():
+                name = names.get(ident)
+                if ident == exclude or name is None or not _thread_matches(name, self.threads):
+                    continue
+                stack = self._walk(frame)
+                self._stacks.setdefault(name, Counter())[stack] += 1
+
+    def _walk(self, frame: FrameType | None) -> tuple[FrameKey, ...]:
+        """Return the stack ending at ``frame``, outermost call first."""
+        keys: list[FrameKey] = []
+        while frame is not None and len(keys) < MAX_DEPTH:
+            code = frame.f_code
+            key = self._keys.get(code)
+            if key is None:
+                key = self._keys[code] = (code.co_name, code.co_filename, code.co_firstlineno)
+            keys.append(key)
+            frame = frame.f_back
+        keys.reverse()
+        return tuple(keys)
+
+    def _snapshot(self) -> dict[str, dict[tuple[FrameKey, ...], int]]:
+        with self._lock:
+            return {name: dict(stacks) for name, stacks in self._stacks.items()}
+
+    def stats(self) -> dict[str, Any]:
+        """Return sample counts per thread and the sampler's own overhead."""
+        elapsed = self._elapsed + (time.perf_counter() - self._started_at if self.running else 0)
+        return {
+            "samples": self._samples,
+            "threads": {
+                name: sum(stacks.values()) for name, stacks in sorted(self._snapshot().items())
+            },
+            "overhead": round(self._sampling_time / elapsed, 4) if elapsed > 0 else 0.0,
+        }
+
+    def collapsed(self) -> str:
+        """Render the samples as collapsed stacks, one ``thread;f1;f2 count`` per line.
+
+        This is the input format of flamegraph.pl, inferno and speedscope.
+        """
+        lines = []
+        for name, stacks in sorted(self._snapshot().items()):
+            for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                frames = ";".join(_label(key) for key in stack)
+                lines.append(f"{name};{frames} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def speedscope(self) -> dict[str, Any]:
+        """Render the samples as a speedscope document with one profile per thread."""
+        frame_index: dict[FrameKey, int] = {}
+        frames: list[dict[str, Any]] = []
+        profiles = []
+        interval = 1.0 / self.rate
+        for name, stacks in sorted(self._snapshot().items()):
+            samples, weights = [], []
+            for stack, count in stacks.items():
+                indices = []
+                for key in stack:
+                    if key not in frame_index:
+                        frame_index[key] = len(frames)
+                        frames.append({"name": key[0], "file": key[1], "line": key[2]})
+                    indices.append(frame_index[key])
+                samples.append(indices)
+                weights.append(count * interval)
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": "text-detector",
+            "activeProfileIndex": 0,
+            "exporter": "text-detector profiler",
+        }
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Write everything sampled so far.
+
+        A ``.json`` path gets speedscope output, anything else collapsed
+        stacks. The file is replaced on every call, so repeated dumps grow
+        to cover the whole session.
+
+        Args:
+            path: Output file. Defaults to :attr:`output`.
+
+        Raises:
+            ValueError: If no path is given and :attr:`output` is unset.
+        """
+        path = path or self.output
+        if path is None:
+            raise ValueError("no output path for the profile")
+        text = json.dumps(self.speedscope()) if path.suffix == ".json" else self.collapsed()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        stats = self.stats()
+        logger.info(
+            "Wrote profile of %d samples to %s (sampler overhead %.1f%%)",
+            stats["samples"],
+            path,
+            stats["overhead"] * 100,
+        )
+        return path
+
+    def _safe_dump(self) -> None:
+        try:
+            self.dump()
+        except (OSError, ValueError) as exc:
+            logger.error("Could not write profile: %s", exc)
+
+    def install_signal_handler(self) -> bool:
+        """Dump to :attr:`output` on SIGUSR1. Returns False where there is no SIGUSR1.
+
+        Must be called from the main thread.
+        """
+        sigusr1 = getattr(signal, "SIGUSR1", None)
+        if sigusr1 is None:
+            return False
+        signal.signal(sigusr1, lambda _signum, _frame: self.request_dump())
+        return True
+
+
+def _label(key: FrameKey) -> str:
+    name, filename, line = key
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def positive_rate(text: str) -> float:
+    """Parse a sampling rate: a finite number of samples per second above 0.
+
+    Raises:
+        argparse.ArgumentTypeError: If ``text`` is not such a number.
+    """
+    try:
+        rate = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {text!r}") from None
+    if not (math.isfinite(rate) and rate > 0):
+        raise argparse.ArgumentTypeError(f"rate must be positive, got {text!r}")
+    return rate
+
+
+def profiler_from_options(
+    output: str | None = None, rate: float | None = None
+) -> SamplingProfiler | None:
+    """Build a profiler from CLI options, falling back to the environment.
+
+    ``TEXT_DETECTOR_PROFILE`` gives the output path and
+    ``TEXT_DETECTOR_PROFILE_RATE`` the samples per second when the
+    matching option is not given. An invalid or non-positive rate from
+    either source falls back to :data:`DEFAULT_RATE` with a warning.
+
+    Returns:
+        A stopped profiler, or None when profiling is not requested.
+    """
+    output = output or os.environ.get(PROFILE_ENV)
+    if not output:
+        return None
+    if rate is None:
+        env_rate = os.environ.get(PROFILE_RATE_ENV)
+        try:
+            rate = positive_rate(env_rate) if env_rate else DEFAULT_RATE
+        except argparse.ArgumentTypeError:
+            logger.warning("Ignoring invalid %s=%r", PROFILE_RATE_ENV, env_rate)
+            rate = DEFAULT_RATE
+    elif not (math.isfinite(rate) and rate > 0):
+        logger.warning("Ignoring invalid profile rate %r", rate)
+        rate = DEFAULT_RATE
+    return SamplingProfiler(rate=rate, output=Path(output).expanduser())
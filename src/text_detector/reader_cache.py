@@ -0,0 +1,189 @@
+"""Memory-budgeted LRU cache for OCR readers."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from text_detector.utils.logging_setup import get_logger
+
+logger = get_logger("reader_cache")
+
+# Used when a reader's size cannot be measured; close to one EasyOCR
+# CRAFT detector plus a recognition model held in float32.
+FALLBACK_READER_BYTES = 120 * 1024 * 1024
+
+
+def estimate_reader_bytes(reader: Any) -> int:
+    """Estimate the resident memory held by an EasyOCR reader's models.
+
+    Sums the parameter and buffer sizes of the reader's ``detector`` and
+    ``recognizer`` torch modules. Readers that do not expose them (or
+    report nothing) are assumed to use :data:`FALLBACK_READER_BYTES`.
+
+    Args:
+        reader: EasyOCR Reader instance.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    total = 0
+    for name in ("detector", "recognizer"):
+        module = getattr(reader, name, None)
+        if module is None:
+            continue
+        try:
+            tensors = [*module.parameters(), *module.buffers()]
+            total += sum(int(t.numel()) * int(t.element_size()) for t in tensors)
+        except (AttributeError, TypeError):
+            continue
+    return total if total > 0 else FALLBACK_READER_BYTES
+
+
+@dataclass
+class _Entry:
+    """A cached reader with its estimated size and usage times."""
+
+    reader: Any
+    size: int
+    load_seconds: float
+    last_used: float
+
+
+class ReaderCache:
+    """LRU cache of readers bounded by estimated memory and idle time.
+
+    A lookup moves the reader to the most recently used end. After a load,
+    least recently used readers are evicted until the total estimated size
+    fits ``max_bytes``; the reader just loaded is always kept, even if it
+    alone exceeds the budget. Readers unused for longer than ``idle_ttl``
+    seconds are dropped on the next lookup or :meth:`evict_idle` call.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        idle_ttl: float = 0.0,
+        size_of: Callable[[Any], int] = estimate_reader_bytes,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._idle_ttl = idle_ttl
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the reader for ``key``, calling ``loader`` on a miss.
+
+        Args:
+            key: Identifies the reader (worker slot, languages, device).
+            loader: Builds a new reader when none is cached.
+
+        Returns:
+            The cached or newly loaded reader.
+        """
+        self.evict_idle(keep=key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.last_used = self._clock()
+                self.hits += 1
+                return entry.reader
+            self.misses += 1
+
+        start = time.perf_counter()
+        reader = loader()
+        elapsed = time.perf_counter() - start
+        size = self._size_of(reader)
+
+        with self._lock:
+            self._entries[key] = _Entry(reader, size, elapsed, self._clock())
+            self.load_seconds += elapsed
+            self._evict_over_budget(keep=key)
+        logger.info("Loaded reader %s in %.2fs (~%d MB)", key, elapsed, size // (1024 * 1024))
+        return reader
+
+    def _evict_over_budget(self, keep: Hashable) -> None:
+        """Drop least recently used readers until the budget is met. Caller holds the lock."""
+        for key in list(self._entries):
+            if self.resident_bytes <= self._max_bytes:
+                return
+            if key == keep:
+                continue
+            del self._entries[key]
+            self.evictions += 1
+            logger.info("Evicted reader %s to stay within memory budget", key)
+
+    def evict_idle(self, keep: Hashable = None) -> int:
+        """Drop readers idle for longer than the TTL.
+
+        Args:
+            keep: Key that must not be evicted (the one about to be used).
+
+        Returns:
+            Number of readers evicted.
+        """
+        if self._idle_ttl <= 0:
+            return 0
+        now = self._clock()
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key != keep and now - entry.last_used > self._idle_ttl
+            ]
+            for key in stale:
+                del self._entries[key]
+                logger.info("Evicted reader %s after being idle", key)
+            self.evictions += len(stale)
+        return len(stale)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every reader whose key matches ``predicate``.
+
+        Returns:
+            Number of readers dropped.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached reader."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def resident_bytes(self) -> int:
+        """Return the total estimated size of the cached readers."""
+        return sum(entry.size for entry in self._entries.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters, load time and resident size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "load_seconds": round(self.load_seconds, 3),
+                "resident_mb": round(self.resident_bytes / (1024 * 1024), 1),
+                "budget_mb": round(self._max_bytes / (1024 * 1024), 1),
+                "size": len(self._entries),
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
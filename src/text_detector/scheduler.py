@@ -0,0 +1,92 @@
+"""Time-based cadence for submitting live frames to OCR."""
+
+from text_detector.config import AppSettings
+
+
+class OCRScheduler:
+    """Decide when the next live frame should be submitted for OCR.
+
+    Submission is driven by time and engine load rather than a frame
+    count. With a full CPU budget, the next frame is handed over just
+    before the busy worker is expected to finish, one smoothed service
+    time after the last submission minus ``lead``. A fresh frame is then
+    waiting whenever the worker frees up, and at most one frame queues
+    behind the running one. A budget below 1.0 leaves the worker idle
+    after each run for a matching share of time. ``min_interval`` caps
+    the submission rate.
+    """
+
+    def __init__(
+        self,
+        cpu_budget: float = 1.0,
+        min_interval: float = 0.0,
+        lead: float = 0.033,
+        smoothing: float = 0.3,
+    ) -> None:
+        self.cpu_budget = cpu_budget
+        self.min_interval = min_interval
+        self.lead = lead
+        self.smoothing = smoothing
+        self.service_time: float | None = None
+        self._last_submit: float | None = None
+        self._next_allowed = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "OCRScheduler":
+        """Create a scheduler using the budget and interval in ``settings``."""
+        return cls(
+            cpu_budget=settings.ocr_cpu_budget / 100,
+            min_interval=settings.ocr_min_interval_ms / 1000,
+        )
+
+    def due(self, now: float, in_flight: int, capacity: int = 1) -> bool:
+        """Return True if a frame should be submitted now.
+
+        Args:
+            now: Monotonic timestamp in seconds.
+            in_flight: Requests queued or running in the engine.
+            capacity: Number of OCR workers.
+        """
+        if now < self._next_allowed:
+            return False
+        if self._last_submit is not None and now - self._last_submit < self.min_interval:
+            return False
+        if in_flight < capacity:
+            return True
+        if in_flight > capacity or self.cpu_budget < 1.0:
+            return False
+        if self.service_time is None or self._last_submit is None:
+            return False
+        # Every worker is busy: queue the next frame just before one finishes.
+        return now >= self._last_submit + self.service_time - self.lead
+
+    def submitted(self, now: float) -> None:
+        """Record that a frame was accepted by the engine at ``now``."""
+        self._last_submit = now
+
+    def skipped(self, now: float) -> None:
+        """Record an opportunity passed up (for example an unchanged scene).
+
+        The next opportunity comes one service time later, as if OCR had run.
+        """
+        wait = self.service_time if self.service_time is not None else self.lead
+        self._next_allowed = now + max(self.min_interval, wait / self.cpu_budget)
+
+    def completed(self, service_time: float, now: float) -> None:
+        """Record a finished OCR run that kept a worker busy for ``service_time``.
+
+        Args:
+            service_time: Seconds from the worker starting to finishing.
+            now: Monotonic timestamp of the completion.
+        """
+        if self.service_time is None:
+            self.service_time = service_time
+        else:
+            self.service_time += self.smoothing * (service_time - self.service_time)
+        idle = service_time * (1 / self.cpu_budget - 1)
+        self._next_allowed = max(self._next_allowed, now + idle)
+
+    def reset(self) -> None:
+        """Forget the last submission so the next opportunity runs OCR."""
+        self._last_submit = None
+        self._next_allowed = 0.0
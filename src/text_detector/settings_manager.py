@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from pathlib import Path
 
 from .config import AppSettings
@@ -11,10 +12,18 @@ from .config import AppSettings
 class SettingsManager:
     """Manages loading and saving application settings to a JSON file."""
 
-    def __init__(self, path: Path | None = None) -> None:
+    def __init__(self, path: Path | None = None, defaults: AppSettings | None = None) -> None:
+        """Create a manager for ``path``.
+
+        Args:
+            path: Settings file. Defaults to ``~/.config/text-detector/settings.json``.
+            defaults: Values used for anything the file does not set.
+                Defaults to ``AppSettings()``.
+        """
         if path is None:
             path = Path.home() / ".config" / "text-detector" / "settings.json"
         self._path = path
+        self._defaults = defaults or AppSettings()
 
     def save(self, settings: AppSettings) -> None:
         """Save settings to JSON file."""
@@ -24,9 +33,40 @@ class SettingsManager:
             "default_confidence": settings.default_confidence,
             "gpu_enabled": settings.gpu_enabled,
             "preprocess_enabled": settings.preprocess_enabled,
-            "frame_skip": settings.frame_skip,
+            "ocr_cpu_budget": settings.ocr_cpu_budget,
+            "ocr_min_interval_ms": settings.ocr_min_interval_ms,
             "ocr_max_width": settings.ocr_max_width,
+            "adaptive_ocr_width": settings.adaptive_ocr_width,
+            "ocr_min_width": settings.ocr_min_width,
+            "target_ocr_latency_ms": settings.target_ocr_latency_ms,
+            "adaptive_confidence_floor": settings.adaptive_confidence_floor,
             "paragraph_merge": settings.paragraph_merge,
+            "tiled_ocr": settings.tiled_ocr,
+            "ocr_tile_overlap": settings.ocr_tile_overlap,
+            "ocr_workers": settings.ocr_workers,
+            "ocr_pool_mode": settings.ocr_pool_mode,
+            "ocr_backend": settings.ocr_backend,
+            "onnx_model_dir": settings.onnx_model_dir,
+            "ocr_queue_mode": settings.ocr_queue_mode,
+            "ocr_deadline_ms": settings.ocr_deadline_ms,
+            "ocr_hang_timeout_ms": settings.ocr_hang_timeout_ms,
+            "metrics_file": settings.metrics_file,
+            "metrics_interval": settings.metrics_interval,
+            "capture_width": settings.capture_width,
+            "capture_height": settings.capture_height,
+            "capture_fps": settings.capture_fps,
+            "capture_fourcc": settings.capture_fourcc,
+            "torch_intra_op_threads": settings.torch_intra_op_threads,
+            "torch_inter_op_threads": settings.torch_inter_op_threads,
+            "opencv_threads": settings.opencv_threads,
+            "cpu_affinity": settings.cpu_affinity,
+            "motion_gate_enabled": settings.motion_gate_enabled,
+            "incremental_ocr": settings.incremental_ocr,
+            "box_tracking": settings.box_tracking,
+            "preload_models": settings.preload_models,
+            "preload_languages": settings.preload_languages,
+            "reader_cache_max_mb": settings.reader_cache_max_mb,
+            "reader_idle_ttl": settings.reader_idle_ttl,
         }
         with open(self._path, "w") as f:
             json.dump(data, f, indent=2)
@@ -34,25 +74,56 @@ class SettingsManager:
     def load(self) -> AppSettings:
         """Load settings from JSON file, return defaults if missing or corrupted."""
         if not self._path.exists():
-            return AppSettings()
+            return replace(self._defaults)
         try:
             with open(self._path) as f:
                 data = json.load(f)
             if not isinstance(data, dict):
-                return AppSettings()
+                return replace(self._defaults)
             valid_fields = {
                 "default_language",
                 "default_confidence",
                 "gpu_enabled",
                 "preprocess_enabled",
-                "frame_skip",
+                "ocr_cpu_budget",
+                "ocr_min_interval_ms",
                 "ocr_max_width",
+                "adaptive_ocr_width",
+                "ocr_min_width",
+                "target_ocr_latency_ms",
+                "adaptive_confidence_floor",
                 "paragraph_merge",
+                "tiled_ocr",
+                "ocr_tile_overlap",
+                "ocr_workers",
+                "ocr_pool_mode",
+                "ocr_backend",
+                "onnx_model_dir",
+                "ocr_queue_mode",
+                "ocr_deadline_ms",
+                "ocr_hang_timeout_ms",
+                "metrics_file",
+                "metrics_interval",
+                "capture_width",
+                "capture_height",
+                "capture_fps",
+                "capture_fourcc",
+                "torch_intra_op_threads",
+                "torch_inter_op_threads",
+                "opencv_threads",
+                "cpu_affinity",
+                "motion_gate_enabled",
+                "incremental_ocr",
+                "box_tracking",
+                "preload_models",
+                "preload_languages",
+                "reader_cache_max_mb",
+                "reader_idle_ttl",
             }
             filtered = {k: v for k, v in data.items() if k in valid_fields}
-            return AppSettings(**filtered)
+            return replace(self._defaults, **filtered)
         except (json.JSONDecodeError, TypeError, ValueError):
-            return AppSettings()
+            return replace(self._defaults)
 
     def reset(self) -> None:
         """Delete the settings file to reset to defaults."""
@@ -0,0 +1,90 @@
+"""Shared-memory frame slots for handing frames to OCR worker processes."""
+
+import contextlib
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Segment name, frame shape and dtype string; all a worker needs to map a frame.
+FrameHeader = tuple[str, tuple[int, ...], str]
+
+# Segments are sized in whole MiB so small changes in frame size reuse them.
+_SEGMENT_ALIGN = 1 << 20
+
+
+class FrameSlot:
+    """Parent side of a shared-memory buffer that carries one frame at a time.
+
+    :meth:`write` copies a frame into the segment and returns a small
+    header; the worker process maps the frame in place from it, so the
+    pixels are never pickled or sent through a pipe. The segment grows
+    when a larger frame arrives and is otherwise reused. A slot serves one
+    request at a time: the next frame must not be written before the
+    worker has answered for the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._shm: shared_memory.SharedMemory | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the capacity of the current segment in bytes, 0 before first use."""
+        return self._shm.size if self._shm is not None else 0
+
+    def write(self, frame: np.ndarray) -> FrameHeader:
+        """Copy ``frame`` into the segment, replacing it first if it is too small.
+
+        Args:
+            frame: Image array. It need not be contiguous (an ROI crop is fine).
+
+        Returns:
+            Header for :meth:`FrameReader.read` in the worker.
+        """
+        if self._shm is None or self._shm.size < frame.nbytes:
+            self.release()
+            size = max(_SEGMENT_ALIGN, -(-frame.nbytes // _SEGMENT_ALIGN) * _SEGMENT_ALIGN)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        view: np.ndarray = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._shm.buf)
+        np.copyto(view, frame)
+        return self._shm.name, tuple(frame.shape), frame.dtype.str
+
+    def release(self) -> None:
+        """Unmap and remove the segment. The slot can be written to again afterwards."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
+        self._shm = None
+
+
+class FrameReader:
+    """Worker side of a :class:`FrameSlot`: maps frames in place from headers.
+
+    The returned array is a view of shared memory and is overwritten by
+    the parent's next request, so it must not be kept past the request
+    it belongs to.
+    """
+
+    def __init__(self) -> None:
+        self._shm: shared_memory.SharedMemory | None = None
+
+    def read(self, header: FrameHeader) -> np.ndarray:
+        """Return the frame described by ``header`` without copying it.
+
+        Attaches to a new segment when the parent has replaced its slot.
+        """
+        name, shape, dtype = header
+        if self._shm is None or self._shm.name != name:
+            self.close()
+            self._shm = shared_memory.SharedMemory(name=name)
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._shm.buf)
+
+    def close(self) -> None:
+        """Unmap the current segment; the parent owns and removes it."""
+        if self._shm is None:
+            return
+        # A frame view still in use keeps the mapping; it goes with the process.
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+        self._shm = None
@@ -4,6 +4,7 @@ import contextlib
 import csv
 import json
 import threading
+import time
 import tkinter as tk
 from datetime import datetime
 from pathlib import Path
@@ -13,45 +14,96 @@ import cv2
 import numpy as np
 from PIL import Image, ImageTk
 
-from text_detector.config import SETTINGS, THEME
+from text_detector.capture import CaptureFormat, CaptureThread, open_camera
+from text_detector.config import SETTINGS, THEME, AppSettings
+from text_detector.frame_pool import ScratchBuffers
 from text_detector.image_processor import bgr_to_rgb, draw_boxes_with_colors
-from text_detector.ocr_engine import DetectionResult, OCREngine
+from text_detector.motion_gate import MotionGate
+from text_detector.ocr_engine import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_STREAMING,
+    DetectionResult,
+    OCREngine,
+)
+from text_detector.scheduler import OCRScheduler
 from text_detector.settings_manager import SettingsManager
+from text_detector.tracker import BoxTracker
 from text_detector.utils.logging_setup import get_logger
 from text_detector.utils.path_helpers import get_assets_dir
 from text_detector.widgets import StatusLED, ThemeableButton
 
 logger = get_logger("gui")
 
+# Period of the GUI frame tick that takes webcam frames from the capture thread.
+_FRAME_INTERVAL_MS = 33
+# The motion gate and box tracking look at one frame in this many ticks
+# (about 10 per second); the frames in between are grabbed but not decoded.
+_ANALYSIS_TICKS = 3
+# Defaults for settings the file does not set. Live video wants the newest
+# frame recognised, so a new frame replaces one still waiting for OCR.
+_GUI_DEFAULTS = AppSettings(ocr_queue_mode="latest")
+
 
 class TextRecognitionApp:
     """A GUI application for real-time text recognition using EasyOCR."""
 
     def __init__(self, main: tk.Tk) -> None:
-        self.cap: cv2.VideoCapture | None = None
+        self.capture: CaptureThread | None = None
         self.root = main
         self.root.title("Text Detection App")
         self.root.geometry("1200x720")
         self.root.resizable(True, True)
         self.root.configure(bg=THEME.background)
 
-        self._settings_manager = SettingsManager()
+        self._settings_manager = SettingsManager(defaults=_GUI_DEFAULTS)
         loaded = self._settings_manager.load()
         SETTINGS.default_language = loaded.default_language
         SETTINGS.default_confidence = loaded.default_confidence
         SETTINGS.gpu_enabled = loaded.gpu_enabled
         SETTINGS.preprocess_enabled = loaded.preprocess_enabled
-        SETTINGS.frame_skip = loaded.frame_skip
+        SETTINGS.ocr_cpu_budget = loaded.ocr_cpu_budget
+        SETTINGS.ocr_min_interval_ms = loaded.ocr_min_interval_ms
         SETTINGS.ocr_max_width = loaded.ocr_max_width
         SETTINGS.paragraph_merge = loaded.paragraph_merge
+        SETTINGS.ocr_workers = loaded.ocr_workers
+        SETTINGS.ocr_pool_mode = loaded.ocr_pool_mode
+        SETTINGS.ocr_backend = loaded.ocr_backend
+        SETTINGS.tiled_ocr = loaded.tiled_ocr
+        SETTINGS.adaptive_ocr_width = loaded.adaptive_ocr_width
+        SETTINGS.ocr_min_width = loaded.ocr_min_width
+        SETTINGS.target_ocr_latency_ms = loaded.target_ocr_latency_ms
+        SETTINGS.adaptive_confidence_floor = loaded.adaptive_confidence_floor
+        SETTINGS.ocr_tile_overlap = loaded.ocr_tile_overlap
+        SETTINGS.onnx_model_dir = loaded.onnx_model_dir
+        SETTINGS.ocr_queue_mode = loaded.ocr_queue_mode
+        SETTINGS.ocr_deadline_ms = loaded.ocr_deadline_ms
+        SETTINGS.ocr_hang_timeout_ms = loaded.ocr_hang_timeout_ms
+        SETTINGS.metrics_file = loaded.metrics_file
+        SETTINGS.metrics_interval = loaded.metrics_interval
+        SETTINGS.capture_width = loaded.capture_width
+        SETTINGS.capture_height = loaded.capture_height
+        SETTINGS.capture_fps = loaded.capture_fps
+        SETTINGS.capture_fourcc = loaded.capture_fourcc
+        SETTINGS.torch_intra_op_threads = loaded.torch_intra_op_threads
+        SETTINGS.torch_inter_op_threads = loaded.torch_inter_op_threads
+        SETTINGS.opencv_threads = loaded.opencv_threads
+        SETTINGS.cpu_affinity = loaded.cpu_affinity
+        SETTINGS.motion_gate_enabled = loaded.motion_gate_enabled
+        SETTINGS.incremental_ocr = loaded.incremental_ocr
+        SETTINGS.box_tracking = loaded.box_tracking
+        SETTINGS.preload_models = loaded.preload_models
+        SETTINGS.preload_languages = loaded.preload_languages
+        SETTINGS.reader_cache_max_mb = loaded.reader_cache_max_mb
+        SETTINGS.reader_idle_ttl = loaded.reader_idle_ttl
 
         self.capture_active = False
-        self.frame_counter = 0
         self.detected_text: list[tuple] = []
         self.current_frame: np.ndarray | None = None
+        self._frame_time: float | None = None
+        self._ticks_since_request = _ANALYSIS_TICKS
         self.language_var = tk.StringVar(value=SETTINGS.default_language)
         self.threshold_var = tk.DoubleVar(value=SETTINGS.default_confidence)
-        self.frame_skip_var = tk.IntVar(value=SETTINGS.frame_skip)
+        self.cpu_budget_var = tk.IntVar(value=SETTINGS.ocr_cpu_budget)
         self.gpu_var = tk.BooleanVar(value=SETTINGS.gpu_enabled)
         self.preprocess_var = tk.BooleanVar(value=SETTINGS.preprocess_enabled)
         self.history: list[dict[str, str | float]] = []
@@ -61,14 +113,23 @@ class TextRecognitionApp:
         self._roi_start: tuple[int, int] | None = None
 
         self.engine = OCREngine(SETTINGS)
+        self.motion_gate = MotionGate.from_settings(SETTINGS)
+        self.ocr_scheduler = OCRScheduler.from_settings(SETTINGS)
+        self.box_tracker = BoxTracker()
+        # Annotation and display draw into reused scratch arrays.
+        self._scratch = ScratchBuffers()
         self.ocr_result: DetectionResult | None = None
+        self._ocr_source: np.ndarray | None = None
         self.ocr_lock = threading.Lock()
+        self._loading_poll: str | None = None
+        self._still_retry: str | None = None
 
         self._create_widgets()
         self._configure_icon()
         self._bind_keyboard_shortcuts()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self._poll_model_loading()
         self.update_frame()
 
     # ── Initialisation ──────────────────────────────────────────────
@@ -129,7 +190,7 @@ class TextRecognitionApp:
         self._create_sidebar_section_label("Settings")
         self._create_language_selector()
         self._create_threshold_slider()
-        self._create_frame_skip_slider()
+        self._create_cpu_budget_slider()
         self._create_gpu_toggle()
 
     def _create_sidebar_title(self) -> None:
@@ -359,33 +420,33 @@ class TextRecognitionApp:
         )
         self.threshold_scale.pack(fill="x", padx=4)
 
-    def _create_frame_skip_slider(self) -> None:
+    def _create_cpu_budget_slider(self) -> None:
         frame = tk.Frame(self.sidebar, bg=THEME.surface)
         frame.pack(fill="x", pady=6)
 
         tk.Label(
             frame,
-            text="OCR Frequency",
+            text="OCR CPU Budget",
             font=("Arial", 9),
             bg=THEME.surface,
             fg=THEME.text_muted,
         ).pack(side="left", padx=(4, 0))
 
-        self.frame_skip_label = tk.Label(
+        self.cpu_budget_label = tk.Label(
             frame,
-            text=f"Every {SETTINGS.frame_skip} frames",
+            text=f"{SETTINGS.ocr_cpu_budget}%",
             font=("Arial", 9, "bold"),
             bg=THEME.surface,
             fg=THEME.accent,
         )
-        self.frame_skip_label.pack(side="right", padx=(4, 4))
+        self.cpu_budget_label.pack(side="right", padx=(4, 4))
 
-        self.frame_skip_scale = tk.Scale(
+        self.cpu_budget_scale = tk.Scale(
             frame,
-            variable=self.frame_skip_var,
-            from_=1,
-            to=60,
-            resolution=1,
+            variable=self.cpu_budget_var,
+            from_=10,
+            to=100,
+            resolution=10,
             orient="horizontal",
             length=160,
             bg=THEME.surface,
@@ -395,9 +456,9 @@ class TextRecognitionApp:
             troughcolor=THEME.surface_light,
             sliderrelief="flat",
             borderwidth=0,
-            command=self._frame_skip_changed,
+            command=self._cpu_budget_changed,
         )
-        self.frame_skip_scale.pack(fill="x", padx=4)
+        self.cpu_budget_scale.pack(fill="x", padx=4)
 
     def _create_gpu_toggle(self) -> None:
         frame = tk.Frame(self.sidebar, bg=THEME.surface)
@@ -668,6 +729,12 @@ class TextRecognitionApp:
         )
         self.fps_label.pack(side="right", padx=10, pady=4)
 
+        self.model_progress = ttk.Progressbar(
+            self.status_frame,
+            mode="determinate",
+            length=120,
+        )
+
     # ── Keyboard shortcuts ──────────────────────────────────────────
 
     def _bind_keyboard_shortcuts(self) -> None:
@@ -701,7 +768,7 @@ class TextRecognitionApp:
         """Persist current settings to disk."""
         SETTINGS.default_language = self.language_var.get()
         SETTINGS.default_confidence = self.threshold_var.get()
-        SETTINGS.frame_skip = self.frame_skip_var.get()
+        SETTINGS.ocr_cpu_budget = self.cpu_budget_var.get()
         SETTINGS.gpu_enabled = self.gpu_var.get()
         SETTINGS.preprocess_enabled = self.preprocess_var.get()
         self._settings_manager.save(SETTINGS)
@@ -709,27 +776,28 @@ class TextRecognitionApp:
     def _language_changed(self, value: str) -> None:
         self.language_var.set(value)
         self.current_language = value
-        self.engine.clear_cache()
         self._set_status(f"Language: {value}", THEME.accent)
         logger.info("Language changed to %s", value)
         self._save_settings()
+        self._preload_language(value)
 
     def _threshold_changed(self, value: str) -> None:
         self.threshold_label.config(text=f"{float(value):.2f}")
         self._save_settings()
 
-    def _frame_skip_changed(self, value: str) -> None:
-        skip = int(float(value))
-        self.frame_skip_label.config(text=f"Every {skip} frames")
+    def _cpu_budget_changed(self, value: str) -> None:
+        budget = int(float(value))
+        self.cpu_budget_label.config(text=f"{budget}%")
+        self.ocr_scheduler.cpu_budget = budget / 100
         self._save_settings()
 
     def _gpu_changed(self) -> None:
-        self.engine.clear_cache()
         self.engine._settings.gpu_enabled = self.gpu_var.get()
         status = "enabled" if self.gpu_var.get() else "disabled"
         self._set_status(f"GPU {status}", THEME.accent)
         logger.info("GPU %s", status)
         self._save_settings()
+        self._preload_language(self.current_language)
 
     def _preprocess_changed(self) -> None:
         self.engine._settings.preprocess_enabled = self.preprocess_var.get()
@@ -746,28 +814,68 @@ class TextRecognitionApp:
         SETTINGS.default_confidence = defaults.default_confidence
         SETTINGS.gpu_enabled = defaults.gpu_enabled
         SETTINGS.preprocess_enabled = defaults.preprocess_enabled
-        SETTINGS.frame_skip = defaults.frame_skip
+        SETTINGS.ocr_cpu_budget = defaults.ocr_cpu_budget
+        SETTINGS.ocr_min_interval_ms = defaults.ocr_min_interval_ms
         SETTINGS.ocr_max_width = defaults.ocr_max_width
         SETTINGS.paragraph_merge = defaults.paragraph_merge
+        SETTINGS.ocr_workers = defaults.ocr_workers
+        SETTINGS.ocr_pool_mode = defaults.ocr_pool_mode
+        SETTINGS.ocr_backend = defaults.ocr_backend
+        SETTINGS.tiled_ocr = defaults.tiled_ocr
+        SETTINGS.adaptive_ocr_width = defaults.adaptive_ocr_width
+        SETTINGS.ocr_min_width = defaults.ocr_min_width
+        SETTINGS.target_ocr_latency_ms = defaults.target_ocr_latency_ms
+        SETTINGS.adaptive_confidence_floor = defaults.adaptive_confidence_floor
+        SETTINGS.ocr_tile_overlap = defaults.ocr_tile_overlap
+        SETTINGS.onnx_model_dir = defaults.onnx_model_dir
+        SETTINGS.ocr_queue_mode = defaults.ocr_queue_mode
+        SETTINGS.ocr_deadline_ms = defaults.ocr_deadline_ms
+        SETTINGS.ocr_hang_timeout_ms = defaults.ocr_hang_timeout_ms
+        SETTINGS.metrics_file = defaults.metrics_file
+        SETTINGS.metrics_interval = defaults.metrics_interval
+        SETTINGS.capture_width = defaults.capture_width
+        SETTINGS.capture_height = defaults.capture_height
+        SETTINGS.capture_fps = defaults.capture_fps
+        SETTINGS.capture_fourcc = defaults.capture_fourcc
+        SETTINGS.torch_intra_op_threads = defaults.torch_intra_op_threads
+        SETTINGS.torch_inter_op_threads = defaults.torch_inter_op_threads
+        SETTINGS.opencv_threads = defaults.opencv_threads
+        SETTINGS.cpu_affinity = defaults.cpu_affinity
+        SETTINGS.motion_gate_enabled = defaults.motion_gate_enabled
+        SETTINGS.incremental_ocr = defaults.incremental_ocr
+        SETTINGS.box_tracking = defaults.box_tracking
+        SETTINGS.preload_models = defaults.preload_models
+        SETTINGS.preload_languages = defaults.preload_languages
+        SETTINGS.reader_cache_max_mb = defaults.reader_cache_max_mb
+        SETTINGS.reader_idle_ttl = defaults.reader_idle_ttl
         self.language_var.set(SETTINGS.default_language)
         self.threshold_var.set(SETTINGS.default_confidence)
         self.gpu_var.set(SETTINGS.gpu_enabled)
         self.preprocess_var.set(SETTINGS.preprocess_enabled)
         self.current_language = SETTINGS.default_language
         self.threshold_label.config(text=f"{SETTINGS.default_confidence:.2f}")
+        self.cpu_budget_var.set(SETTINGS.ocr_cpu_budget)
+        self.cpu_budget_label.config(text=f"{SETTINGS.ocr_cpu_budget}%")
+        self.ocr_scheduler = OCRScheduler.from_settings(SETTINGS)
+        self.engine.shutdown()
         self.engine = OCREngine(SETTINGS)
         self._set_status("Settings reset to defaults", THEME.neutral)
         logger.info("Settings reset to defaults")
+        self._poll_model_loading()
 
     def start_capture(self) -> None:
         if self.capture_active:
             return
         self.capture_active = True
-        self.frame_counter = 0
+        self.motion_gate.reset()
+        self.ocr_scheduler.reset()
+        self.box_tracker.clear()
         try:
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap or not self.cap.isOpened():
+            cap = open_camera(0, CaptureFormat.from_settings(SETTINGS))
+            if not cap or not cap.isOpened():
                 raise RuntimeError("Unable to open webcam.")
+            self.capture = CaptureThread(cap)
+            self.capture.start()
             self._set_status("Webcam active", THEME.status_ready)
             self.status_led.set_color(THEME.status_ready)
             logger.info("Webcam capture started")
@@ -779,9 +887,11 @@ class TextRecognitionApp:
             logger.error("Webcam error: %s", exc)
 
     def stop_capture(self) -> None:
-        if self.cap is not None:
-            self.cap.release()
-            self.cap = None
+        if self.capture is not None:
+            self.capture.stop()
+            self.capture = None
+            if SETTINGS.motion_gate_enabled:
+                logger.info("Motion gate saved %d OCR runs", self.motion_gate.saved)
         self.capture_active = False
         self._set_status("Capture stopped", THEME.status_error)
         self.status_led.set_color(THEME.status_ready)
@@ -807,60 +917,189 @@ class TextRecognitionApp:
         self.status_led.set_color(THEME.status_ready)
         logger.info("Loaded image: %s", path)
 
-    def _process_current_frame(self) -> None:
+    def _process_current_frame(self) -> bool:
+        """Submit the current frame for OCR.
+
+        Webcam frames the engine cannot take are dropped, since a newer one
+        follows shortly. A still image is retried until its model is loaded
+        and a worker can take it.
+
+        Returns:
+            True if the frame was queued.
+        """
         frame = self._get_cropped_frame()
         if frame is None:
-            return
+            return False
 
-        if self.engine.is_busy:
-            return
+        source = self.current_frame
+        streaming = self.capture_active
+        captured_at = self._frame_time if streaming else None
+        # A webcam frame not picked up in time is stale; a still image always waits.
+        deadline = SETTINGS.ocr_deadline_ms / 1000 if streaming else None
+        languages = [self.current_language]
 
         def _on_result(result: DetectionResult) -> None:
+            if streaming and not self.capture_active:
+                # A webcam frame that finished after a still image was loaded.
+                return
             with self.ocr_lock:
                 self.ocr_result = result
+                self._ocr_source = source
             self.root.after(0, self._apply_ocr_result)
 
-        queued = self.engine.detect_text_async(
-            frame,
-            languages=[self.current_language],
-            threshold=self.threshold_var.get(),
-            callback=_on_result,
-        )
+        if streaming:
+            refused = self._engine_saturated()
+        else:
+            # Submitting a still image now would be dropped by the engine's loading
+            # gate. Otherwise it evicts waiting webcam frames, so only a queue full
+            # of other still images holds it back.
+            model_loading = self.engine.is_loading and not self.engine.is_ready(languages)
+            refused = model_loading or not self.engine.has_room(PRIORITY_INTERACTIVE)
+        if refused:
+            queued = False
+        else:
+            if streaming and source is not None:
+                # The capture buffer is read into again once the next frame
+                # replaces it, so OCR and the tracker get a copy of their own.
+                source = source.copy()
+                frame = self._crop_to_roi(source)
+            queued = self.engine.detect_text_async(
+                frame,
+                languages=languages,
+                threshold=self.threshold_var.get(),
+                callback=_on_result,
+                captured_at=captured_at,
+                reuse_similar=streaming,
+                deadline=deadline or None,
+                priority=PRIORITY_STREAMING if streaming else PRIORITY_INTERACTIVE,
+            )
         if queued:
             self._set_status("Processing...", THEME.status_busy)
             self.status_led.set_color(THEME.status_busy)
+        elif not streaming:
+            self._defer_still_frame()
+        return queued
+
+    def _defer_still_frame(self) -> None:
+        """Retry the current still image shortly instead of dropping it."""
+        if self._still_retry is not None:
+            self.root.after_cancel(self._still_retry)
+        if not self.engine.is_loading:
+            # While a model loads, _poll_model_loading shows the wait with progress.
+            self._set_status("Waiting for OCR worker...", THEME.status_busy)
+            self.status_led.set_color(THEME.status_busy)
+        self._still_retry = self.root.after(200, self._retry_still_frame)
+
+    def _retry_still_frame(self) -> None:
+        self._still_retry = None
+        if not self.capture_active and self.current_frame is not None:
+            self._process_current_frame()
 
     def _apply_ocr_result(self) -> None:
+        with self.ocr_lock:
+            service_time = self.ocr_result.service_time if self.ocr_result is not None else None
+        if self.capture_active and service_time is not None:
+            self.ocr_scheduler.completed(service_time, time.monotonic())
+            # A worker just freed up; hand it the newest frame without waiting a tick.
+            self._schedule_ocr()
         with self.ocr_lock:
             if self.ocr_result is None or not self.ocr_result.success:
                 self._set_status("OCR failed", THEME.status_error)
                 self.status_led.set_color(THEME.status_error)
                 return
             self.detected_text = self.ocr_result.detections
+            source = self._ocr_source
 
         if self.current_frame is None:
             return
-        frame = draw_boxes_with_colors(self.current_frame.copy(), self.detected_text)
-        self._show_image(frame)
+        boxes = self.detected_text
+        if SETTINGS.box_tracking and self.capture_active and source is not None:
+            # The result describes an older frame; carry it onto the current one.
+            self.box_tracker.reset(source, self.detected_text)
+            boxes = self.box_tracker.update(self.current_frame)
+        self._show_image(self._annotate(self.current_frame, boxes))
         self._update_text_output()
         self._add_to_history()
         self._set_status("Detection complete", THEME.status_ready)
         self.status_led.set_color(THEME.status_ready)
 
     def update_frame(self) -> None:
-        if self.capture_active and self.cap is not None and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                self.current_frame = frame
-                self.frame_counter += 1
-                if self.frame_counter % SETTINGS.frame_skip == 0:
-                    self._show_image(frame)
-                    self._process_current_frame()
-        self.root.after(33, self.update_frame)
+        if self.capture_active and self.capture is not None:
+            latest = self.capture.latest()
+            if latest is not None:
+                frame, self._frame_time = latest
+                previous, self.current_frame = self.current_frame, frame
+                if previous is not None:
+                    # OCR works on its own copy, so nothing else holds it.
+                    self.capture.release(previous)
+                if SETTINGS.motion_gate_enabled:
+                    self.motion_gate.update(frame)
+                tracking = SETTINGS.box_tracking and self.box_tracker.active
+                if tracking:
+                    self._show_image(self._annotate(frame, self.box_tracker.update(frame)))
+                self._schedule_ocr(show_frame=not tracking)
+            if self._wants_next_frame():
+                self.capture.request_frame()
+                self._ticks_since_request = 0
+            else:
+                self._ticks_since_request += 1
+        self.root.after(_FRAME_INTERVAL_MS, self.update_frame)
+
+    def _wants_next_frame(self) -> bool:
+        """Return True if the next webcam frame will be used and is worth decoding.
+
+        A frame is always decoded when OCR is due. The motion gate and box
+        tracking also get one every ``_ANALYSIS_TICKS`` ticks; any other
+        frame is grabbed from the camera but never decoded.
+        """
+        next_tick = time.monotonic() + _FRAME_INTERVAL_MS / 1000
+        if self.ocr_scheduler.due(next_tick, self.engine.in_flight, self.engine.num_workers):
+            return True
+        tracking = SETTINGS.box_tracking and self.box_tracker.active
+        watching = SETTINGS.motion_gate_enabled or tracking
+        return watching and self._ticks_since_request + 1 >= _ANALYSIS_TICKS
+
+    def _schedule_ocr(self, show_frame: bool = False) -> None:
+        """Submit the current webcam frame when the scheduler says a worker is about to free up."""
+        now = time.monotonic()
+        if not self.ocr_scheduler.due(now, self.engine.in_flight, self.engine.num_workers):
+            return
+        if show_frame and self.current_frame is not None:
+            self._show_image(self.current_frame)
+        if self._should_run_ocr() and self._process_current_frame():
+            self.ocr_scheduler.submitted(now)
+            if SETTINGS.motion_gate_enabled:
+                # Only a submitted frame consumes the scene change.
+                self.motion_gate.mark_run()
+        else:
+            self.ocr_scheduler.skipped(now)
+        self._update_stats_label()
+
+    def _should_run_ocr(self) -> bool:
+        """Ask the motion gate whether the scene warrants a new OCR run."""
+        if not SETTINGS.motion_gate_enabled:
+            return True
+        if self._engine_saturated():
+            return False
+        return self.motion_gate.should_run()
+
+    def _engine_saturated(self) -> bool:
+        """Return True if a new frame would be dropped rather than replace a waiting one."""
+        return self.engine.is_busy and SETTINGS.ocr_queue_mode != "latest"
+
+    def _annotate(self, frame: np.ndarray, boxes: list) -> np.ndarray:
+        """Draw ``boxes`` on a scratch copy of ``frame``, valid until the next call."""
+        scratch = self._scratch.get("annotated", frame.shape, frame.dtype)
+        return draw_boxes_with_colors(frame, boxes, out=scratch)
 
     def _show_image(self, frame: np.ndarray) -> None:
-        image = bgr_to_rgb(frame)
+        image = bgr_to_rgb(frame, out=self._scratch.get("rgb", frame.shape, frame.dtype))
         pil_image = Image.fromarray(image)
+        tk_image = getattr(self.image_label, "image", None)
+        if tk_image is not None and (tk_image.width(), tk_image.height()) == pil_image.size:
+            # Same size as the frame on screen: update the Tk image in place.
+            tk_image.paste(pil_image)
+            return
         tk_image = ImageTk.PhotoImage(pil_image)
         self.image_label.config(image=tk_image, text="")
         self.image_label.image = tk_image  # type: ignore[attr-defined]
@@ -985,7 +1224,9 @@ class TextRecognitionApp:
         self.current_frame = None
         self.detected_text = []
         self.ocr_result = None
+        self.box_tracker.clear()
         self.image_label.config(image="", text="No image loaded")  # type: ignore[arg-type]
+        self.image_label.image = None  # type: ignore[attr-defined]
         self.text_output.config(state="normal")
         self.text_output.delete("1.0", tk.END)
         self.text_output.insert(tk.END, "Ready. Load an image or start the webcam.")
@@ -1006,8 +1247,8 @@ class TextRecognitionApp:
     def on_closing(self) -> None:
         self._save_settings()
         self.capture_active = False
-        if self.cap is not None:
-            self.cap.release()
+        if self.capture is not None:
+            self.capture.stop()
         self.engine.shutdown()
         self.root.destroy()
         logger.info("Application closed")
@@ -1060,12 +1301,57 @@ class TextRecognitionApp:
     def _get_cropped_frame(self) -> np.ndarray | None:
         if self.current_frame is None:
             return None
+        return self._crop_to_roi(self.current_frame)
+
+    def _crop_to_roi(self, frame: np.ndarray) -> np.ndarray:
         if self.roi:
             x1, y1, x2, y2 = self.roi
-            return self.current_frame[y1:y2, x1:x2]
-        return self.current_frame
+            return frame[y1:y2, x1:x2]
+        return frame
 
     # ── Helpers ─────────────────────────────────────────────────────
 
+    def _preload_language(self, language: str) -> None:
+        """Start loading the model for ``language`` before the next frame needs it."""
+        if not SETTINGS.preload_models:
+            return
+        self.engine.preload([[language]])
+        self._poll_model_loading()
+
+    def _poll_model_loading(self) -> None:
+        """Show model preloading progress in the status bar until it finishes."""
+        if self._loading_poll is not None:
+            self.root.after_cancel(self._loading_poll)
+            self._loading_poll = None
+        done, total = self.engine.preload_progress
+        if self.engine.is_loading:
+            self.model_progress.config(maximum=total, value=done)
+            if not self.model_progress.winfo_manager():
+                self.model_progress.pack(side="right", padx=6, pady=4)
+            action = "Waiting for" if self._still_retry is not None else "Loading"
+            self._set_status(f"{action} OCR model ({done}/{total})...", THEME.status_busy)
+            self.status_led.set_color(THEME.status_busy)
+            self._loading_poll = self.root.after(200, self._poll_model_loading)
+        elif self.model_progress.winfo_manager():
+            self.model_progress.pack_forget()
+            self._set_status("OCR model ready", THEME.status_ready)
+            self.status_led.set_color(THEME.status_ready)
+
     def _set_status(self, text: str, bg_color: str) -> None:
         self.status_label.config(text=text, fg=bg_color)
+
+    def _update_stats_label(self) -> None:
+        parts = []
+        if SETTINGS.motion_gate_enabled:
+            parts.append(f"OCR runs saved: {self.motion_gate.saved}")
+        latency = self.ocr_result.latency if self.ocr_result is not None else None
+        if latency is not None:
+            parts.append(f"Latency: {latency * 1000:.0f} ms")
+        stats = self.engine.stats()
+        adaptive = stats.get("adaptive_width")
+        if adaptive is not None and adaptive["latency_ms"] is not None:
+            parts.append(f"OCR: {adaptive['latency_ms']:.0f} ms @ {adaptive['width']} px")
+        timeouts = stats["timeouts"]
+        if timeouts["expired"] or timeouts["hung"]:
+            parts.append(f"Timeouts: {timeouts['expired'] + timeouts['hung']}")
+        self.fps_label.config(text="  ·  ".join(parts))
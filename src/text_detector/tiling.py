@@ -0,0 +1,84 @@
+"""Overlapping tiles for full-resolution OCR of large images."""
+
+import numpy as np
+
+Detection = tuple[list[list[float]], str, float]
+ROI = tuple[int, int, int, int]
+
+# Two boxes are the same text when this much of the smaller one lies inside the other.
+DUPLICATE_OVERLAP = 0.5
+
+
+def _tile_starts(length: int, size: int, step: int) -> list[int]:
+    """Return tile offsets along one axis; the last tile ends flush with the edge."""
+    if length <= size:
+        return [0]
+    starts = list(range(0, length - size, step))
+    starts.append(length - size)
+    return starts
+
+
+def tile_grid(height: int, width: int, tile_size: int, overlap: int) -> list[ROI]:
+    """Split an image into overlapping square tiles.
+
+    Neighbouring tiles share ``overlap`` pixels, so any text line shorter
+    than the overlap lies wholly inside at least one tile. Edge tiles are
+    shifted inwards rather than cropped, so every tile is full size unless
+    the image itself is smaller.
+
+    Args:
+        height: Image height in pixels.
+        width: Image width in pixels.
+        tile_size: Tile edge length in pixels.
+        overlap: Pixels shared by neighbouring tiles (less than ``tile_size``).
+
+    Returns:
+        (x1, y1, x2, y2) tile rectangles in row-major order.
+    """
+    step = max(1, tile_size - overlap)
+    return [
+        (x, y, min(x + tile_size, width), min(y + tile_size, height))
+        for y in _tile_starts(height, tile_size, step)
+        for x in _tile_starts(width, tile_size, step)
+    ]
+
+
+def suppress_duplicates(
+    detections: list[Detection],
+    overlap_threshold: float = DUPLICATE_OVERLAP,
+) -> list[Detection]:
+    """Drop detections repeated across tile seams with vectorized NMS.
+
+    Boxes are compared by their axis-aligned bounds. Overlap is measured
+    against the smaller box, because a word cut by a tile edge yields a
+    fragment lying inside the full word seen by the neighbouring tile.
+    Larger boxes win (then higher confidence), so the complete word is
+    kept rather than the fragment.
+
+    Args:
+        detections: (bbox, text, confidence) tuples in full-frame coordinates.
+        overlap_threshold: Fraction of the smaller box that must be covered
+            for it to count as a duplicate.
+
+    Returns:
+        Surviving detections in their original order.
+    """
+    if len(detections) < 2:
+        return detections
+
+    points = np.array([bbox for bbox, _text, _conf in detections], dtype=np.float32)
+    confidence = np.array([conf for _bbox, _text, conf in detections], dtype=np.float32)
+    x1, y1 = points[:, :, 0].min(axis=1), points[:, :, 1].min(axis=1)
+    x2, y2 = points[:, :, 0].max(axis=1), points[:, :, 1].max(axis=1)
+    areas = np.maximum(x2 - x1, 1e-3) * np.maximum(y2 - y1, 1e-3)
+
+    order = np.lexsort((-confidence, -areas))
+    keep = []
+    while order.size:
+        best, rest = order[0], order[1:]
+        keep.append(best)
+        width = np.clip(np.minimum(x2[best], x2[rest]) - np.maximum(x1[best], x1[rest]), 0, None)
+        height = np.clip(np.minimum(y2[best], y2[rest]) - np.maximum(y1[best], y1[rest]), 0, None)
+        overlap = width * height / np.minimum(areas[best], areas[rest])
+        order = rest[overlap <= overlap_threshold]
+    return [detections[i] for i in sorted(keep)]
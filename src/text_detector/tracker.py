@@ -0,0 +1,119 @@
+"""Lightweight tracking of OCR boxes between recognition runs."""
+
+import cv2
+import numpy as np
+
+Detection = tuple[list[list[float]], str, float]
+
+
+class BoxTracker:
+    """Carry OCR boxes across frames with sparse Lucas-Kanade optical flow.
+
+    :meth:`reset` picks up to ``max_points`` corner features inside each
+    box on the frame the OCR ran on. :meth:`update` follows those points
+    into a new frame and shifts every box by the median motion of its
+    surviving points. Work happens on a grayscale copy at most
+    ``max_width`` pixels wide, so a frame costs about a millisecond.
+    """
+
+    def __init__(self, max_width: int = 320, max_points: int = 20) -> None:
+        self._max_width = max_width
+        self._max_points = max_points
+        self._previous: np.ndarray | None = None
+        self._scale = 1.0
+        self._detections: list[Detection] = []
+        self._points = np.empty((0, 1, 2), dtype=np.float32)
+        self._owners = np.empty(0, dtype=np.int32)
+
+    @property
+    def active(self) -> bool:
+        """Return True while there are boxes to track."""
+        return bool(self._detections)
+
+    def clear(self) -> None:
+        """Stop tracking."""
+        self._previous = None
+        self._detections = []
+        self._points = np.empty((0, 1, 2), dtype=np.float32)
+        self._owners = np.empty(0, dtype=np.int32)
+
+    def _prepare(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        width = gray.shape[1]
+        self._scale = min(1.0, self._max_width / width)
+        if self._scale == 1.0:
+            return gray
+        height = max(1, round(gray.shape[0] * self._scale))
+        return cv2.resize(gray, (self._max_width, height), interpolation=cv2.INTER_AREA)
+
+    def reset(self, frame: np.ndarray, detections: list[Detection]) -> None:
+        """Start tracking ``detections``, which were found on ``frame``.
+
+        Args:
+            frame: The frame the OCR result belongs to.
+            detections: List of (bbox, text, confidence) tuples.
+        """
+        gray = self._prepare(frame)
+        points = []
+        owners = []
+        for index, (bbox, _text, _confidence) in enumerate(detections):
+            polygon = (np.array(bbox, dtype=np.float32) * self._scale).astype(np.int32)
+            mask = np.zeros(gray.shape, dtype=np.uint8)
+            cv2.fillPoly(mask, [polygon], 255)
+            features = cv2.goodFeaturesToTrack(
+                gray, self._max_points, qualityLevel=0.01, minDistance=3, mask=mask
+            )
+            if features is None:
+                features = polygon.astype(np.float32).reshape(-1, 1, 2)
+            points.append(features)
+            owners.extend([index] * len(features))
+
+        self._previous = gray
+        self._detections = list(detections)
+        if points:
+            self._points = np.concatenate(points).astype(np.float32)
+            self._owners = np.array(owners, dtype=np.int32)
+        else:
+            self._points = np.empty((0, 1, 2), dtype=np.float32)
+            self._owners = np.empty(0, dtype=np.int32)
+
+    def update(self, frame: np.ndarray) -> list[Detection]:
+        """Move the tracked boxes onto ``frame``.
+
+        Args:
+            frame: The newest captured frame (same size as the reset frame).
+
+        Returns:
+            The tracked detections with translated bounding boxes.
+        """
+        if self._previous is None or not len(self._points):
+            return self._detections
+
+        gray = self._prepare(frame)
+        if gray.shape != self._previous.shape:
+            return self._detections
+
+        moved, status, _err = cv2.calcOpticalFlowPyrLK(
+            self._previous,
+            gray,
+            self._points,
+            np.empty_like(self._points),
+            winSize=(15, 15),
+            maxLevel=2,
+        )
+        good = status.reshape(-1) == 1
+        shifts = (moved - self._points).reshape(-1, 2) / self._scale
+
+        tracked = []
+        for index, (bbox, text, confidence) in enumerate(self._detections):
+            mine = good & (self._owners == index)
+            if mine.any():
+                dx, dy = np.median(shifts[mine], axis=0)
+                bbox = [[pt[0] + float(dx), pt[1] + float(dy)] for pt in bbox]
+            tracked.append((bbox, text, confidence))
+
+        self._previous = gray
+        self._detections = tracked
+        self._points = moved[good].reshape(-1, 1, 2)
+        self._owners = self._owners[good]
+        return tracked
@@ -0,0 +1,116 @@
+"""Bounded work queue that serves priority classes in order."""
+
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class PriorityWorkQueue(Generic[T]):
+    """Bounded queue holding one FIFO per priority class.
+
+    :meth:`get` always takes the oldest item of the most important class
+    that has any, so later high-priority items overtake waiting ones of a
+    lower class. ``maxsize`` bounds all classes together. It mirrors the
+    ``queue.Queue`` methods the OCR engine uses, raising ``queue.Full``
+    and ``queue.Empty`` the same way, and adds :meth:`pop_oldest` to
+    evict a waiting item of a given class.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        priorities: Sequence[str],
+        priority_of: Callable[[T], str],
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            maxsize: Most items waiting at once, across all classes.
+            priorities: Class names, most important first.
+            priority_of: Returns the class of an item.
+        """
+        self.maxsize = maxsize
+        self._priority_of = priority_of
+        self._queues: dict[str, deque[T]] = {name: deque() for name in priorities}
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._all_done = threading.Condition(self._mutex)
+        self._unfinished = 0
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self._queues.values())
+
+    def put_nowait(self, item: T) -> None:
+        """Queue ``item`` at the back of its class.
+
+        Raises:
+            queue.Full: If ``maxsize`` items are already waiting.
+        """
+        with self._mutex:
+            if self._size() >= self.maxsize:
+                raise queue.Full
+            self._queues[self._priority_of(item)].append(item)
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def get(self, timeout: float | None = None) -> T:
+        """Remove and return the oldest item of the most important waiting class.
+
+        Args:
+            timeout: Seconds to wait for an item. None waits forever.
+
+        Raises:
+            queue.Empty: If nothing arrived within ``timeout``.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            while True:
+                for items in self._queues.values():
+                    if items:
+                        return items.popleft()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+
+    def get_nowait(self) -> T:
+        """Like :meth:`get`, but raise ``queue.Empty`` at once if nothing waits."""
+        return self.get(timeout=0)
+
+    def pop_oldest(self, priority: str) -> T | None:
+        """Remove and return the oldest waiting item of ``priority``, or None."""
+        with self._mutex:
+            items = self._queues[priority]
+            return items.popleft() if items else None
+
+    def task_done(self) -> None:
+        """Mark an item taken from the queue as fully processed."""
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished -= 1
+            if not self._unfinished:
+                self._all_done.notify_all()
+
+    def join(self) -> None:
+        """Block until every queued item has been marked done."""
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def qsize(self, priority: str | None = None) -> int:
+        """Return the number of waiting items, of one class or of all."""
+        with self._mutex:
+            if priority is not None:
+                return len(self._queues[priority])
+            return self._size()
+
+    def full(self) -> bool:
+        """Return True if ``maxsize`` items are waiting."""
+        with self._mutex:
+            return self._size() >= self.maxsize